@@ -1,41 +1,55 @@
+import hashlib
+from collections import OrderedDict
+
 import pandas as pd
-from sklearn.preprocessing import StandardScaler
-from sklearn.model_selection import train_test_split
 import numpy as np
 
+from function.aggregate import grouped_stats, stat_column
+from function.instrument import instrumented
+
 class Add_Dam():
-    def _prepare_date_columns(self, water_df, dam_df):
-        """데이터 복사 및 날짜 형식 변환"""
-        water_df = water_df.copy()
+    # 수질 데이터 월별 집계 대상 컬럼
+    WATER_COLUMNS = [
+        '수온', '수소이온농도(ph)', '전기전도도(EC)', '용존산소(DO)', 'BOD', 'COD',
+        '유량', '총질소(T-N)', '총유기탄소(TOC)', '총인(T-P)', '부유물질', '클로로필-a'
+    ]
+    
+    # 최종 결과 컬럼 순서 (마지막 컬럼이 Target)
+    DEFAULT_ORDER = ['일자', '수온', '수소이온농도(ph)', '전기전도도(EC)', '용존산소(DO)', 
+                     'BOD', 'COD', '총질소(T-N)', '유량', '총유기탄소(TOC)', '총인(T-P)', 
+                     '부유물질', '하굿둑방류량_평균', '하굿둑강수량_평균', '클로로필-a']
+    
+    # 병합에 사용하는 댐 데이터 컬럼
+    DAM_FEATURES = ['하굿둑방류량_평균', '하굿둑강수량_평균']
+    
+    # log_scale 기본 로그 변환 대상 컬럼 (치우친 분포)
+    LOG_COLUMNS = ['유량', '하굿둑강수량_평균', '하굿둑방류량_평균', '클로로필-a']
+    
+    # 전처리된 댐 데이터 캐시 최대 항목 수 (오래 안 쓴 것부터 제거)
+    DAM_CACHE_SIZE = 4
+    
+    def __init__(self):
+        # 댐 데이터 내용 해시 -> 전처리 결과 (PeriodIndex 기준, LRU 순서)
+        self._dam_cache = OrderedDict()
+    
+    def _water_dates(self, water_df):
+        """수질 데이터의 측정 일자 (원본을 복사하지 않고 index에서 계산)"""
         # index가 날짜라고 가정 (원본 코드 유지)
-        water_df['일자_dt'] = pd.to_datetime(water_df.index)
-        
-        dam_df = dam_df.copy()
-        dam_df['일자'] = pd.to_datetime(dam_df['일자'])
-        
-        return water_df, dam_df
-    
-    def _aggregate_water_monthly(self, water_df):
-        """수질 데이터: 연월별 '평균' 집계"""
-        water_columns = {
-            '수온': 'mean',
-            '수소이온농도(ph)':'mean',
-            '전기전도도(EC)':'mean',
-            '용존산소(DO)':'mean',
-            'BOD':'mean',
-            'COD':'mean',
-            '유량': 'mean',
-            '총질소(T-N)':'mean',
-            '총유기탄소(TOC)': 'mean',
-            '총인(T-P)': 'mean',
-            '부유물질': 'mean',
-            '클로로필-a': 'mean'
-        }
-        # 존재하는 컬럼만 선택하여 집계 (에러 방지)
-        available_water_cols = {k: v for k, v in water_columns.items() if k in water_df.columns}
-        water_monthly = water_df.groupby(water_df['일자_dt'].dt.to_period('M')).agg(available_water_cols).reset_index()
+        return pd.DatetimeIndex(water_df.index)
+    
+    @instrumented()
+    def _aggregate_water_monthly(self, water_df, dates=None, stats=('mean',)):
+        """
+        수질 데이터: 연월별 통계 집계 (dates: 측정 일자, 없으면 '일자_dt' 컬럼 사용)
         
-        return water_monthly
+        stats의 모든 통계(평균은 원래 컬럼명, 나머지는 '<컬럼>_<통계>')를 한 번에 계산.
+        연월 키가 아닌 실제 일자를 넘겨야 'last'가 입력 순서와 무관하게 가장 최근 값이 됨
+        """
+        if dates is None:
+            dates = water_df['일자_dt']
+        # 존재하는 컬럼만 선택하여 집계 (에러 방지)
+        available_cols = [col for col in self.WATER_COLUMNS if col in water_df.columns]
+        return grouped_stats(water_df[available_cols], dates, stats=stats, freq='M')
     
     def _preprocess_dam_data(self, dam_df):
         """댐 데이터 전처리: 월 합계를 '일평균'으로 변환"""
@@ -55,35 +69,78 @@ class Add_Dam():
         
         return dam_df
     
-    def _merge_datasets(self, water_monthly, dam_df):
-        """두 데이터 병합 (Period 기준)"""
-        result = pd.merge(
-            water_monthly, 
-            dam_df[['일자_period', '하굿둑방류량_평균', '하굿둑강수량_평균']], 
-            left_on='일자_dt', 
-            right_on='일자_period', 
-            how='inner'
-        )
+    def _dam_hash(self, dam_df):
+        """댐 데이터 내용 해시 (컬럼명 + 값)"""
+        digest = hashlib.sha1('|'.join(map(str, dam_df.columns)).encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(dam_df, index=False).to_numpy().tobytes())
+        return digest.hexdigest()
+    
+    @instrumented()
+    def prepare_dam(self, dam_df):
+        """
+        댐 데이터 전처리 결과를 월(PeriodIndex) 기준 테이블로 반환
+        
+        같은 내용의 댐 데이터는 한 번만 전처리하고 이후에는 캐시된 결과를 재사용
+        (최근 DAM_CACHE_SIZE개까지 보관, 호출마다 복사본을 반환해 캐시는 수정되지 않음).
+        이미 전처리된 테이블(PeriodIndex)을 넘기면 그대로 반환
+        
+        Returns:
+        --------
+        pd.DataFrame : index='일자_period', columns=DAM_FEATURES
+        """
+        if isinstance(dam_df.index, pd.PeriodIndex):
+            return dam_df
+        
+        key = self._dam_hash(dam_df)
+        if key in self._dam_cache:
+            self._dam_cache.move_to_end(key)
+        else:
+            dam = dam_df.copy()
+            dam['일자'] = pd.to_datetime(dam['일자'])
+            dam = self._preprocess_dam_data(dam)
+            self._dam_cache[key] = dam.set_index('일자_period')[self.DAM_FEATURES]
+            while len(self._dam_cache) > self.DAM_CACHE_SIZE:
+                self._dam_cache.popitem(last=False)
+        
+        return self._dam_cache[key].copy()
+    
+    def clear_dam_cache(self):
+        """전처리된 댐 데이터 캐시 비우기"""
+        self._dam_cache.clear()
+    
+    @instrumented()
+    def _merge_datasets(self, water_monthly, dam_prepared):
+        """두 데이터 병합 (월 PeriodIndex 기준 join)"""
+        result = water_monthly.join(dam_prepared, on='일자_dt', how='inner')
         
         if result.empty:
             raise ValueError("병합 결과가 비어있습니다. 데이터의 날짜 범위를 확인하세요.")
         
         return result
     
-    def _finalize_result(self, result, new_order=None):
-        """최종 정리: Period를 다시 Timestamp로 변환하고 불필요한 컬럼 삭제"""
+    @instrumented()
+    def _finalize_result(self, result, new_order=None, dropna='any'):
+        """
+        최종 정리: Period를 다시 Timestamp로 변환하고 불필요한 컬럼 삭제
+        
+        dropna : 'any'(기본값, 결측치가 하나라도 있는 행 삭제), 'target'(new_order의
+                 마지막 컬럼(Target)이 결측인 행만 삭제), None(삭제하지 않음)
+        """
         if new_order is None:
-            new_order = ['일자', '수온', '수소이온농도(ph)', '전기전도도(EC)', '용존산소(DO)', 
-                        'BOD', 'COD', '총질소(T-N)', '유량', '총유기탄소(TOC)', '총인(T-P)', 
-                        '부유물질', '하굿둑방류량_평균', '하굿둑강수량_평균', '클로로필-a']
+            new_order = self.DEFAULT_ORDER
+        if dropna not in ('any', 'target', None):
+            raise ValueError(f"dropna는 'any', 'target', None 중 하나여야 합니다: {dropna}")
         
         # Period를 다시 Timestamp로 변환하고 불필요한 컬럼 삭제
         result['일자'] = result['일자_dt'].dt.to_timestamp()
-        result = result.drop(columns=['일자_dt', '일자_period'])
+        result = result.drop(columns=['일자_dt'])
         
         # 정렬 및 결측치 처리
         result = result.sort_values('일자').reset_index(drop=True)
-        result.dropna(inplace=True)
+        if dropna == 'any':
+            result.dropna(inplace=True)
+        elif dropna == 'target' and new_order[-1] in result.columns:
+            result.dropna(subset=[new_order[-1]], inplace=True)
         
         # new_order에 있는 컬럼만 선택 (존재하지 않는 컬럼은 무시)
         available_cols = [col for col in new_order if col in result.columns]
@@ -93,39 +150,57 @@ class Add_Dam():
         
         return result.reindex(columns=available_cols)
     
-    def month_dam_add(self, water_df, dam_df):
-        # 1. 데이터 복사 및 날짜 형식 변환
-        water_df, dam_df = self._prepare_date_columns(water_df, dam_df)
+    def _order_with_stats(self, new_order, stats):
+        """
+        평균 외 통계 컬럼('<컬럼>_<통계>')을 Target(마지막 컬럼) 앞에 추가한 컬럼 순서
+        
+        Target 자체의 통계는 같은 달 정보가 새어 들어가므로 추가하지 않음
+        """
+        extra = [stat_column(col, stat)
+                 for stat in stats if stat != 'mean'
+                 for col in new_order[:-1] if col in self.WATER_COLUMNS]
+        return list(new_order[:-1]) + extra + [new_order[-1]]
+    
+    @instrumented()
+    def month_dam_add(self, water_df, dam_df, stats=('mean',), dropna='any'):
+        """
+        stats : 연월별 집계 통계 (aggregate.STATS 중 선택, 기본값: 평균만)
+        dropna : _finalize_result 참고 (기본값: 결측치가 있는 행 삭제)
+        """
+        # 1. 측정 일자 (원본 복사 없이)
+        dates = self._water_dates(water_df)
 
-        # 2. 수질 데이터: 연월별 '평균' 집계
-        water_monthly = self._aggregate_water_monthly(water_df)
+        # 2. 수질 데이터: 연월별 통계 집계 (한 번의 정렬로 모든 통계 계산)
+        water_monthly = self._aggregate_water_monthly(water_df, dates, stats=stats)
 
-        # 3. 댐 데이터 전처리: 월 합계를 '일평균'으로 변환
-        dam_df = self._preprocess_dam_data(dam_df)
+        # 3. 댐 데이터 전처리: 월 합계를 '일평균'으로 변환 (prepare_dam 결과도 허용, 캐시 사용)
+        dam_prepared = self.prepare_dam(dam_df)
 
         # 4. 두 데이터 병합 (Period 기준)
-        result = self._merge_datasets(water_monthly, dam_df)
+        result = self._merge_datasets(water_monthly, dam_prepared)
 
         # 5. 최종 정리: Period를 다시 Timestamp로 변환하고 불필요한 컬럼 삭제
-        result = self._finalize_result(result)
+        result = self._finalize_result(result, new_order=self._order_with_stats(self.DEFAULT_ORDER, stats),
+                                       dropna=dropna)
         
         return result
     
-    def month_dam_add_small(self, water_df, dam_df):
-        # 1. 데이터 복사 및 날짜 형식 변환
-        water_df, dam_df = self._prepare_date_columns(water_df, dam_df)
+    @instrumented()
+    def month_dam_add_small(self, water_df, dam_df, stats=('mean',), dropna='any'):
+        # 1. 측정 일자 (원본 복사 없이)
+        dates = self._water_dates(water_df)
 
-        # 2. 수질 데이터: 연월별 '평균' 집계
-        water_monthly = self._aggregate_water_monthly(water_df)
+        # 2. 수질 데이터: 연월별 통계 집계 (한 번의 정렬로 모든 통계 계산)
+        water_monthly = self._aggregate_water_monthly(water_df, dates, stats=stats)
 
-        # 3. 댐 데이터 전처리: 월 합계를 '일평균'으로 변환
-        dam_df = self._preprocess_dam_data(dam_df)
+        # 3. 댐 데이터 전처리: 월 합계를 '일평균'으로 변환 (prepare_dam 결과도 허용, 캐시 사용)
+        dam_prepared = self.prepare_dam(dam_df)
 
         # 4. 두 데이터 병합 (Period 기준)
-        result = self._merge_datasets(water_monthly, dam_df)
+        result = self._merge_datasets(water_monthly, dam_prepared)
 
         # 5. 최종 정리: Period를 다시 Timestamp로 변환하고 불필요한 컬럼 삭제
-        result = self._finalize_result(result, new_order=[
+        result = self._finalize_result(result, new_order=self._order_with_stats([
             '일자',
             '수온', 
             '하굿둑방류량_평균', 
@@ -133,10 +208,97 @@ class Add_Dam():
             '총질소(T-N)', 
             '하굿둑강수량_평균', 
             '클로로필-a'  # Target
-        ])
+        ], stats), dropna=dropna)
         
         return result
     
+    @instrumented()
+    def _aggregate_water_monthly_by_station(self, water_df, station_col, stats=('mean',)):
+        """여러 지점 수질 데이터: (지점, 연월)별 통계를 한 번의 정렬로 집계"""
+        # '일자' 컬럼이 없으면 index가 날짜라고 가정
+        dates = water_df['일자'] if '일자' in water_df.columns else water_df.index
+        available_cols = [col for col in self.WATER_COLUMNS if col in water_df.columns]
+        
+        return grouped_stats(water_df[available_cols], dates, stations=water_df[station_col],
+                             stats=stats, freq='M', station_name=station_col)
+    
+    @instrumented()
+    def month_dam_add_stations(self, water_df, dam_df, station_col='총량지점명', new_order=None,
+                               stats=('mean',), dropna='any'):
+        """
+        여러 지점의 수질 데이터를 한 번에 월별 집계하여 댐 데이터와 병합
+        
+        Parameters:
+        -----------
+        water_df : pd.DataFrame
+            지점이 섞여 있는 long-format 수질 데이터 (Water.api_data 결과).
+            '일자' 컬럼이 없으면 index를 날짜로 사용
+        dam_df : pd.DataFrame
+            Water.dam 결과
+        station_col : str, default='총량지점명'
+            지점 구분 컬럼
+        new_order : list, optional
+            결과 컬럼 순서 (기본값: DEFAULT_ORDER). 지점 컬럼은 항상 맨 앞에 추가됨
+        stats : tuple, default=('mean',)
+            연월별 집계 통계 (aggregate.STATS 중 선택). 평균 외 통계는
+            '<컬럼>_<통계>' 이름으로 Target 앞에 추가됨
+        dropna : str or None, default='any'
+            _finalize_result 참고
+        
+        Returns:
+        --------
+        pd.DataFrame : 지점, 일자 순으로 정렬된 병합 결과
+        """
+        if station_col not in water_df.columns:
+            raise ValueError(f"지점 컬럼이 없습니다: {station_col}")
+        
+        # 1. 수질 데이터: (지점, 연월)별 통계 집계
+        water_monthly = self._aggregate_water_monthly_by_station(water_df, station_col, stats=stats)
+        
+        # 2. 댐 데이터 전처리 (지점 수와 무관하게 한 번만 수행, 캐시 사용)
+        dam_prepared = self.prepare_dam(dam_df)
+        
+        # 3. 두 데이터 병합 (Period 기준)
+        result = self._merge_datasets(water_monthly, dam_prepared)
+        
+        # 4. 최종 정리
+        if new_order is None:
+            new_order = self.DEFAULT_ORDER
+        new_order = self._order_with_stats([col for col in new_order if col != station_col], stats)
+        result = self._finalize_result(result, new_order=[station_col] + new_order, dropna=dropna)
+        
+        return result.sort_values([station_col, '일자']).reset_index(drop=True)
+    
+    @instrumented()
+    def aggregate_water(self, water_df, freq='M', stats=('mean',), station_col=None):
+        """
+        수질 데이터를 일(D) / 주(W) / 월(M) 단위로 집계 (댐 데이터 병합 없음)
+        
+        Parameters:
+        -----------
+        water_df : pd.DataFrame
+            수질 데이터. '일자' 컬럼이 없으면 index를 날짜로 사용
+        freq : str, default='M'
+            'D', 'W', 'M' 중 하나
+        stats : tuple, default=('mean',)
+            aggregate.STATS 중 선택
+        station_col : str, optional
+            지정하면 (지점, 기간)별로 집계
+        
+        Returns:
+        --------
+        pd.DataFrame : '일자'(기간 시작일) 기준으로 정렬된 집계 결과
+        """
+        dates = water_df['일자'] if '일자' in water_df.columns else water_df.index
+        available_cols = [col for col in self.WATER_COLUMNS if col in water_df.columns]
+        stations = water_df[station_col] if station_col is not None else None
+        
+        result = grouped_stats(water_df[available_cols], dates, stations=stations, stats=stats,
+                               freq=freq, station_name=station_col)
+        result.insert(1 if station_col is not None else 0, '일자',
+                      result.pop('일자_dt').dt.to_timestamp())
+        return result
+    
 
     def _sort_by_date(self, df):
         """시계열 데이터를 날짜 기준으로 정렬"""
@@ -144,12 +306,13 @@ class Add_Dam():
         df = df.sort_index()
         return df
     
-    def _apply_log_transform(self, df, cols=None):
-        """특정 컬럼에 로그 변환 적용"""
+    @instrumented()
+    def _apply_log_transform(self, df, cols=None, inplace=False):
+        """특정 컬럼에 로그 변환 적용 (inplace=True면 복사하지 않고 해당 컬럼만 교체)"""
         if cols is None:
-            cols = ['유량', '하굿둑강수량_평균', '하굿둑방류량_평균', '클로로필-a']
+            cols = self.LOG_COLUMNS
         
-        df_transformed = df.copy()
+        df_transformed = df if inplace else df.copy()
         for col in cols:
             if col in df_transformed.columns:
                 df_transformed[col] = np.log1p(df_transformed[col])
@@ -162,8 +325,12 @@ class Add_Dam():
         y = df.iloc[:, -1]
         return X, y
     
+    @instrumented()
     def _scale_features(self, xtrain, xtest):
         """특성 스케일링"""
+        # scikit-learn은 import 비용이 커서 스케일링할 때만 불러옴
+        from sklearn.preprocessing import StandardScaler
+        
         sc = StandardScaler()
         xtrain_scaled = pd.DataFrame(
             sc.fit_transform(xtrain), 
@@ -177,6 +344,20 @@ class Add_Dam():
         )
         return xtrain_scaled, xtest_scaled
     
+    @staticmethod
+    def fit_scaler(X):
+        """
+        StandardScaler와 같은 (평균, 표준편차) 계산 (NumPy 배열 기준, sklearn 불필요)
+        
+        분산이 0인 컬럼은 StandardScaler와 동일하게 표준편차를 1로 두어 스케일링하지 않음
+        """
+        X = np.asarray(X, dtype=float)
+        mean = X.mean(axis=0)
+        scale = X.std(axis=0)
+        scale[scale == 0] = 1.0
+        return mean, scale
+    
+    @instrumented()
     def log_scale(self, df, test_size=0.2, log_cols=None):
         """
         데이터 로그 변환, 분할, 스케일링 수행
@@ -188,7 +369,7 @@ class Add_Dam():
         test_size : float, default=0.2
             테스트 데이터 비율
         log_cols : list, optional
-            로그 변환할 컬럼 리스트 (기본값: ['유량', '하굿둑강수량_평균', '하굿둑방류량_평균', '클로로필-a'])
+            로그 변환할 컬럼 리스트 (기본값: LOG_COLUMNS)
         
         Returns:
         --------
@@ -197,13 +378,15 @@ class Add_Dam():
         # 1. 시계열 순서대로 정렬
         df = self._sort_by_date(df)
 
-        # 2. 특정 컬럼 로그 변환
-        df_transformed = self._apply_log_transform(df, log_cols)
+        # 2. 특정 컬럼 로그 변환 (정렬 결과는 새 객체이므로 추가 복사 없이 변환)
+        df_transformed = self._apply_log_transform(df, log_cols, inplace=True)
 
         # 3. 독립변수(X)와 종속변수(y) 분리
         X, y = self._split_features_target(df_transformed)
 
         # 4. 시계열 데이터 분할 (순서 유지)
+        from sklearn.model_selection import train_test_split
+        
         xtrain, xtest, ytrain, ytest = train_test_split(
             X, y, 
             test_size=test_size, 
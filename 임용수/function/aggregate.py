@@ -0,0 +1,131 @@
+"""Fused single-pass grouped statistics over (station, period) keys."""
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+STATS = ('mean', 'min', 'max', 'std', 'count', 'last')
+FREQS = ('D', 'W', 'M')
+
+
+def stat_column(column: str, stat: str) -> str:
+    """Output name of a statistic: the mean keeps the plain column name."""
+    return column if stat == 'mean' else f'{column}_{stat}'
+
+
+def grouped_stats(values: pd.DataFrame, dates, stations=None, stats: Sequence[str] = ('mean',),
+                  freq: str = 'M', period_name: str = '일자_dt',
+                  station_name: Optional[str] = None) -> pd.DataFrame:
+    """
+    Mean / min / max / std / count / last of every column per (station, period).
+
+    Rows are sorted once by (station, period, date) and every statistic is a
+    NumPy ``reduceat`` over the group boundaries of that order, so extra
+    statistics cost one array reduction each instead of another groupby.
+    NaNs are skipped like pandas (std uses ddof=1; 'last' is the latest
+    non-missing value).
+
+    Args:
+        values: Numeric columns, aligned with ``dates``.
+        dates: Datetimes (binned with ``freq``) or a PeriodIndex / Period
+              Series used as-is. Periods carry no time within the period,
+              so 'last' then follows the input row order; pass datetimes
+              when 'last' must be the latest date.
+        stations: Optional station labels aligned with ``values``.
+        stats: Any of STATS.
+        freq: 'D', 'W' or 'M' (ignored when ``dates`` are periods).
+        period_name: Name of the period key column.
+        station_name: Name of the station key column (default: 'station').
+
+    Returns:
+        pd.DataFrame: Key columns, then '<col>' for the mean and '<col>_<stat>'
+                      for the other statistics, sorted by station and period.
+                      Rows with a missing date or station are dropped.
+    """
+    unknown = [stat for stat in stats if stat not in STATS]
+    if unknown:
+        raise ValueError(f"지원하지 않는 통계입니다: {unknown} (가능: {list(STATS)})")
+
+    if isinstance(dates, pd.PeriodIndex) or isinstance(getattr(dates, 'dtype', None), pd.PeriodDtype):
+        periods = pd.PeriodIndex(dates)
+        fine = None
+    else:
+        if freq not in FREQS:
+            raise ValueError(f"지원하지 않는 집계 단위입니다: {freq} (가능: {list(FREQS)})")
+        dt = pd.DatetimeIndex(dates if pd.api.types.is_datetime64_dtype(dates) else pd.to_datetime(dates))
+        periods = dt.to_period(freq)
+        fine = dt.asi8
+    ordinals = periods.asi8
+    valid = ~periods.isna()
+
+    sort_keys = [ordinals]
+    if fine is not None:
+        sort_keys.insert(0, fine)
+    if stations is not None:
+        # category 코드를 그대로 사용 (문자열 배열로 변환하지 않음)
+        stations = pd.Categorical(stations)
+        station_codes = stations.codes
+        valid &= station_codes >= 0
+        sort_keys.append(station_codes)
+    else:
+        station_codes = np.zeros(len(ordinals), dtype=np.intp)
+
+    # (지점, 기간, 일자) 순으로 한 번만 정렬 (lexsort는 마지막 키가 1순위)
+    rows = np.flatnonzero(valid)
+    rows = rows[np.lexsort([key[rows] for key in sort_keys])]
+
+    columns = list(values.columns)
+    out_columns = [stat_column(col, stat) for stat in stats for col in columns]
+    n = len(rows)
+
+    if n == 0:
+        keys = {period_name: periods[:0]}
+        if stations is not None:
+            keys = {station_name or 'station': stations.categories[:0], **keys}
+        return pd.DataFrame({**keys, **{col: np.array([], dtype=float) for col in out_columns}})
+
+    k_ord, k_st = ordinals[rows], station_codes[rows]
+    change = np.empty(n, dtype=bool)
+    change[0] = True
+    change[1:] = (k_ord[1:] != k_ord[:-1]) | (k_st[1:] != k_st[:-1])
+    starts = np.flatnonzero(change)
+    lengths = np.diff(np.append(starts, n))
+
+    X = values.to_numpy(dtype=np.float64)[rows]
+    present = ~np.isnan(X)
+    count = np.add.reduceat(present, starts, axis=0)
+    empty = count == 0
+
+    results = {}
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if 'mean' in stats or 'std' in stats:
+            mean = np.add.reduceat(np.where(present, X, 0.0), starts, axis=0) / count
+            results['mean'] = mean
+        if 'std' in stats:
+            deviation = np.where(present, X - np.repeat(mean, lengths, axis=0), 0.0)
+            variance = np.add.reduceat(deviation ** 2, starts, axis=0) / (count - 1)
+            results['std'] = np.where(count > 1, np.sqrt(variance), np.nan)
+    if 'min' in stats:
+        results['min'] = np.where(empty, np.nan, np.minimum.reduceat(np.where(present, X, np.inf), starts, axis=0))
+    if 'max' in stats:
+        results['max'] = np.where(empty, np.nan, np.maximum.reduceat(np.where(present, X, -np.inf), starts, axis=0))
+    if 'last' in stats:
+        position = np.where(present, np.arange(n)[:, None], -1)
+        last = np.maximum.reduceat(position, starts, axis=0)
+        results['last'] = np.where(last >= 0, np.take_along_axis(X, np.clip(last, 0, None), axis=0), np.nan)
+    if 'count' in stats:
+        results['count'] = count
+
+    data = {}
+    if stations is not None:
+        data[station_name or 'station'] = stations.categories.take(k_st[starts])
+    data[period_name] = periods[rows[starts]]
+    for stat in stats:
+        for j, col in enumerate(columns):
+            # 원래 dtype(float32 등) 유지, count는 정수
+            dtype = np.int64 if stat == 'count' else values[col].dtype
+            if stat != 'count' and not np.issubdtype(dtype, np.floating):
+                dtype = np.float64
+            data[stat_column(col, stat)] = results[stat][:, j].astype(dtype, copy=False)
+    return pd.DataFrame(data)
@@ -0,0 +1,171 @@
+"""Walk-forward (rolling / expanding window) backtesting on merged monthly frames."""
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from function.add_dam import Add_Dam
+
+
+def walk_forward_folds(n_samples: int, test_size: int = 12, min_train_size: int = 36,
+                       window: str = 'expanding', train_size: Optional[int] = None,
+                       step: Optional[int] = None) -> list:
+    """
+    Build walk-forward folds as (train_slice, test_slice) pairs.
+
+    Args:
+        n_samples: Number of time-ordered rows.
+        test_size: Rows in each test window.
+        min_train_size: Rows in the first training window.
+        window: 'expanding' (train always starts at 0) or 'rolling'
+               (fixed-length train window of ``train_size`` rows).
+        train_size: Rolling window length. Defaults to min_train_size.
+        step: Rows between consecutive fold starts. Defaults to test_size.
+
+    Returns:
+        list: [(slice(train_start, train_end), slice(train_end, test_end)), ...]
+    """
+    if window not in ('expanding', 'rolling'):
+        raise ValueError(f"window는 'expanding' 또는 'rolling'이어야 합니다: {window}")
+    step = step or test_size
+    train_size = train_size or min_train_size
+
+    folds = []
+    train_end = min_train_size
+    while train_end + test_size <= n_samples:
+        train_start = 0 if window == 'expanding' else max(0, train_end - train_size)
+        folds.append((slice(train_start, train_end), slice(train_end, train_end + test_size)))
+        train_end += step
+
+    if not folds:
+        raise ValueError(f"데이터가 부족합니다: {n_samples}행 (필요: {min_train_size + test_size}행 이상)")
+    return folds
+
+
+def sarimax_forecast(xtrain, ytrain, xtest, order=(1, 1, 1), seasonal_order=(1, 0, 0, 12),
+                     trend='c') -> np.ndarray:
+    """SARIMAX fit/forecast for run(); bind orders with functools.partial."""
+    from statsmodels.tsa.statespace.sarimax import SARIMAX
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        fitted = SARIMAX(ytrain, exog=xtrain, order=order, seasonal_order=seasonal_order,
+                         trend=trend, enforce_stationarity=False,
+                         enforce_invertibility=False).fit(disp=False)
+        return np.asarray(fitted.forecast(steps=len(xtest), exog=xtest))
+
+
+def estimator_forecast(xtrain, ytrain, xtest, estimator=None) -> np.ndarray:
+    """scikit-learn estimator fit/predict for run(); the estimator is cloned per fold."""
+    from sklearn.base import clone
+
+    model = clone(estimator)
+    model.fit(xtrain, ytrain)
+    return np.asarray(model.predict(xtest))
+
+
+def _run_fold(fit_predict: Callable, fold: int, xtrain, ytrain, xtest) -> tuple:
+    return fold, fit_predict(xtrain, ytrain, xtest)
+
+
+class WalkForwardBacktest:
+    """
+    Walk-forward backtest over a month_dam_add result (index = 일자, last column = target).
+
+    Sorting, the log1p transform and the X/y split are done once up front and
+    kept as NumPy arrays. Every fold slices views of those arrays and only
+    fits its own StandardScaler-equivalent on the training window
+    (Add_Dam.fit_scaler), so adding folds does not copy the DataFrame again.
+    """
+
+    def __init__(self, df: pd.DataFrame, log_cols: Optional[list] = None,
+                 test_size: int = 12, min_train_size: int = 36, window: str = 'expanding',
+                 train_size: Optional[int] = None, step: Optional[int] = None) -> None:
+        """
+        Args:
+            df: Merged monthly frame, as passed to Add_Dam.log_scale.
+            log_cols: Columns to log1p-transform (Add_Dam.log_scale default if None).
+            test_size, min_train_size, window, train_size, step: See walk_forward_folds.
+        """
+        ad = Add_Dam()
+        if log_cols is None:
+            log_cols = Add_Dam.LOG_COLUMNS
+
+        # 1~3. 정렬, 로그 변환, X/y 분리는 한 번만 수행
+        df = ad._apply_log_transform(ad._sort_by_date(df), log_cols, inplace=True)
+        X, y = ad._split_features_target(df)
+
+        self.index = df.index
+        self.feature_names = list(X.columns)
+        self.target_name = y.name
+        self.log_target = y.name in log_cols
+        self.X = X.to_numpy(dtype=float)
+        self.y = y.to_numpy(dtype=float)
+        self.folds = walk_forward_folds(len(self.y), test_size=test_size,
+                                        min_train_size=min_train_size, window=window,
+                                        train_size=train_size, step=step)
+        self.predictions_ = None
+
+    def fold_data(self, fold: int) -> tuple:
+        """
+        Scaled arrays for one fold.
+
+        Returns:
+            tuple: (xtrain_scaled, xtest_scaled, ytrain, ytest) as NumPy arrays;
+                   ytrain / ytest are views of the precomputed target.
+        """
+        train, test = self.folds[fold]
+        xtrain, xtest = self.X[train], self.X[test]
+
+        mean, scale = Add_Dam.fit_scaler(xtrain)
+        return (xtrain - mean) / scale, (xtest - mean) / scale, self.y[train], self.y[test]
+
+    def run(self, fit_predict: Callable, max_workers: Optional[int] = None,
+            executor: str = 'process') -> pd.DataFrame:
+        """
+        Fit and predict every fold in parallel.
+
+        Args:
+            fit_predict: Picklable callable (xtrain, ytrain, xtest) -> predictions,
+                        e.g. functools.partial(sarimax_forecast, order=(1, 1, 1)).
+            max_workers: Pool size. Defaults to os.cpu_count().
+            executor: 'process' or 'thread'.
+
+        Returns:
+            pd.DataFrame: Per-fold metrics (rmse / mae on the model scale and,
+                          for log1p targets, rmse_original after expm1).
+                          Predictions are stored in ``predictions_``.
+        """
+        pool_class = {'process': ProcessPoolExecutor, 'thread': ThreadPoolExecutor}.get(executor)
+        if pool_class is None:
+            raise ValueError(f"executor는 'process' 또는 'thread'여야 합니다: {executor}")
+
+        with pool_class(max_workers=max_workers or os.cpu_count()) as pool:
+            futures = []
+            for fold in range(len(self.folds)):
+                xtrain, xtest, ytrain, _ = self.fold_data(fold)
+                futures.append(pool.submit(_run_fold, fit_predict, fold, xtrain, ytrain, xtest))
+            predictions = dict(future.result() for future in futures)
+
+        rows, frames = [], []
+        for fold, (train, test) in enumerate(self.folds):
+            ytest = self.y[test]
+            pred = np.asarray(predictions[fold], dtype=float)
+            row = {
+                'fold': fold,
+                'train_start': self.index[train.start], 'train_end': self.index[train.stop - 1],
+                'test_start': self.index[test.start], 'test_end': self.index[test.stop - 1],
+                'rmse': float(np.sqrt(np.mean((pred - ytest) ** 2))),
+                'mae': float(np.mean(np.abs(pred - ytest))),
+            }
+            if self.log_target:
+                row['rmse_original'] = float(np.sqrt(np.mean((np.expm1(pred) - np.expm1(ytest)) ** 2)))
+            rows.append(row)
+            frames.append(pd.DataFrame({'fold': fold, 'actual': ytest, 'forecast': pred},
+                                       index=self.index[test]))
+
+        self.predictions_ = pd.concat(frames)
+        return pd.DataFrame(rows)
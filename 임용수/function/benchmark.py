@@ -0,0 +1,243 @@
+"""Benchmark harness for the ingestion -> merge -> model pipeline.
+
+Every stage runs on synthetic data of configurable size (stations x years),
+with the water quality / dam HTTP endpoints replaced by an in-process
+function.mock_api.MockWaterAPI, and records wall time, peak Python memory and rows per second.
+
+Usage:
+    python -m function.benchmark --stations 2 --years 9
+    python -m function.benchmark --stations 24 --years 9 --save-baseline benchmarks/baseline.json
+    python -m function.benchmark --stations 24 --years 9 --baseline benchmarks/baseline.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from function.add_dam import Add_Dam
+from function.mock_api import (MockWaterAPI, mock_water, synthetic_dam_items, synthetic_stations,
+                               synthetic_water_items)
+
+
+# ----------------------------------------------------------------------
+# Measurement
+# ----------------------------------------------------------------------
+def measure(stage: str, func: Callable, rows: Optional[Callable] = None, repeat: int = 3,
+            setup: Optional[Callable] = None, warmup: bool = True) -> tuple:
+    """
+    Run func and record wall time (median of ``repeat``), peak traced memory and rows/sec.
+
+    One untimed warm-up call runs first, so one-off costs such as lazy
+    imports (sklearn, statsmodels) are not charged to the stage.
+
+    Args:
+        stage: Stage name.
+        func: Zero-argument callable.
+        rows: Callable mapping func's result to a row count (default: len(result)).
+        repeat: Number of timed runs; the median wall time is reported.
+        setup: Untimed zero-argument callable run before every call, e.g. to
+              remove a cache so a cold path is timed on every run.
+        warmup: Run one untimed call first.
+
+    Returns:
+        tuple: (result, record dict)
+    """
+    if warmup:
+        if setup is not None:
+            setup()
+        with contextlib.redirect_stdout(io.StringIO()):
+            func()
+
+    times, peak, result = [], 0, None
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        tracemalloc.start()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = func()
+        times.append(time.perf_counter() - start)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    seconds = float(np.median(times))
+    n_rows = rows(result) if rows is not None else len(result)
+    return result, {
+        'stage': stage,
+        'seconds': seconds,
+        'seconds_min': min(times),
+        'peak_mb': peak / 1024 ** 2,
+        'rows': int(n_rows),
+        'rows_per_sec': n_rows / seconds if seconds > 0 else np.inf,
+    }
+
+
+def run_benchmarks(n_stations: int = 2, n_years: int = 9, per_month: int = 4,
+                   latency: float = 0.0, repeat: int = 3, fit_model: bool = True,
+                   page_size: Optional[int] = None) -> pd.DataFrame:
+    """
+    Run every pipeline stage on synthetic data.
+
+    Args:
+        n_stations: Number of stations.
+        n_years: Number of years, ending in 2025.
+        per_month: Measurements per station per month.
+        latency: Simulated seconds per HTTP request.
+        repeat: Timed runs per stage after one warm-up (median wall time is kept).
+        fit_model: Also time a SARIMAX fit (needs statsmodels).
+        page_size: Rows per mock API page (None: numOfRows as requested).
+
+    Returns:
+        pd.DataFrame: One row per stage.
+    """
+    years = list(range(2025 - n_years + 1, 2026))
+    stations = synthetic_stations(n_stations)
+    api = MockWaterAPI(synthetic_water_items(stations, years, per_month), synthetic_dam_items(years),
+                       latency=latency, page_size=page_size)
+
+    water = mock_water(api)
+    ad = Add_Dam()
+    records = []
+
+    year_list = ','.join(map(str, years))
+    pt_no_list = ','.join(stations)
+    water_df, record = measure('api_data', lambda: water.api_data(year=year_list, pt_no_list=pt_no_list,
+                                                                  split_by='station'), repeat=repeat)
+    records.append(record)
+    dam_df, record = measure('dam', water.dam, repeat=repeat)
+    records.append(record)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        from function.total_water_loader import TotalWaterLoader
+
+        csv_path = Path(tmp) / 'total_water_quantity_measurement.csv'
+        total = water_df.rename(columns={'유량': '유량(㎥/s)', '수온': '수온(℃)'})
+        total = total.assign(일자=total['일자'].dt.strftime('%Y.%m.%d'))
+        total.to_csv(csv_path, index=False, encoding='euc-kr')
+        loader = TotalWaterLoader(csv_path=str(csv_path))
+
+        def remove_cache():
+            # 매 실행마다 캐시를 지워 CSV -> 캐시 경로를 측정
+            loader.cache_path.unlink(missing_ok=True)
+            loader.meta_path.unlink(missing_ok=True)
+
+        _, record = measure('total_water (csv -> cache)', loader.load, setup=remove_cache, repeat=repeat)
+        records.append(record)
+        _, record = measure('total_water (cached)', loader.load, repeat=repeat)
+        records.append(record)
+
+    per_station = {name: frame.set_index('일자') for name, frame in water_df.groupby('총량지점명', observed=True)}
+    merged, record = measure(
+        'month_dam_add (per station)',
+        lambda: {name: ad.month_dam_add(frame, dam_df) for name, frame in per_station.items()},
+        rows=lambda result: sum(len(frame) for frame in result.values()), repeat=repeat)
+    records.append(record)
+    _, record = measure('month_dam_add_stations', lambda: ad.month_dam_add_stations(water_df, dam_df),
+                        repeat=repeat)
+    records.append(record)
+
+    monthly = next(iter(merged.values())).set_index('일자')
+    split, record = measure('log_scale', lambda: ad.log_scale(monthly),
+                            rows=lambda result: len(result[0]) + len(result[1]), repeat=repeat)
+    records.append(record)
+
+    if fit_model:
+        from function.backtest import sarimax_forecast
+
+        xtrain, xtest, ytrain, _ = split
+        _, record = measure('sarimax fit', lambda: sarimax_forecast(xtrain, ytrain, xtest),
+                            rows=lambda _: len(xtrain), repeat=repeat)
+        records.append(record)
+
+    result = pd.DataFrame(records)
+    result.attrs.update({'stations': n_stations, 'years': n_years, 'repeat': repeat,
+                         'http_calls': api.calls})
+    return result
+
+
+# baseline 비교에 필요한 최소 반복 횟수 (중앙값이 의미 있도록)
+MIN_COMPARE_REPEAT = 3
+
+
+def compare(results: pd.DataFrame, baseline: pd.DataFrame, tolerance: float = 0.2,
+            min_seconds: float = 0.01) -> pd.DataFrame:
+    """
+    Compare results with a saved baseline.
+
+    A stage regresses when its median wall time or peak memory exceeds the
+    baseline by more than ``tolerance`` (fraction). Time differences smaller
+    than ``min_seconds`` are treated as noise. Both sides need medians of at
+    least MIN_COMPARE_REPEAT runs.
+    """
+    for name, frame in (('결과', results), ('baseline', baseline)):
+        repeat = frame.attrs.get('repeat')
+        if repeat is None or repeat < MIN_COMPARE_REPEAT:
+            raise ValueError(f"{name}의 반복 횟수({repeat})가 부족합니다. "
+                             f"--repeat {MIN_COMPARE_REPEAT} 이상으로 측정한 결과끼리 비교하세요.")
+    merged = results.merge(baseline, on='stage', how='left', suffixes=('', '_baseline'))
+    merged['time_ratio'] = merged['seconds'] / merged['seconds_baseline']
+    merged['memory_ratio'] = merged['peak_mb'] / merged['peak_mb_baseline']
+    slower = (merged['time_ratio'] > 1 + tolerance) & \
+        (merged['seconds'] - merged['seconds_baseline'] > min_seconds)
+    merged['regression'] = slower | (merged['memory_ratio'] > 1 + tolerance)
+    return merged[['stage', 'seconds', 'seconds_baseline', 'time_ratio',
+                   'peak_mb', 'peak_mb_baseline', 'memory_ratio', 'regression']]
+
+
+def save_baseline(results: pd.DataFrame, path: str) -> None:
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    payload = {'config': results.attrs, 'stages': results.to_dict(orient='records')}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2, default=float)
+
+
+def load_baseline(path: str) -> pd.DataFrame:
+    with open(path, encoding='utf-8') as f:
+        payload = json.load(f)
+    baseline = pd.DataFrame(payload['stages'])
+    baseline.attrs.update(payload.get('config', {}))
+    return baseline
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='수질 파이프라인 단계별 벤치마크')
+    parser.add_argument('--stations', type=int, default=2)
+    parser.add_argument('--years', type=int, default=9)
+    parser.add_argument('--per-month', type=int, default=4)
+    parser.add_argument('--latency', type=float, default=0.0, help='HTTP 요청당 지연(초)')
+    parser.add_argument('--page-size', type=int, help='모의 API 페이지당 최대 행 수')
+    parser.add_argument('--repeat', type=int, default=3, help='단계별 측정 횟수 (warm-up 1회 제외, 중앙값 사용)')
+    parser.add_argument('--no-model', action='store_true', help='모델 학습 단계 생략')
+    parser.add_argument('--baseline', help='비교할 baseline JSON')
+    parser.add_argument('--save-baseline', help='결과를 baseline JSON으로 저장')
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.stations, args.years, args.per_month, args.latency,
+                             args.repeat, fit_model=not args.no_model, page_size=args.page_size)
+    print(results.to_string(index=False, float_format=lambda v: f'{v:,.4f}'))
+
+    if args.save_baseline:
+        save_baseline(results, args.save_baseline)
+        print(f"baseline 저장: {args.save_baseline}")
+
+    if args.baseline:
+        report = compare(results, load_baseline(args.baseline), args.tolerance)
+        print(report.to_string(index=False, float_format=lambda v: f'{v:,.3f}'))
+        if report['regression'].any():
+            print("성능 저하 단계:", report.loc[report['regression'], 'stage'].tolist())
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""On-disk cache for water quality / dam API pulls."""
+import importlib.util
+import shutil
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional
+
+import pandas as pd
+
+
+class WaterCache:
+    """
+    Columnar (Parquet) cache of API slices.
+
+    Water quality data is stored as one file per (station code, year, month):
+
+        <cache_dir>/water/<PT_NO>/<YYYY>-<MM>.parquet
+
+    Freshness policy:
+        - Closed months (before the current month) never expire once the slice
+          was fetched on or after the first day of the following month. A
+          slice written while its month was still current is refetched once.
+        - The current month (and any future month) is refreshed once the file
+          is older than ``current_ttl`` seconds.
+
+    The dam API has no date filter, so the dam table is cached as a single
+    file that is refreshed after ``current_ttl`` seconds.
+
+    Slices are stored as the raw API items (string columns) so both renamed
+    and raw (api_data_dept) views can be rebuilt from the cache.
+    """
+
+    DEFAULT_CACHE_DIR = 'data/cache'
+    DEFAULT_CURRENT_TTL = 6 * 60 * 60  # 6시간
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR,
+                 current_ttl: float = DEFAULT_CURRENT_TTL) -> None:
+        """
+        Args:
+            cache_dir: Root directory of the cache.
+            current_ttl: Seconds before a current-month slice (or the dam table)
+                        is considered stale.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        if importlib.util.find_spec('pyarrow') is None:
+            raise ImportError("캐시를 사용하려면 pyarrow가 필요합니다: pip install pyarrow")
+
+        self.root = Path(cache_dir)
+        self.current_ttl = current_ttl
+
+    # ------------------------------------------------------------------
+    # Water quality slices
+    # ------------------------------------------------------------------
+    def _slice_path(self, pt_no: str, year: int, month: int) -> Path:
+        return self.root / 'water' / str(pt_no) / f'{int(year):04d}-{int(month):02d}.parquet'
+
+    def _is_fresh(self, path: Path, closed_at: Optional[datetime] = None,
+                  now: Optional[datetime] = None) -> bool:
+        """
+        closed_at: Start of the month after the slice's month, if that month is
+                  closed. The file then has to be written at or after it.
+        """
+        if not path.exists():
+            return False
+        mtime = path.stat().st_mtime
+        if closed_at is not None:
+            return mtime >= closed_at.timestamp()
+        current = now.timestamp() if now is not None else time.time()
+        return (current - mtime) < self.current_ttl
+
+    @staticmethod
+    def _is_closed_month(year: int, month: int, now: Optional[datetime] = None) -> bool:
+        now = now or datetime.now()
+        return (int(year), int(month)) < (now.year, now.month)
+
+    @staticmethod
+    def _next_month_start(year: int, month: int) -> datetime:
+        year, month = int(year), int(month)
+        return datetime(year + month // 12, month % 12 + 1, 1)
+
+    def is_fresh(self, pt_no: str, year: int, month: int, now: Optional[datetime] = None) -> bool:
+        """Return True if the slice is cached and does not need a refresh."""
+        closed_at = self._next_month_start(year, month) if self._is_closed_month(year, month, now) else None
+        return self._is_fresh(self._slice_path(pt_no, year, month), closed_at, now)
+
+    def missing_slices(self, pt_nos: Iterable[str], years: Iterable[int],
+                       months: Iterable[int], now: Optional[datetime] = None) -> list:
+        """
+        Return the (pt_no, year, month) slices that are absent or stale.
+        """
+        return [
+            (pt_no, int(year), int(month))
+            for pt_no in pt_nos for year in years for month in months
+            if not self.is_fresh(pt_no, year, month, now)
+        ]
+
+    def write_water_slice(self, pt_no: str, year: int, month: int, df: pd.DataFrame) -> None:
+        """Store one slice. Empty frames are stored too so the slice is not re-fetched."""
+        path = self._slice_path(pt_no, year, month)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        df.reset_index(drop=True).to_parquet(tmp_path, index=False)
+        tmp_path.replace(path)
+
+    @staticmethod
+    def _read_slice(path: Path, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        if columns is None:
+            return pd.read_parquet(path)
+        import pyarrow.parquet as pq
+
+        # 빈 구간 파일에는 컬럼이 없으므로 존재하는 컬럼만 읽음
+        available = set(pq.read_schema(path).names)
+        return pd.read_parquet(path, columns=[col for col in columns if col in available])
+
+    def read_water(self, pt_nos: Iterable[str], years: Iterable[int],
+                   months: Iterable[int], columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """
+        Read every cached slice in the requested range (stale slices included).
+
+        Args:
+            columns: Raw API columns to read (Parquet column projection).
+                    Defaults to every column.
+        """
+        columns = list(columns) if columns is not None else None
+        frames = []
+        for pt_no in pt_nos:
+            for year in years:
+                for month in months:
+                    path = self._slice_path(pt_no, year, month)
+                    if path.exists():
+                        frames.append(self._read_slice(path, columns))
+
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+    # ------------------------------------------------------------------
+    # Dam table
+    # ------------------------------------------------------------------
+    def _dam_path(self) -> Path:
+        return self.root / 'dam' / 'dam.parquet'
+
+    def dam_is_fresh(self) -> bool:
+        """Return True if the cached dam table is younger than current_ttl."""
+        return self._is_fresh(self._dam_path())
+
+    def has_dam(self) -> bool:
+        return self._dam_path().exists()
+
+    def write_dam(self, df: pd.DataFrame) -> None:
+        path = self._dam_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        df.reset_index(drop=True).to_parquet(tmp_path, index=False)
+        tmp_path.replace(path)
+
+    def read_dam(self) -> pd.DataFrame:
+        path = self._dam_path()
+        if not path.exists():
+            return pd.DataFrame()
+        return pd.read_parquet(path)
+
+    # ------------------------------------------------------------------
+    # Invalidation
+    # ------------------------------------------------------------------
+    def invalidate(self, pt_no: Optional[str] = None, year: Optional[int] = None,
+                   month: Optional[int] = None) -> int:
+        """
+        Remove cached water slices matching the given filters.
+
+        Args:
+            pt_no: Station code, or None for every station.
+            year: Year, or None for every year.
+            month: Month, or None for every month.
+
+        Returns:
+            int: Number of files removed.
+        """
+        removed = 0
+        water_root = self.root / 'water'
+
+        if pt_no is None and year is None and month is None:
+            if water_root.exists():
+                removed += sum(1 for _ in water_root.rglob('*.parquet'))
+                shutil.rmtree(water_root)
+        else:
+            station_glob = str(pt_no) if pt_no is not None else '*'
+            year_glob = f'{int(year):04d}' if year is not None else '*'
+            month_glob = f'{int(month):02d}' if month is not None else '*'
+            for path in water_root.glob(f'{station_glob}/{year_glob}-{month_glob}.parquet'):
+                path.unlink()
+                removed += 1
+
+        return removed
+
+    def invalidate_dam(self) -> int:
+        """Remove the cached dam table. Returns the number of files removed."""
+        if not self._dam_path().exists():
+            return 0
+        self._dam_path().unlink()
+        return 1
@@ -0,0 +1,382 @@
+"""Content-hashed DAG runner that skips unchanged pipeline stages."""
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from function import instrument
+
+
+def content_hash(obj) -> str:
+    """
+    Stable SHA-256 of a stage output (DataFrame / Series / ndarray / containers).
+
+    DataFrames are hashed by columns, dtypes and pd.util.hash_pandas_object,
+    so equal data gives the same hash across runs and processes.
+    """
+    digest = hashlib.sha256()
+    _update_hash(digest, obj)
+    return digest.hexdigest()
+
+
+def _update_hash(digest, obj) -> None:
+    if isinstance(obj, pd.DataFrame):
+        digest.update(b'DataFrame')
+        digest.update(repr([(str(col), str(dtype)) for col, dtype in obj.dtypes.items()]).encode())
+        digest.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, pd.Series):
+        digest.update(f'Series{obj.name}{obj.dtype}'.encode())
+        digest.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, np.ndarray):
+        digest.update(f'ndarray{obj.dtype}{obj.shape}'.encode())
+        digest.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, (list, tuple)):
+        digest.update(f'{type(obj).__name__}{len(obj)}'.encode())
+        for item in obj:
+            _update_hash(digest, item)
+    elif isinstance(obj, dict):
+        digest.update(f'dict{len(obj)}'.encode())
+        for key in sorted(obj, key=repr):
+            digest.update(repr(key).encode())
+            _update_hash(digest, obj[key])
+    elif obj is None or isinstance(obj, (str, int, float, bool)):
+        digest.update(repr(obj).encode())
+    else:
+        digest.update(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _func_fingerprint(func: Callable) -> str:
+    """Module, qualified name and source of a stage function (edits invalidate the stage)."""
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        source = ''
+    return f'{getattr(func, "__module__", "")}.{getattr(func, "__qualname__", repr(func))}\n{source}'
+
+
+class Stage:
+    """One node: ``func(*upstream outputs, **params)``."""
+
+    def __init__(self, name: str, func: Callable, inputs: Sequence[str] = (), params: Optional[dict] = None,
+                 volatile: bool = False, process: bool = False) -> None:
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs)
+        self.params = dict(params or {})
+        self.volatile = volatile
+        self.process = process
+
+    def key(self, upstream_hashes: Sequence[str]) -> str:
+        payload = json.dumps({
+            'func': _func_fingerprint(self.func),
+            'params': self.params,
+            'inputs': list(upstream_hashes),
+        }, sort_keys=True, default=repr, ensure_ascii=False)
+        return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+class _Result:
+    __slots__ = ('name', 'key', 'content', 'status', 'seconds', 'path', 'output', 'loaded')
+
+    def __init__(self, name, key, content, status, seconds, path, output=None, loaded=False) -> None:
+        self.name = name
+        self.key = key
+        self.content = content
+        self.status = status
+        self.seconds = seconds
+        self.path = path
+        self.output = output
+        self.loaded = loaded
+
+
+class DAG:
+    """
+    Stages with declared inputs and parameters, each output stored on disk:
+
+        <cache_dir>/<stage>/<key>.pkl    output (joblib)
+        <cache_dir>/<stage>/<key>.json   content hash, params, run time
+
+    A stage's key hashes its function source, its parameters and the content
+    hashes of its inputs. If a file for the key exists the stage is skipped.
+    ``volatile`` stages (API fetches) always run, but when their output is
+    unchanged the downstream keys are unchanged too, so nothing else reruns.
+    Stages whose inputs are ready run concurrently in a thread pool;
+    ``process=True`` stages (CPU-bound fits, module-level functions) run in a
+    process pool.
+
+        dag = DAG('data/dag')
+        dag.add('water', fetch, volatile=True)
+        dag.add('물금', split_station, inputs=['water'], params={'station': '물금'})
+        outputs = dag.run()
+        dag.report_
+    """
+
+    def __init__(self, cache_dir: str = 'data/dag', max_workers: Optional[int] = None) -> None:
+        self.root = Path(cache_dir)
+        self.max_workers = max_workers
+        self.stages = {}
+        self.report_ = None
+        self._lock = threading.Lock()
+        self._process_pool = None
+
+    # ------------------------------------------------------------------
+    # Definition
+    # ------------------------------------------------------------------
+    def add(self, name: str, func: Callable, inputs: Sequence[str] = (), params: Optional[dict] = None,
+            volatile: bool = False, process: bool = False) -> Stage:
+        if name in self.stages:
+            raise ValueError(f"이미 등록된 단계입니다: {name}")
+        unknown = [dep for dep in inputs if dep not in self.stages]
+        if unknown:
+            raise ValueError(f"{name}: 먼저 등록해야 하는 입력 단계입니다: {unknown}")
+        stage = Stage(name, func, inputs, params, volatile, process)
+        self.stages[name] = stage
+        return stage
+
+    def stage(self, name: Optional[str] = None, inputs: Sequence[str] = (), volatile: bool = False,
+              process: bool = False, **params):
+        """Decorator form of add()."""
+        def decorator(func):
+            self.add(name or func.__name__, func, inputs, params, volatile, process)
+            return func
+        return decorator
+
+    def _required(self, targets: Iterable[str]) -> list:
+        """Targets and their ancestors in definition (= topological) order."""
+        needed = set()
+        stack = list(targets)
+        while stack:
+            name = stack.pop()
+            if name not in self.stages:
+                raise KeyError(f"등록되지 않은 단계입니다: {name}")
+            if name not in needed:
+                needed.add(name)
+                stack.extend(self.stages[name].inputs)
+        return [name for name in self.stages if name in needed]
+
+    def _sinks(self) -> list:
+        used = {dep for stage in self.stages.values() for dep in stage.inputs}
+        return [name for name in self.stages if name not in used]
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+    def _dir(self, name: str) -> Path:
+        return self.root / re.sub(r'[\\/:*?"<>|\s]', '_', name)
+
+    def _meta(self, name: str, key: str) -> Optional[dict]:
+        path = self._dir(name) / f'{key}.json'
+        if not path.exists() or not (self._dir(name) / f'{key}.pkl').exists():
+            return None
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def _save(self, stage: Stage, key: str, output, content: str, seconds: float) -> Path:
+        import joblib
+
+        directory = self._dir(stage.name)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f'{key}.pkl'
+        joblib.dump(output, f'{path}.tmp')
+        os.replace(f'{path}.tmp', path)
+        meta = {'stage': stage.name, 'key': key, 'content': content, 'params': stage.params,
+                'seconds': seconds, 'created': pd.Timestamp.now().isoformat()}
+        with open(directory / f'{key}.json.tmp', 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False, default=repr)
+        os.replace(directory / f'{key}.json.tmp', directory / f'{key}.json')
+        return path
+
+    def _output(self, result: _Result):
+        """Output of a finished stage, loaded from disk on first use."""
+        with self._lock:
+            if not result.loaded:
+                import joblib
+
+                result.output = joblib.load(result.path)
+                result.loaded = True
+            return result.output
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+    def _execute(self, stage: Stage, upstream: list, force: bool) -> _Result:
+        key = stage.key([result.content for result in upstream])
+        if not stage.volatile and not force:
+            meta = self._meta(stage.name, key)
+            if meta is not None:
+                return _Result(stage.name, key, meta['content'], 'cached', 0.0,
+                               self._dir(stage.name) / f'{key}.pkl')
+
+        inputs = [self._output(result) for result in upstream]
+        start = time.perf_counter()
+        if stage.process:
+            output = self._process_pool.submit(stage.func, *inputs, **stage.params).result()
+        else:
+            output = stage.func(*inputs, **stage.params)
+        seconds = time.perf_counter() - start
+
+        content = content_hash(output)
+        path = self._save(stage, key, output, content, seconds)
+        return _Result(stage.name, key, content, 'ran', seconds, path, output, loaded=True)
+
+    def run(self, targets: Optional[Sequence[str]] = None, force: Sequence[str] = ()) -> dict:
+        """
+        Run the stages needed for ``targets`` (default: every stage without
+        dependents), skipping those whose key is already stored.
+
+        Args:
+            targets: Stage names whose outputs are returned.
+            force: Stage names to recompute even if stored.
+
+        Returns:
+            dict: target -> output. Per-stage status ('ran' / 'cached'), key and
+                  seconds are in ``report_``.
+        """
+        targets = list(targets) if targets is not None else self._sinks()
+        order = self._required(targets)
+        force = set(force)
+        results = {}
+        pending = list(order)
+        running = {}
+
+        if any(self.stages[name].process for name in order):
+            self._process_pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                while pending or running:
+                    # 입력이 모두 준비된 단계는 바로 제출 (독립 분기는 동시에 실행)
+                    for name in [n for n in pending if all(dep in results for dep in self.stages[n].inputs)]:
+                        stage = self.stages[name]
+                        upstream = [results[dep] for dep in stage.inputs]
+                        running[pool.submit(self._execute, stage, upstream, name in force)] = name
+                        pending.remove(name)
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        name = running.pop(future)
+                        try:
+                            results[name] = future.result()
+                        except Exception as e:
+                            pending.clear()
+                            raise RuntimeError(f"단계 실패: {name}") from e
+                        if instrument.enabled():
+                            result = results[name]
+                            instrument.record('dag', stage=name, status=result.status, key=result.key,
+                                              duration=result.seconds)
+        finally:
+            if self._process_pool is not None:
+                self._process_pool.shutdown()
+                self._process_pool = None
+
+        self.report_ = pd.DataFrame([
+            {'stage': name, 'status': results[name].status, 'key': results[name].key,
+             'content': results[name].content[:12], 'seconds': results[name].seconds}
+            for name in order
+        ])
+        return {name: self._output(results[name]) for name in targets}
+
+    def prune(self) -> int:
+        """Delete stored outputs not produced or reused by the last run(). Returns files removed."""
+        if self.report_ is None:
+            raise ValueError("run()을 먼저 실행하세요.")
+        keep = dict(zip(self.report_['stage'], self.report_['key']))
+        removed = 0
+        for name, key in keep.items():
+            for path in self._dir(name).glob('*'):
+                if path.name.split('.')[0] != key:
+                    path.unlink()
+                    removed += 1
+        return removed
+
+
+# ----------------------------------------------------------------------
+# Water -> station split -> month_dam_add -> log_scale -> SARIMAX
+# ----------------------------------------------------------------------
+def split_station(water_df: pd.DataFrame, station: str, station_col: str = '총량지점명') -> pd.DataFrame:
+    """One station indexed by 일자, as the notebooks build mulgeum_df / geumgok_df."""
+    return water_df[water_df[station_col] == station].set_index('일자').dropna()
+
+
+def month_dam_add(water_df: pd.DataFrame, dam_df: pd.DataFrame, stats: Sequence[str] = ('mean',),
+                  dropna: Optional[str] = 'any') -> pd.DataFrame:
+    from function.add_dam import Add_Dam
+
+    return Add_Dam().month_dam_add(water_df, dam_df, stats=tuple(stats), dropna=dropna).set_index('일자')
+
+
+def log_scale(month_df: pd.DataFrame, test_size: float = 0.2, log_cols: Optional[Sequence[str]] = None) -> tuple:
+    from function.add_dam import Add_Dam
+
+    return Add_Dam().log_scale(month_df, test_size=test_size,
+                               log_cols=list(log_cols) if log_cols is not None else None)
+
+
+def fit_sarimax(scaled: tuple, order: Sequence[int] = (1, 1, 1),
+                seasonal_order: Sequence[int] = (1, 0, 0, 12), trend: str = 'c') -> dict:
+    """
+    SARIMAX on log_scale output (the notebooks' model step) scored on the test split.
+
+    Returns:
+        dict: results (fitted), rmse and mae on the test split.
+    """
+    import warnings
+
+    from statsmodels.tsa.statespace.sarimax import SARIMAX
+
+    xtrain, xtest, ytrain, ytest = scaled
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        results = SARIMAX(np.asarray(ytrain, dtype=float), exog=xtrain, order=tuple(order),
+                          seasonal_order=tuple(seasonal_order), trend=trend,
+                          enforce_stationarity=False, enforce_invertibility=False).fit(disp=False)
+    error = np.asarray(results.forecast(steps=len(ytest), exog=xtest)) - np.asarray(ytest, dtype=float)
+    return {'results': results, 'rmse': float(np.sqrt(np.mean(error ** 2))),
+            'mae': float(np.mean(np.abs(error)))}
+
+
+def water_dag(water, stations: Sequence[str] = ('물금', '금곡'), years: Iterable[int] = range(2021, 2026),
+              stats: Sequence[str] = ('mean',), dropna: Optional[str] = 'any', test_size: float = 0.2,
+              log_cols: Optional[Sequence[str]] = None, order: Sequence[int] = (1, 1, 1),
+              seasonal_order: Sequence[int] = (1, 0, 0, 12), trend: str = 'c', refresh: bool = True,
+              cache_dir: str = 'data/dag', max_workers: Optional[int] = None) -> DAG:
+    """
+    The Water.api_data -> station split -> month_dam_add -> log_scale -> SARIMAX
+    chain as a DAG with one branch per station ('model/<station>' targets).
+
+    Args:
+        water: Water (or mock_water) instance used by the fetch stages.
+        refresh: Re-fetch water / dam data on every run (cheap with a cache_dir
+                on Water). If False, fetches are cached by their parameters.
+    """
+    stations = list(stations)
+    years = [int(year) for year in years]
+    dag = DAG(cache_dir, max_workers=max_workers)
+
+    def fetch_water(stations, years):
+        return water.scan().where(station=stations, years=years).collect()
+
+    def fetch_dam():
+        return water.dam()
+
+    dag.add('water', fetch_water, params={'stations': stations, 'years': years}, volatile=refresh)
+    dag.add('dam', fetch_dam, volatile=refresh)
+    for station in stations:
+        dag.add(f'water/{station}', split_station, inputs=['water'], params={'station': station})
+        dag.add(f'month/{station}', month_dam_add, inputs=[f'water/{station}', 'dam'],
+                params={'stats': list(stats), 'dropna': dropna})
+        dag.add(f'scaled/{station}', log_scale, inputs=[f'month/{station}'],
+                params={'test_size': test_size, 'log_cols': list(log_cols) if log_cols is not None else None})
+        dag.add(f'model/{station}', fit_sarimax, inputs=[f'scaled/{station}'],
+                params={'order': list(order), 'seasonal_order': list(seasonal_order), 'trend': trend},
+                process=True)
+    return dag
@@ -0,0 +1,284 @@
+"""Streaming algal-bloom early warning with constant-size state per station."""
+import json
+import math
+import os
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Iterable, Mapping, Optional, Sequence
+
+import pandas as pd
+
+from function.risk import resolve_scheme
+
+
+DEFAULT_COLUMNS = ('클로로필-a', '수온', '유량')
+DEFAULT_LOG_COLS = ('클로로필-a', '유량')
+
+
+class _ColumnState:
+    """EWMA and Welford running moments of one column (a few floats)."""
+
+    __slots__ = ('ewm_mean', 'ewm_var', 'n', 'mean', 'm2')
+
+    def __init__(self, ewm_mean: float = math.nan, ewm_var: float = 0.0, n: int = 0,
+                 mean: float = 0.0, m2: float = 0.0) -> None:
+        self.ewm_mean = ewm_mean
+        self.ewm_var = ewm_var
+        self.n = n
+        self.mean = mean
+        self.m2 = m2
+
+    def update(self, x: float, alpha: float) -> float:
+        """
+        Add one value and return its z-score against the EWMA state before the update.
+        """
+        # Welford (전체 기간 평균 / 분산)
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+
+        if self.n == 1:
+            self.ewm_mean = x
+            return math.nan
+        diff = x - self.ewm_mean
+        score = diff / math.sqrt(self.ewm_var) if self.ewm_var > 0 else math.nan
+        # 지수가중 평균 / 분산 (West 1979 증분식)
+        increment = alpha * diff
+        self.ewm_mean += increment
+        self.ewm_var = (1 - alpha) * (self.ewm_var + diff * increment)
+        return score
+
+    @property
+    def var(self) -> float:
+        return self.m2 / (self.n - 1) if self.n > 1 else math.nan
+
+    def to_list(self) -> list:
+        return [self.ewm_mean, self.ewm_var, self.n, self.mean, self.m2]
+
+
+class BloomDetector:
+    """
+    Online 클로로필-a risk / anomaly detector fed one record at a time.
+
+    Every station keeps only the last record date, the last risk class and,
+    per monitored column, an EWMA mean / variance (recent level) and a
+    Welford mean / variance (whole history). Each record is O(1) work,
+    whatever the length of the history behind it.
+
+    Two kinds of alerts are emitted:
+
+        risk     클로로필-a moved to another RISK_SCHEMES class (up or down),
+                 or a station's first reading is above the lowest class
+        anomaly  |z| >= z_threshold, where z is the record's deviation from
+                 the station's EWMA state before the record (log1p for
+                 log_cols), once ``warmup`` values have been seen
+
+        detector = BloomDetector()
+        for record in stream:                     # Water.RENAME_MAP 형식
+            for alert in detector.update(record):
+                notify(alert)
+        detector.checkpoint('data/detector.json')
+        ...
+        detector = BloomDetector.restore('data/detector.json')
+    """
+
+    def __init__(self, columns: Sequence[str] = DEFAULT_COLUMNS, alpha: float = 0.1,
+                 z_threshold: float = 3.0, warmup: int = 8, scheme: str = 'project',
+                 thresholds: Optional[Sequence[float]] = None, labels: Optional[Sequence[str]] = None,
+                 right: Optional[bool] = None, log_cols: Sequence[str] = DEFAULT_LOG_COLS,
+                 target: str = '클로로필-a', station_col: str = '총량지점명',
+                 date_col: str = '일자') -> None:
+        """
+        Args:
+            columns: Columns tracked for anomaly scores.
+            alpha: EWMA smoothing factor (weight of the newest value).
+            z_threshold: |z| at which an anomaly alert is emitted.
+            warmup: Values per station and column before anomalies are scored.
+            scheme, thresholds, labels, right: Risk classes of ``target``
+                   (see function.risk.label_risk).
+            log_cols: Columns scored on log1p scale (skewed, like Add_Dam.log_scale).
+        """
+        if not 0 < alpha <= 1:
+            raise ValueError(f"alpha는 0과 1 사이여야 합니다: {alpha}")
+        thresholds, labels, right = resolve_scheme(scheme, thresholds, labels, right)
+        self.columns = list(columns)
+        self.alpha = float(alpha)
+        self.z_threshold = float(z_threshold)
+        self.warmup = int(warmup)
+        self.scheme = scheme
+        self.thresholds = [float(t) for t in thresholds]
+        self.labels = list(labels)
+        self.right = bool(right)
+        self.log_cols = [col for col in log_cols if col in self.columns]
+        self.target = target
+        self.station_col = station_col
+        self.date_col = date_col
+        # 지점 -> {'date': Timestamp, 'risk': int, 'columns': {col: _ColumnState}}
+        self._state = {}
+
+    # ------------------------------------------------------------------
+    # Streaming
+    # ------------------------------------------------------------------
+    def _risk_code(self, value: float) -> int:
+        # risk.risk_codes와 같은 경계 규칙 (스칼라 하나라 bisect 사용)
+        return (bisect_left if self.right else bisect_right)(self.thresholds, value)
+
+    @staticmethod
+    def _value(record: Mapping, column: str) -> float:
+        value = record.get(column)
+        if value is None or value == '':
+            return math.nan
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return math.nan
+
+    def update(self, record: Mapping) -> list:
+        """
+        Consume one record (dict or Series in the Water.RENAME_MAP schema).
+
+        Records older than the station's last date are ignored.
+
+        Returns:
+            list: Alert dicts with 총량지점명, 일자, type ('risk' / 'anomaly'),
+                  column, value, score, level and previous.
+        """
+        station = record.get(self.station_col)
+        date = pd.Timestamp(record.get(self.date_col))
+        if station is None or pd.isna(date):
+            return []
+
+        state = self._state.get(station)
+        if state is None:
+            state = self._state[station] = {
+                'date': date, 'risk': -1, 'columns': {col: _ColumnState() for col in self.columns},
+            }
+        elif date < state['date']:
+            return []
+        state['date'] = date
+
+        alerts = []
+        for col in self.columns:
+            value = self._value(record, col)
+            if math.isnan(value):
+                continue
+            column_state = state['columns'][col]
+            score = column_state.update(math.log1p(max(value, 0.0)) if col in self.log_cols else value,
+                                        self.alpha)
+            if column_state.n > self.warmup and not math.isnan(score) and abs(score) >= self.z_threshold:
+                alerts.append(self._alert(station, date, 'anomaly', col, value, score, state['risk']))
+
+            if col == self.target:
+                code = self._risk_code(value)
+                if code != state['risk']:
+                    previous, state['risk'] = state['risk'], code
+                    # 지점의 첫 측정이 이미 최저 등급보다 높으면 그것도 알림
+                    if previous >= 0 or code > 0:
+                        alerts.append(self._alert(station, date, 'risk', col, value, score, code, previous))
+        return alerts
+
+    def _alert(self, station, date, kind: str, column: str, value: float, score: float,
+               risk: int, previous: int = -1) -> dict:
+        return {
+            self.station_col: station, self.date_col: date, 'type': kind, 'column': column,
+            'value': value, 'score': score,
+            'level': self.labels[risk] if risk >= 0 else None,
+            'previous': self.labels[previous] if previous >= 0 else None,
+        }
+
+    def update_many(self, records) -> pd.DataFrame:
+        """
+        Consume a micro-batch in order (DataFrame, sorted by 일자 per station,
+        or an iterable of record dicts).
+
+        Returns:
+            pd.DataFrame: Alerts of the whole batch.
+        """
+        if isinstance(records, pd.DataFrame):
+            records = records.to_dict('records')
+        alerts = []
+        for record in records:
+            alerts.extend(self.update(record))
+        return pd.DataFrame(alerts, columns=[self.station_col, self.date_col, 'type', 'column',
+                                             'value', 'score', 'level', 'previous'])
+
+    # ------------------------------------------------------------------
+    # Inspection
+    # ------------------------------------------------------------------
+    @property
+    def stations(self) -> list:
+        return list(self._state)
+
+    def snapshot(self) -> pd.DataFrame:
+        """One row per (station, column) with the current EWMA / Welford state."""
+        rows = []
+        for station, state in self._state.items():
+            for col, column_state in state['columns'].items():
+                rows.append({
+                    self.station_col: station, 'column': col, self.date_col: state['date'],
+                    'level': self.labels[state['risk']] if state['risk'] >= 0 else None,
+                    'n': column_state.n, 'ewm_mean': column_state.ewm_mean,
+                    'ewm_std': math.sqrt(column_state.ewm_var),
+                    'mean': column_state.mean if column_state.n else math.nan,
+                    'std': math.sqrt(column_state.var) if column_state.n > 1 else math.nan,
+                    'log_scale': col in self.log_cols,
+                })
+        return pd.DataFrame(rows)
+
+    # ------------------------------------------------------------------
+    # Checkpoint / restore
+    # ------------------------------------------------------------------
+    def to_dict(self) -> dict:
+        return {
+            'config': {
+                'columns': self.columns, 'alpha': self.alpha, 'z_threshold': self.z_threshold,
+                'warmup': self.warmup, 'scheme': self.scheme, 'thresholds': self.thresholds,
+                'labels': self.labels, 'right': self.right, 'log_cols': self.log_cols,
+                'target': self.target, 'station_col': self.station_col, 'date_col': self.date_col,
+            },
+            'stations': {
+                str(station): {
+                    'date': state['date'].isoformat(), 'risk': state['risk'],
+                    'columns': {col: s.to_list() for col, s in state['columns'].items()},
+                }
+                for station, state in self._state.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'BloomDetector':
+        detector = cls(**data['config'])
+        for station, state in data['stations'].items():
+            detector._state[station] = {
+                'date': pd.Timestamp(state['date']), 'risk': int(state['risk']),
+                'columns': {col: _ColumnState(*values) for col, values in state['columns'].items()},
+            }
+        return detector
+
+    def checkpoint(self, path: str) -> None:
+        """Write the state as JSON (atomically, so a crash keeps the previous checkpoint)."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def restore(cls, path: str) -> 'BloomDetector':
+        with open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+def replay(df: pd.DataFrame, detector: Optional[BloomDetector] = None,
+           stations: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    Run a detector over historical rows in date order (e.g. Water.api_data output).
+
+    Returns:
+        pd.DataFrame: All alerts the stream would have raised.
+    """
+    detector = detector or BloomDetector()
+    if stations is not None:
+        df = df[df[detector.station_col].isin(list(stations))]
+    return detector.update_many(df.sort_values(detector.date_col, kind='stable'))
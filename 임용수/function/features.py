@@ -0,0 +1,150 @@
+"""Time-based lag, rolling and seasonal features for per-station water quality series."""
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from function.add_dam import Add_Dam
+
+
+STATION_COL = '총량지점명'
+DATE_COL = '일자'
+
+
+def _check_columns(df: pd.DataFrame, columns: Sequence[str], station_col: str, date_col: str) -> list:
+    required = [station_col, date_col]
+    missing = [col for col in required if col not in df.columns]
+    if missing:
+        raise ValueError(f"필수 컬럼이 없습니다: {missing}")
+    if columns is None:
+        columns = Add_Dam.WATER_COLUMNS
+    return [col for col in columns if col in df.columns]
+
+
+def lag_features(df: pd.DataFrame, columns: Optional[Sequence[str]] = None,
+                 lags: Sequence[str] = ('7D',), tolerance: Optional[str] = None,
+                 station_col: str = STATION_COL, date_col: str = DATE_COL) -> pd.DataFrame:
+    """
+    Time-based lags: the station's latest value at or before ``일자 - lag``.
+
+    Unlike ``.shift(1)``, the lag is measured in time, so unevenly spaced
+    samples get a true 7-day (or 30-day, ...) lag. Each lag is one
+    pd.merge_asof over all stations and columns at once.
+
+    Args:
+        df: Long-format frame with station and date columns.
+        columns: Columns to lag. Defaults to Add_Dam.WATER_COLUMNS.
+        lags: Pandas offset strings, e.g. ('7D', '30D').
+        tolerance: Maximum age of the matched observation, e.g. '14D'.
+                  Older matches become NaN.
+
+    Returns:
+        pd.DataFrame: '<col>_lag_<lag>' columns aligned with df's rows.
+    """
+    columns = _check_columns(df, columns, station_col, date_col)
+    row_id = np.arange(len(df))
+
+    right = (df[[station_col, date_col] + columns]
+             .dropna(subset=[date_col])
+             .rename(columns={date_col: '_key'})
+             .sort_values('_key', kind='stable'))
+
+    frames = []
+    for lag in lags:
+        left = pd.DataFrame({
+            station_col: df[station_col].array,
+            '_key': pd.to_datetime(df[date_col]).to_numpy() - pd.Timedelta(lag),
+            '_row': row_id,
+        }).dropna(subset=['_key']).sort_values('_key', kind='stable')
+
+        merged = pd.merge_asof(
+            left, right, on='_key', by=station_col, direction='backward',
+            tolerance=pd.Timedelta(tolerance) if tolerance is not None else None,
+        )
+        lagged = merged.set_index('_row')[columns].reindex(row_id)
+        lagged.columns = [f'{col}_lag_{lag}' for col in columns]
+        frames.append(lagged)
+
+    result = pd.concat(frames, axis=1)
+    result.index = df.index
+    return result
+
+
+def rolling_features(df: pd.DataFrame, columns: Optional[Sequence[str]] = None,
+                     windows: Sequence[str] = ('30D',), stats: Sequence[str] = ('mean', 'max'),
+                     station_col: str = STATION_COL, date_col: str = DATE_COL) -> pd.DataFrame:
+    """
+    Time-indexed rolling statistics per station (window ``(일자 - w, 일자]``).
+
+    Each window is one groupby(station).rolling(window, on=일자) pass that
+    computes every statistic for every column.
+
+    Returns:
+        pd.DataFrame: '<col>_<stat>_<window>' columns aligned with df's rows.
+    """
+    columns = _check_columns(df, columns, station_col, date_col)
+
+    ordered = pd.DataFrame({
+        station_col: df[station_col].to_numpy(),
+        date_col: pd.to_datetime(df[date_col]).to_numpy(),
+        **{col: df[col].to_numpy() for col in columns},
+    }).dropna(subset=[date_col])
+    ordered = ordered.sort_values([station_col, date_col], kind='stable')
+    grouped = ordered.groupby(station_col, sort=False, observed=True)
+
+    frames = []
+    for window in windows:
+        rolled = grouped.rolling(window, on=date_col)[columns].agg(list(stats))
+        # 결과는 (지점, 일자) index로 정렬 순서 그대로 나오므로 원래 행 번호를 다시 붙임
+        rolled.index = ordered.index
+        rolled.columns = [f'{col}_{stat}_{window}' for col, stat in rolled.columns]
+        frames.append(rolled)
+
+    result = pd.concat(frames, axis=1).reindex(np.arange(len(df)))
+    result.index = df.index
+    return result
+
+
+def seasonal_features(df: pd.DataFrame, date_col: str = DATE_COL) -> pd.DataFrame:
+    """
+    Calendar encodings: month / day-of-year sine-cosine pairs and the
+    notebooks' summer flag (6~9월).
+    """
+    dates = pd.to_datetime(df[date_col])
+    month = dates.dt.month
+    day_of_year = dates.dt.dayofyear
+
+    return pd.DataFrame({
+        '월': month,
+        '월_sin': np.sin(2 * np.pi * (month - 1) / 12),
+        '월_cos': np.cos(2 * np.pi * (month - 1) / 12),
+        '연중일_sin': np.sin(2 * np.pi * (day_of_year - 1) / 365.25),
+        '연중일_cos': np.cos(2 * np.pi * (day_of_year - 1) / 365.25),
+        '여름': month.isin([6, 7, 8, 9]).astype('int8'),
+    }, index=df.index)
+
+
+def build_features(df: pd.DataFrame, columns: Optional[Sequence[str]] = None,
+                   lags: Sequence[str] = ('7D', '30D'), windows: Sequence[str] = ('30D', '90D'),
+                   stats: Sequence[str] = ('mean', 'max'), seasonal: bool = True,
+                   tolerance: Optional[str] = None,
+                   station_col: str = STATION_COL, date_col: str = DATE_COL) -> pd.DataFrame:
+    """
+    Append lag, rolling and seasonal features to a long-format water frame.
+
+    All feature blocks are computed on the full multi-station frame and joined
+    with a single concat, instead of one column assignment (and copy) per
+    feature and station.
+
+    Returns:
+        pd.DataFrame: df with the feature columns appended.
+    """
+    blocks = [df]
+    if lags:
+        blocks.append(lag_features(df, columns, lags, tolerance, station_col, date_col))
+    if windows:
+        blocks.append(rolling_features(df, columns, windows, stats, station_col, date_col))
+    if seasonal:
+        calendar = seasonal_features(df, date_col)
+        blocks.append(calendar.drop(columns=[col for col in calendar.columns if col in df.columns]))
+    return pd.concat(blocks, axis=1)
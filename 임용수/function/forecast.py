@@ -0,0 +1,298 @@
+"""Persisted per-station SARIMAX forecasters with incremental updates."""
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from function.add_dam import Add_Dam
+
+
+class StationForecaster:
+    """
+    SARIMAX model of one station plus the log_scale preprocessing state.
+
+    fit() applies the Add_Dam.log_scale steps (date sort, log1p, X/y split,
+    standard scaling) to the whole history and keeps the scaler mean / std,
+    so later data is transformed exactly like the training data. update()
+    appends new months to the fitted state with ``results.append(refit=False)``
+    instead of re-estimating the parameters.
+
+    Rows are assumed to be consecutive months (month_dam_add output).
+    """
+
+    def __init__(self, order=(1, 1, 1), seasonal_order=(1, 0, 0, 12), trend: str = 'c',
+                 log_cols: Optional[Sequence[str]] = None) -> None:
+        self.order = tuple(order)
+        self.seasonal_order = tuple(seasonal_order)
+        self.trend = trend
+        self.log_cols = list(log_cols) if log_cols is not None else list(Add_Dam.LOG_COLUMNS)
+        self.feature_names = None
+        self.target_name = None
+        self.mean_ = None
+        self.scale_ = None
+        self.dates_ = None
+        self.results_ = None
+
+    # ------------------------------------------------------------------
+    # Preprocessing
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _by_date(df: pd.DataFrame) -> pd.DataFrame:
+        """month_dam_add output ('일자' column) or a frame indexed by date, sorted by date."""
+        if '일자' in df.columns:
+            df = df.set_index('일자')
+        return Add_Dam()._sort_by_date(df.copy())
+
+    def _transform(self, df: pd.DataFrame, with_target: bool = True) -> tuple:
+        """(dates, scaled X, y) using the stored scaler state."""
+        ad = Add_Dam()
+        df = ad._apply_log_transform(df, self.log_cols, inplace=True)
+        missing = [col for col in self.feature_names if col not in df.columns]
+        if missing:
+            raise ValueError(f"필수 컬럼이 없습니다: {missing}")
+        X = (df[self.feature_names].to_numpy(dtype=float) - self.mean_) / self.scale_
+        y = df[self.target_name].to_numpy(dtype=float) if with_target else None
+        return df.index, X, y
+
+    @property
+    def log_target(self) -> bool:
+        return self.target_name in self.log_cols
+
+    @property
+    def last_date(self) -> Optional[pd.Timestamp]:
+        return self.dates_[-1] if self.dates_ is not None and len(self.dates_) else None
+
+    # ------------------------------------------------------------------
+    # Fit / update / forecast
+    # ------------------------------------------------------------------
+    def fit(self, df: pd.DataFrame) -> 'StationForecaster':
+        """
+        Fit on the full history (last column = target, as in log_scale).
+        """
+        from statsmodels.tsa.statespace.sarimax import SARIMAX
+
+        ad = Add_Dam()
+        df = self._by_date(df)
+        X, y = ad._split_features_target(ad._apply_log_transform(df.copy(), self.log_cols))
+        self.feature_names = list(X.columns)
+        self.target_name = y.name
+
+        self.mean_, self.scale_ = Add_Dam.fit_scaler(X)
+
+        dates, X_scaled, y = self._transform(df)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            self.results_ = SARIMAX(
+                y, exog=X_scaled, order=self.order, seasonal_order=self.seasonal_order,
+                trend=self.trend, enforce_stationarity=False, enforce_invertibility=False,
+            ).fit(disp=False)
+        self.dates_ = pd.DatetimeIndex(dates)
+        return self
+
+    def update(self, df: pd.DataFrame) -> int:
+        """
+        Append the months after last_date to the fitted state (no parameter refit).
+
+        Args:
+            df: Frame with the training columns; rows up to last_date are ignored,
+               so the full history can be passed.
+
+        Returns:
+            int: Number of months appended.
+        """
+        if self.results_ is None:
+            raise ValueError("fit()을 먼저 실행하세요.")
+        df = self._by_date(df)
+        df = df[df.index > self.last_date]
+        if df.empty:
+            return 0
+
+        dates, X, y = self._transform(df)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            self.results_ = self.results_.append(y, exog=X, refit=False)
+        self.dates_ = self.dates_.append(pd.DatetimeIndex(dates))
+        return len(df)
+
+    def _future_exog(self, steps: int, exog: Optional[pd.DataFrame]) -> np.ndarray:
+        """Scaled future exog: given rows, or the calendar-month mean of the history."""
+        if exog is not None:
+            if len(exog) < steps:
+                raise ValueError(f"exog 행 수({len(exog)})가 예측 기간({steps})보다 적습니다.")
+            exog = exog.iloc[:steps].copy()
+            exog[self.target_name] = np.nan
+            return self._transform(exog, with_target=False)[1]
+
+        history = np.asarray(self.results_.model.exog)
+        months = self.dates_.month.to_numpy()
+        climatology = {m: history[months == m].mean(axis=0) for m in np.unique(months)}
+        fallback = history.mean(axis=0)
+        return np.vstack([climatology.get(date.month, fallback) for date in self.future_dates(steps)])
+
+    def future_dates(self, steps: int) -> pd.DatetimeIndex:
+        return pd.date_range(self.last_date + pd.offsets.MonthBegin(1), periods=steps, freq='MS')
+
+    def forecast(self, steps: int = 3, exog: Optional[pd.DataFrame] = None,
+                 alpha: float = 0.05) -> pd.DataFrame:
+        """
+        Multi-horizon forecast after last_date.
+
+        Args:
+            steps: Months ahead.
+            exog: Future feature rows (original units, training feature columns).
+                 If None, each month uses the historical mean of that calendar
+                 month's features.
+            alpha: 1 - confidence level of the interval.
+
+        Returns:
+            pd.DataFrame: index 일자, columns forecast / lower / upper in the
+                          target's original units (expm1 for log1p targets).
+        """
+        if self.results_ is None:
+            raise ValueError("fit()을 먼저 실행하세요.")
+        frame = self.results_.get_forecast(steps=steps, exog=self._future_exog(steps, exog)) \
+            .summary_frame(alpha=alpha)
+        values = frame[['mean', 'mean_ci_lower', 'mean_ci_upper']].to_numpy()
+        if self.log_target:
+            values = np.expm1(values)
+        return pd.DataFrame(values, columns=['forecast', 'lower', 'upper'],
+                            index=self.future_dates(steps).rename('일자'))
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def save(self, path: str) -> None:
+        import joblib
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f'{path}.tmp'
+        joblib.dump(self, tmp_path)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'StationForecaster':
+        import joblib
+
+        return joblib.load(path)
+
+
+def _fit_station(task: tuple) -> tuple:
+    station, df, kwargs = task
+    return station, StationForecaster(**kwargs).fit(df)
+
+
+class ForecastRegistry:
+    """
+    Directory of StationForecaster files, one per station:
+
+        <model_dir>/<station>.pkl
+
+        registry = ForecastRegistry('models/sarimax')
+        registry.fit({'물금': mulgeum_df, '금곡': geumgok_df}, orders=search.best())
+        ...
+        registry.update({'물금': mulgeum_df, '금곡': geumgok_df})   # 새 달 반영 (재학습 없음)
+        registry.forecast(steps=6)
+    """
+
+    DEFAULT_MODEL_DIR = 'data/models/sarimax'
+
+    def __init__(self, model_dir: str = DEFAULT_MODEL_DIR) -> None:
+        self.root = Path(model_dir)
+
+    def _path(self, station: str) -> Path:
+        return self.root / f'{station}.pkl'
+
+    def stations(self) -> list:
+        return sorted(path.stem for path in self.root.glob('*.pkl'))
+
+    def load(self, station: str) -> StationForecaster:
+        path = self._path(station)
+        if not path.exists():
+            raise FileNotFoundError(f"저장된 모델이 없습니다: {path}")
+        return StationForecaster.load(str(path))
+
+    def fit(self, frames: Mapping[str, pd.DataFrame], orders=None, trend: str = 'c',
+            log_cols: Optional[Sequence[str]] = None, max_workers: Optional[int] = None) -> dict:
+        """
+        Fit and save one model per station in parallel (the only full fit).
+
+        Args:
+            frames: station -> month_dam_add result.
+            orders: (order, seasonal_order) for every station, a dict
+                   station -> (order, seasonal_order), or OrderSearch.best()
+                   (series named '<station>/<target>'). Defaults to
+                   ((1, 1, 1), (1, 0, 0, 12)).
+
+        Returns:
+            dict: station -> StationForecaster (empty when frames is empty).
+        """
+        tasks = []
+        for station, df in frames.items():
+            order, seasonal_order = self._order_for(station, orders)
+            kwargs = {'order': order, 'seasonal_order': seasonal_order, 'trend': trend, 'log_cols': log_cols}
+            tasks.append((station, df, kwargs))
+        if not tasks:
+            # 학습할 지점이 없으면 프로세스 풀을 만들지 않음 (max_workers=0은 ValueError)
+            return {}
+
+        with ProcessPoolExecutor(max_workers=max_workers or min(len(tasks), os.cpu_count() or 1)) as pool:
+            fitted = dict(pool.map(_fit_station, tasks))
+        for station, model in fitted.items():
+            model.save(str(self._path(station)))
+        return fitted
+
+    @staticmethod
+    def _order_for(station: str, orders) -> tuple:
+        if orders is None:
+            return (1, 1, 1), (1, 0, 0, 12)
+        if isinstance(orders, pd.DataFrame):
+            rows = orders[orders['series'].astype(str).str.split('/').str[0] == station]
+            if rows.empty:
+                raise ValueError(f"{station}의 차수가 없습니다.")
+            return tuple(rows.iloc[0]['order']), tuple(rows.iloc[0]['seasonal_order'])
+        if isinstance(orders, Mapping):
+            return orders[station]
+        return orders
+
+    def update(self, frames: Mapping[str, pd.DataFrame]) -> dict:
+        """
+        Append new months to each saved model and save it again.
+
+        Returns:
+            dict: station -> number of months appended.
+        """
+        appended = {}
+        for station, df in frames.items():
+            model = self.load(station)
+            appended[station] = model.update(df)
+            if appended[station]:
+                model.save(str(self._path(station)))
+        return appended
+
+    def forecast(self, steps: int = 3, stations: Optional[Sequence[str]] = None,
+                 exog: Optional[Mapping[str, pd.DataFrame]] = None, alpha: float = 0.05) -> pd.DataFrame:
+        """
+        Forecast every saved station in one call.
+
+        Args:
+            steps: Months ahead.
+            stations: Stations to forecast. Defaults to every saved model.
+            exog: Optional station -> future feature rows (see StationForecaster.forecast).
+            alpha: 1 - confidence level of the interval.
+
+        Returns:
+            pd.DataFrame: Long format with 지점, 일자, horizon, forecast, lower, upper.
+        """
+        frames = []
+        for station in stations or self.stations():
+            frame = self.load(station).forecast(steps, (exog or {}).get(station), alpha).reset_index()
+            frame.insert(0, '지점', station)
+            frame.insert(2, 'horizon', np.arange(1, len(frame) + 1))
+            frames.append(frame)
+        if not frames:
+            raise ValueError("저장된 모델이 없습니다.")
+        return pd.concat(frames, ignore_index=True)
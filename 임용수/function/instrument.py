@@ -0,0 +1,186 @@
+"""Stage-level timing / profiling hooks for Water and Add_Dam.
+
+Instrumentation is off until a sink is registered; while no sink is
+registered, instrumented methods call straight through after a single
+list check.
+
+    from function import instrument
+    collector = instrument.MemorySink()
+    instrument.add_sink(collector)
+    ...
+    collector.to_frame()
+"""
+import functools
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+import pandas as pd
+
+
+_sinks = []
+_sinks_lock = threading.Lock()
+
+
+def add_sink(sink: Callable[[dict], None]) -> Callable[[dict], None]:
+    """Register a sink (any callable taking an event dict) and enable instrumentation."""
+    with _sinks_lock:
+        _sinks.append(sink)
+    return sink
+
+
+def remove_sink(sink: Callable[[dict], None]) -> None:
+    with _sinks_lock:
+        if sink in _sinks:
+            _sinks.remove(sink)
+
+
+def clear_sinks() -> None:
+    """Remove every sink, disabling instrumentation."""
+    with _sinks_lock:
+        _sinks.clear()
+
+
+def enabled() -> bool:
+    return bool(_sinks)
+
+
+def emit(event: dict) -> None:
+    """Send an event to every registered sink."""
+    for sink in tuple(_sinks):
+        sink(event)
+
+
+def record(name: str, **fields) -> None:
+    """Emit a point event (e.g. one HTTP request) if instrumentation is enabled."""
+    if _sinks:
+        emit({'stage': name, 'timestamp': time.time(), **fields})
+
+
+def _count_rows(value) -> Optional[int]:
+    """Row count of a DataFrame / Series / list, or of the first one inside a tuple / dict."""
+    if isinstance(value, (pd.DataFrame, pd.Series, list)):
+        return len(value)
+    if isinstance(value, tuple):
+        for item in value:
+            if isinstance(item, (pd.DataFrame, pd.Series)):
+                return len(item)
+    if isinstance(value, dict):
+        counts = [_count_rows(item) for item in value.values()]
+        counts = [count for count in counts if count is not None]
+        return sum(counts) if counts else None
+    return None
+
+
+@contextmanager
+def stage(name: str, **fields):
+    """
+    Time a block of code and emit one event when it finishes.
+
+    The yielded dict can be updated inside the block (e.g. rows_out, bytes).
+    When instrumentation is disabled the block runs with a throwaway dict.
+    """
+    event = {'stage': name, **fields}
+    if not _sinks:
+        yield event
+        return
+
+    event['timestamp'] = time.time()
+    start = time.perf_counter()
+    try:
+        yield event
+    except Exception as e:
+        event['error'] = f'{type(e).__name__}: {e}'
+        raise
+    finally:
+        event['duration'] = time.perf_counter() - start
+        emit(event)
+
+
+def instrumented(name: Optional[str] = None) -> Callable:
+    """
+    Decorator emitting duration and input / output row counts for a function.
+
+    rows_in is the row count of the first DataFrame / list argument and
+    rows_out the row count of the result.
+    """
+    def decorator(func: Callable) -> Callable:
+        stage_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _sinks:
+                return func(*args, **kwargs)
+
+            rows_in = None
+            for arg in (*args, *kwargs.values()):
+                if isinstance(arg, (pd.DataFrame, list)):
+                    rows_in = len(arg)
+                    break
+
+            with stage(stage_name, rows_in=rows_in) as event:
+                result = func(*args, **kwargs)
+                event['rows_out'] = _count_rows(result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+# ----------------------------------------------------------------------
+# Sinks
+# ----------------------------------------------------------------------
+class LoggingSink:
+    """Write events to a logger as JSON."""
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.INFO) -> None:
+        self.logger = logger or logging.getLogger('function.instrument')
+        self.level = level
+
+    def __call__(self, event: dict) -> None:
+        self.logger.log(self.level, json.dumps(event, ensure_ascii=False, default=str))
+
+
+class JsonLinesSink:
+    """Append events to a JSON Lines file."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def __call__(self, event: dict) -> None:
+        line = json.dumps(event, ensure_ascii=False, default=str)
+        with self._lock, open(self.path, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
+
+
+class MemorySink:
+    """Keep events in memory; to_frame() / summary() for analysis."""
+
+    def __init__(self) -> None:
+        self.events = []
+        self._lock = threading.Lock()
+
+    def __call__(self, event: dict) -> None:
+        with self._lock:
+            self.events.append(event)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.events.clear()
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.events)
+
+    def summary(self) -> pd.DataFrame:
+        """Call count and total / mean / max duration per stage, slowest first."""
+        df = self.to_frame()
+        if df.empty or 'duration' not in df.columns:
+            return pd.DataFrame()
+        return (df.groupby('stage')['duration']
+                .agg(['count', 'sum', 'mean', 'max'])
+                .sort_values('sum', ascending=False))
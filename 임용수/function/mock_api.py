@@ -0,0 +1,287 @@
+"""Offline stand-ins for the water quality and dam APIs.
+
+MockWaterAPI holds raw items (synthetic or recorded) and answers queries
+with the real response shapes:
+
+    water: {'getWaterMeasuringList': {'item': [...], 'totalCount': n}}
+    dam:   {'data': [...], 'matchCount': n, 'totalCount': n, ...}
+
+It can be served in-process (ReplayTransport, a drop-in for requests.Session)
+or over real HTTP on localhost (MockAPIServer):
+
+    api = MockWaterAPI.synthetic(n_stations=2, years=range(2021, 2026), page_size=100)
+    water = mock_water(api)                      # in-process
+    with MockAPIServer(api) as server:           # localhost HTTP
+        water = Water(api_key=MockWaterAPI.KEY, dam_api_key=MockWaterAPI.KEY,
+                      water_url=server.water_url, dam_url=server.dam_url)
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional, Sequence
+from urllib.parse import parse_qsl, urlsplit
+
+import numpy as np
+import requests
+
+
+# ----------------------------------------------------------------------
+# Synthetic data
+# ----------------------------------------------------------------------
+ITEM_KEYS = ['ITEM_TEMP', 'ITEM_PH', 'ITEM_EC', 'ITEM_DOC', 'ITEM_BOD', 'ITEM_COD', 'ITEM_SS',
+             'ITEM_TN', 'ITEM_TP', 'ITEM_TOC', 'ITEM_AMNT', 'ITEM_CLOA']
+
+
+def synthetic_stations(n_stations: int) -> dict:
+    """Station code -> name; the first two are the real 물금 / 금곡 codes."""
+    stations = {'2022A30': '물금', '2022A10': '금곡'}
+    for i in range(len(stations), n_stations):
+        stations[f'BENCH{i:03d}'] = f'지점{i:03d}'
+    return dict(list(stations.items())[:n_stations])
+
+
+def synthetic_water_items(stations: dict, years: Sequence[int], per_month: int = 4,
+                          seed: int = 0) -> list:
+    """Raw getWaterMeasuringList items (string values, like the real API)."""
+    rng = np.random.default_rng(seed)
+    items = []
+    for pt_no, name in stations.items():
+        for year in years:
+            for month in range(1, 13):
+                values = rng.gamma(2.0, 5.0, size=(per_month, len(ITEM_KEYS)))
+                for k in range(per_month):
+                    day = 1 + k * (28 // per_month)
+                    item = {
+                        'PT_NO': pt_no, 'PT_NM': name,
+                        'WMYR': str(year), 'WMOD': f'{month:02d}',
+                        'WMCYMD': f'{year}.{month:02d}.{day:02d}',
+                    }
+                    item.update({key: f'{v:.3f}' for key, v in zip(ITEM_KEYS, values[k])})
+                    items.append(item)
+    return items
+
+
+def synthetic_dam_items(years: Sequence[int], seed: int = 1) -> list:
+    """Raw odcloud dam items, one row per month."""
+    rng = np.random.default_rng(seed)
+    return [
+        {'날짜': f'{year}-{month:02d}-01',
+         '방류량(백만톤)': float(rng.gamma(3.0, 100.0)),
+         '강수량(밀리미터)': float(rng.gamma(2.0, 50.0))}
+        for year in years for month in range(1, 13)
+    ]
+
+
+# ----------------------------------------------------------------------
+# API model
+# ----------------------------------------------------------------------
+class MockWaterAPI:
+    """
+    In-memory model of both endpoints.
+
+    Args:
+        water_items: Raw getWaterMeasuringList items.
+        dam_items: Raw dam items.
+        latency: Seconds added to every request.
+        page_size: Upper bound on rows per page, regardless of numOfRows /
+                  perPage, to force multi-page responses.
+        fail_every: If > 0, every n-th request answers 503 (exercises retries).
+    """
+
+    KEY = 'mock-service-key'
+    WATER_PATH = '/getWaterMeasuringList'
+    DAM_PATH = '/dam'
+
+    def __init__(self, water_items: Optional[list] = None, dam_items: Optional[list] = None,
+                 latency: float = 0.0, page_size: Optional[int] = None, fail_every: int = 0) -> None:
+        self.water_items = water_items or []
+        self.dam_items = dam_items or []
+        self.latency = latency
+        self.page_size = page_size
+        self.fail_every = fail_every
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def synthetic(cls, n_stations: int = 2, years: Sequence[int] = range(2021, 2026),
+                  per_month: int = 4, **kwargs) -> 'MockWaterAPI':
+        years = list(years)
+        return cls(synthetic_water_items(synthetic_stations(n_stations), years, per_month),
+                   synthetic_dam_items(years), **kwargs)
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> 'MockWaterAPI':
+        """Load items saved with save() / record()."""
+        with open(path, encoding='utf-8') as f:
+            payload = json.load(f)
+        return cls(payload.get('water', []), payload.get('dam', []), **kwargs)
+
+    def save(self, path: str) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'water': self.water_items, 'dam': self.dam_items}, f, ensure_ascii=False)
+
+    @classmethod
+    def record(cls, water, path: str, year: str = '2021,2022,2023,2024,2025',
+               pt_no_list: Optional[str] = None, **kwargs) -> 'MockWaterAPI':
+        """
+        Download raw items through a live Water instance and save them for replay.
+
+        The saved file holds response items only (no service keys).
+        """
+        slices = water._build_water_slices(year, pt_no_list or water.DEFAULT_PT_NO_LIST, None)
+        water_items = water._fetch_water_items(slices)
+        dam_items = water._get_json(water.dam_url, {
+            'page': 1, 'perPage': 2000, 'serviceKey': water.dam_key, 'returnType': 'JSON',
+        }).get('data', [])
+        api = cls(water_items, dam_items, **kwargs)
+        api.save(path)
+        return api
+
+    def _page(self, rows: list, page: int, per_page: int) -> list:
+        if self.page_size:
+            per_page = min(per_page, self.page_size)
+        return rows[(page - 1) * per_page:page * per_page]
+
+    def respond(self, url: str, params: Optional[dict] = None) -> tuple:
+        """
+        Answer one GET request.
+
+        Returns:
+            tuple: (status_code, payload dict)
+        """
+        with self._lock:
+            self.calls += 1
+            call = self.calls
+        if self.latency:
+            time.sleep(self.latency)
+        if self.fail_every and call % self.fail_every == 0:
+            return 503, {'error': 'Service Unavailable'}
+
+        params = {key: str(value) for key, value in (params or {}).items()}
+        path = urlsplit(url).path.rstrip('/')
+
+        if path.endswith(self.WATER_PATH):
+            filters = [('PT_NO', 'ptNoList'), ('WMYR', 'wmyrList'), ('WMOD', 'wmodList')]
+            wanted = [(field, set(params[param].split(','))) for field, param in filters if param in params]
+            matched = [item for item in self.water_items
+                       if all(str(item.get(field)) in values for field, values in wanted)]
+            rows = self._page(matched, int(params.get('pageNo', 1)), int(params.get('numOfRows', 10)))
+            return 200, {'getWaterMeasuringList': {
+                'item': rows,
+                'numOfRows': len(rows),
+                'pageNo': int(params.get('pageNo', 1)),
+                'totalCount': len(matched),
+            }}
+
+        page, per_page = int(params.get('page', 1)), int(params.get('perPage', 10))
+        rows = self._page(self.dam_items, page, per_page)
+        return 200, {'currentCount': len(rows), 'data': rows, 'matchCount': len(self.dam_items),
+                     'page': page, 'perPage': per_page, 'totalCount': len(self.dam_items)}
+
+
+# ----------------------------------------------------------------------
+# In-process transport
+# ----------------------------------------------------------------------
+class MockResponse:
+    """Minimal requests.Response replacement."""
+
+    def __init__(self, url: str, status_code: int, payload: dict) -> None:
+        self.url = url
+        self.status_code = status_code
+        self.content = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+    def json(self) -> dict:
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} 응답: {self.url}", response=self)
+
+
+class ReplayTransport:
+    """Drop-in for requests.Session that answers from a MockWaterAPI without sockets."""
+
+    def __init__(self, api: MockWaterAPI) -> None:
+        self.api = api
+
+    def get(self, url: str, params: Optional[dict] = None, **kwargs) -> MockResponse:
+        status, payload = self.api.respond(url, params)
+        return MockResponse(url, status, payload)
+
+    def mount(self, prefix: str, adapter) -> None:
+        pass
+
+
+def mock_water(api: MockWaterAPI, **kwargs):
+    """Water instance wired to ``api`` through a ReplayTransport."""
+    from function.water_data import Water
+
+    return Water(transport=ReplayTransport(api), api_key=MockWaterAPI.KEY,
+                 dam_api_key=MockWaterAPI.KEY, **kwargs)
+
+
+# ----------------------------------------------------------------------
+# Localhost HTTP server
+# ----------------------------------------------------------------------
+class _Handler(BaseHTTPRequestHandler):
+    api: MockWaterAPI = None
+
+    def do_GET(self) -> None:
+        status, payload = self.api.respond(self.path, dict(parse_qsl(urlsplit(self.path).query)))
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class MockAPIServer:
+    """
+    Serve a MockWaterAPI over HTTP on localhost in a background thread.
+
+    Use as a context manager; port=0 picks a free port.
+    """
+
+    def __init__(self, api: MockWaterAPI, host: str = '127.0.0.1', port: int = 0) -> None:
+        handler = type('Handler', (_Handler,), {'api': api})
+        self.api = api
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def water_url(self) -> str:
+        return self.url + MockWaterAPI.WATER_PATH
+
+    @property
+    def dam_url(self) -> str:
+        return self.url + MockWaterAPI.DAM_PATH
+
+    def start(self) -> 'MockAPIServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> 'MockAPIServer':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
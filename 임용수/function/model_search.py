@@ -0,0 +1,241 @@
+"""Parallel SARIMAX order search across stations and target series."""
+import os
+import time
+import warnings
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import product
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from function.add_dam import Add_Dam
+
+
+# run() 결과 컬럼 (_fit_candidate가 만드는 행과 동일, 결과가 없어도 유지)
+RESULT_COLUMNS = ['series', 'order', 'seasonal_order', 'aic', 'bic', 'rmse', 'mae',
+                  'rmse_original', 'error', 'fit_seconds']
+
+def candidate_orders(p=range(0, 4), d=(1,), q=range(0, 4),
+                     P=range(0, 3), D=(0, 1), Q=range(0, 3), m: int = 12) -> list:
+    """
+    Build (order, seasonal_order) candidates, simplest models first.
+
+    Ordering by the total number of AR/MA terms means an early cutoff keeps
+    the cheap, parsimonious candidates.
+
+    Returns:
+        list: [((p, d, q), (P, D, Q, m)), ...]
+    """
+    candidates = [
+        ((p_, d_, q_), (P_, D_, Q_, m))
+        for p_, d_, q_, P_, D_, Q_ in product(p, d, q, P, D, Q)
+    ]
+    return sorted(candidates, key=lambda c: (c[0][0] + c[0][2] + c[1][0] + c[1][2], c))
+
+
+def _fit_candidate(task: dict) -> dict:
+    """
+    Fit one SARIMAX candidate and score it on the hold-out period.
+
+    Runs in a worker process, so statsmodels is imported here.
+    """
+    from statsmodels.tsa.statespace.sarimax import SARIMAX
+
+    start = time.perf_counter()
+    row = {
+        'series': task['series'],
+        'order': task['order'],
+        'seasonal_order': task['seasonal_order'],
+        'aic': np.inf, 'bic': np.inf,
+        'rmse': np.nan, 'mae': np.nan, 'rmse_original': np.nan,
+        'error': None,
+    }
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            model = SARIMAX(
+                task['ytrain'], exog=task['xtrain'],
+                order=task['order'], seasonal_order=task['seasonal_order'],
+                trend=task['trend'],
+                enforce_stationarity=False, enforce_invertibility=False,
+            )
+            fitted = model.fit(disp=False)
+            forecast = np.asarray(fitted.forecast(steps=len(task['ytest']), exog=task['xtest']))
+
+        ytest = np.asarray(task['ytest'])
+        row['aic'] = fitted.aic
+        row['bic'] = fitted.bic
+        row['rmse'] = float(np.sqrt(np.mean((forecast - ytest) ** 2)))
+        row['mae'] = float(np.mean(np.abs(forecast - ytest)))
+        if task['log_target']:
+            # log1p 변환된 target이면 원래 단위로 복원한 오차도 기록
+            row['rmse_original'] = float(np.sqrt(np.mean((np.expm1(forecast) - np.expm1(ytest)) ** 2)))
+    except Exception as e:
+        row['error'] = f'{type(e).__name__}: {e}'
+
+    row['fit_seconds'] = time.perf_counter() - start
+    return row
+
+
+class OrderSearch:
+    """
+    Fan SARIMAX(p,d,q)(P,D,Q,m) candidates across a process pool.
+
+    Register one series per (station, target) with add_series() or
+    add_frame(), then run() evaluates every candidate for every series and
+    returns a single results table (AIC/BIC and hold-out RMSE/MAE).
+
+    Early cutoffs:
+        - max_candidates: evaluate at most this many candidates per series.
+        - patience: stop a series after this many finished candidates in a
+                    row without an AIC improvement.
+        - time_budget: return after this many seconds; queued candidates are
+                       cancelled and running fits are not waited for.
+    """
+
+    def __init__(self, orders: Optional[list] = None, trend: str = 'c',
+                 max_workers: Optional[int] = None, max_candidates: Optional[int] = None,
+                 patience: Optional[int] = None, time_budget: Optional[float] = None) -> None:
+        self.orders = orders if orders is not None else candidate_orders()
+        self.trend = trend
+        self.max_workers = max_workers or os.cpu_count()
+        self.max_candidates = max_candidates
+        self.patience = patience
+        self.time_budget = time_budget
+        self.series = {}
+        self.results_ = None
+
+    def add_series(self, name: str, xtrain, xtest, ytrain, ytest, log_target: bool = True) -> None:
+        """
+        Register one series from Add_Dam.log_scale outputs.
+
+        Args:
+            name: Series label, e.g. '물금/클로로필-a'.
+            xtrain, xtest, ytrain, ytest: Output of Add_Dam.log_scale.
+            log_target: Whether y is log1p-transformed (enables rmse_original).
+        """
+        self.series[name] = {
+            'xtrain': np.asarray(xtrain, dtype=float), 'xtest': np.asarray(xtest, dtype=float),
+            'ytrain': np.asarray(ytrain, dtype=float), 'ytest': np.asarray(ytest, dtype=float),
+            'log_target': log_target,
+        }
+
+    def add_frame(self, station: str, df: pd.DataFrame, targets: Sequence[str] = ('클로로필-a',),
+                  test_size: float = 0.2, log_cols: Optional[list] = None) -> None:
+        """
+        Register every target of a month_dam_add result (index = 일자).
+
+        Each target is moved to the last column and passed through
+        Add_Dam.log_scale, so features are the remaining columns.
+        """
+        ad = Add_Dam()
+        if log_cols is None:
+            log_cols = Add_Dam.LOG_COLUMNS
+        for target in targets:
+            ordered = df[[col for col in df.columns if col != target] + [target]]
+            xtrain, xtest, ytrain, ytest = ad.log_scale(ordered, test_size=test_size, log_cols=log_cols)
+            self.add_series(f'{station}/{target}', xtrain, xtest, ytrain, ytest,
+                            log_target=target in log_cols)
+
+    def _tasks(self, name: str) -> list:
+        data = self.series[name]
+        orders = self.orders[:self.max_candidates] if self.max_candidates else self.orders
+        return [
+            {'series': name, 'order': order, 'seasonal_order': seasonal_order,
+             'trend': self.trend, **data}
+            for order, seasonal_order in orders
+        ]
+
+    def run(self) -> pd.DataFrame:
+        """
+        Evaluate all candidates in parallel.
+
+        Returns:
+            pd.DataFrame: One row per evaluated (series, candidate), sorted by
+                          series and AIC. Also stored in ``results_``.
+        """
+        if not self.series:
+            raise ValueError("탐색할 시계열이 없습니다. add_series()로 먼저 등록하세요.")
+
+        started = time.perf_counter()
+        pending_tasks = {name: iter(self._tasks(name)) for name in self.series}
+        best_aic = {name: np.inf for name in self.series}
+        stale = {name: 0 for name in self.series}
+        stopped = set()
+        rows = []
+
+        def out_of_time():
+            return self.time_budget is not None and time.perf_counter() - started > self.time_budget
+
+        def next_task():
+            # 시계열을 번갈아가며 제출해 조기 종료가 모든 시계열에 고르게 적용되도록 함
+            for name in list(pending_tasks):
+                if name in stopped:
+                    del pending_tasks[name]
+                    continue
+                task = next(pending_tasks[name], None)
+                if task is None:
+                    del pending_tasks[name]
+                    continue
+                pending_tasks[name] = pending_tasks.pop(name)
+                return task
+            return None
+
+        def unsubmitted():
+            # 조기 종료되지 않은 시계열에서 아직 제출하지 않은 후보 수
+            return sum(sum(1 for _ in tasks) for name, tasks in pending_tasks.items() if name not in stopped)
+
+        pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        running = set()
+        timed_out = False
+        try:
+            while True:
+                while len(running) < self.max_workers * 2 and not out_of_time():
+                    task = next_task()
+                    if task is None:
+                        break
+                    running.add(pool.submit(_fit_candidate, task))
+                if not running:
+                    break
+
+                timeout = None
+                if self.time_budget is not None:
+                    timeout = max(self.time_budget - (time.perf_counter() - started), 0)
+                done, running = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    break
+
+                for future in done:
+                    row = future.result()
+                    rows.append(row)
+                    name = row['series']
+                    if row['aic'] < best_aic[name]:
+                        best_aic[name] = row['aic']
+                        stale[name] = 0
+                    else:
+                        stale[name] += 1
+                    if self.patience is not None and stale[name] >= self.patience:
+                        stopped.add(name)
+
+            # 남은 후보는 시간 제한으로만 생김 (실행 중 + 제출하지 않은 후보)
+            skipped = len(running) + unsubmitted()
+            if skipped:
+                timed_out = True
+                # 실행 중인 적합은 기다리지 않고 대기 중인 후보는 취소
+                pool.shutdown(wait=False, cancel_futures=True)
+                print(f"시간 제한({self.time_budget}초) 도달: 남은 후보 {skipped}개 취소")
+        finally:
+            if not timed_out:
+                pool.shutdown()
+
+        results = pd.DataFrame(rows, columns=RESULT_COLUMNS)
+        self.results_ = results.sort_values(['series', 'aic']).reset_index(drop=True)
+        return self.results_
+
+    def best(self, metric: str = 'aic') -> pd.DataFrame:
+        """Best candidate per series by the given metric ('aic', 'bic', 'rmse', 'mae')."""
+        if self.results_ is None:
+            raise ValueError("run()을 먼저 실행하세요.")
+        results = self.results_[self.results_['error'].isna()]
+        return results.loc[results.groupby('series')[metric].idxmin()].reset_index(drop=True)
@@ -0,0 +1,150 @@
+"""Headless fetch -> merge -> features -> score / forecast pipeline.
+
+Heavy libraries (scikit-learn, statsmodels, xgboost, joblib) are imported
+only by the stage that needs them, and the API key only when a request is
+actually sent, so short scheduled runs start quickly.
+
+Usage:
+    python -m function.pipeline --years 2021-2025 --cache-dir data/cache --out out
+    python -m function.pipeline --stations 물금 --features --score model.joblib --out out
+    python -m function.pipeline --forecast data/models/sarimax --steps 6 --out out
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Optional, Sequence
+
+import pandas as pd
+
+
+def parse_years(value: str) -> list:
+    """'2021-2025' or '2021,2023' -> [2021, ...]."""
+    years = []
+    for part in value.split(','):
+        part = part.strip()
+        if '-' in part:
+            first, last = part.split('-')
+            years.extend(range(int(first), int(last) + 1))
+        elif part:
+            years.append(int(part))
+    return sorted(set(years))
+
+
+def fetch(water, stations: Optional[Sequence[str]], years: Sequence[int]) -> tuple:
+    """Water quality rows (via Water.scan pushdown) and the dam table."""
+    query = water.scan().where(years=years)
+    if stations:
+        query = query.where(station=stations)
+    return query.collect(), water.dam()
+
+
+def merge(water_df: pd.DataFrame, dam_df: pd.DataFrame, stats: Sequence[str] = ('mean',),
+          dropna: Optional[str] = 'any') -> pd.DataFrame:
+    """Monthly (station, month) aggregates joined with the dam table."""
+    from function.add_dam import Add_Dam
+
+    return Add_Dam().month_dam_add_stations(water_df, dam_df, stats=stats, dropna=dropna)
+
+
+def features(water_df: pd.DataFrame) -> pd.DataFrame:
+    """Lag / rolling / seasonal features on the raw measurements."""
+    from function.features import build_features
+
+    return build_features(water_df)
+
+
+def score(frame: pd.DataFrame, model_path: str) -> pd.DataFrame:
+    """Risk labels for every row with a saved RiskScorer."""
+    from function.risk_service import RiskScorer
+
+    if '월' not in frame.columns:
+        frame = frame.assign(월=pd.to_datetime(frame['일자']).dt.month)
+    scored = RiskScorer.load(model_path).score(frame)
+    return pd.concat([frame[['총량지점명', '일자']].reset_index(drop=True), scored.reset_index(drop=True)],
+                     axis=1)
+
+
+def forecast(monthly: pd.DataFrame, model_dir: str, steps: int = 3) -> pd.DataFrame:
+    """
+    Update the saved SARIMAX models with the new months and forecast every station.
+
+    Stations without a saved model are fitted once.
+    """
+    from function.forecast import ForecastRegistry
+
+    registry = ForecastRegistry(model_dir)
+    frames = {station: frame.drop(columns='총량지점명')
+              for station, frame in monthly.groupby('총량지점명', observed=True)}
+    saved = set(registry.stations())
+    new = {station: frame for station, frame in frames.items() if station not in saved}
+    if new:
+        registry.fit(new)
+    appended = registry.update({station: frame for station, frame in frames.items() if station in saved})
+    print(f"모델 갱신: 신규 {len(new)}개 지점, 추가 {appended}")
+    return registry.forecast(steps=steps, stations=list(frames))
+
+
+def _write(df: pd.DataFrame, out_dir: Path, name: str) -> None:
+    path = out_dir / f'{name}.csv'
+    df.to_csv(path, index=False, encoding='utf-8-sig')
+    print(f"저장: {path} ({len(df)}행)")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='수질 데이터 수집 -> 병합 -> 특성 -> 위험도 / 예측 파이프라인')
+    parser.add_argument('--stations', help='지점명 또는 코드 (쉼표 구분). 생략하면 기본 지점')
+    parser.add_argument('--years', default='2021-2025', help="연도 범위, 예: '2021-2025' 또는 '2021,2023'")
+    parser.add_argument('--cache-dir', help='API 캐시 디렉터리 (지정하면 캐시된 구간은 요청하지 않음)')
+    parser.add_argument('--out', default='out', help='결과 CSV 저장 디렉터리')
+    parser.add_argument('--stats', default='mean', help="월별 집계 통계 (쉼표 구분), 예: 'mean,max,std'")
+    parser.add_argument('--keep-missing', action='store_true', help='Target이 있는 달은 결측치가 있어도 유지')
+    parser.add_argument('--features', action='store_true', help='시차 / 이동 / 계절 특성 생성')
+    parser.add_argument('--score', metavar='MODEL', help='RiskScorer 모델 파일로 위험도 예측')
+    parser.add_argument('--forecast', metavar='MODEL_DIR', help='SARIMAX 모델 디렉터리 (갱신 후 예측)')
+    parser.add_argument('--steps', type=int, default=3, help='예측 개월 수')
+    parser.add_argument('--mock', action='store_true', help='실제 API 대신 합성 데이터 모의 API 사용')
+    args = parser.parse_args(argv)
+
+    years = parse_years(args.years)
+    stations = [s.strip() for s in args.stations.split(',')] if args.stations else None
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    if args.mock:
+        from function.mock_api import MockWaterAPI, mock_water
+
+        water = mock_water(MockWaterAPI.synthetic(years=years), cache_dir=args.cache_dir)
+    else:
+        from function.water_data import Water
+
+        water = Water(cache_dir=args.cache_dir)
+
+    started = time.perf_counter()
+    water_df, dam_df = fetch(water, stations, years)
+    if water_df.empty or dam_df.empty:
+        print("수집된 데이터가 없습니다.")
+        return 1
+    _write(water_df, out_dir, 'water')
+
+    monthly = merge(water_df, dam_df, stats=tuple(args.stats.split(',')),
+                    dropna='target' if args.keep_missing else 'any')
+    _write(monthly, out_dir, 'monthly')
+
+    scoring_frame = water_df
+    if args.features:
+        scoring_frame = features(water_df)
+        _write(scoring_frame, out_dir, 'features')
+
+    if args.score:
+        _write(score(scoring_frame, args.score), out_dir, 'risk')
+
+    if args.forecast:
+        _write(forecast(monthly, args.forecast, args.steps), out_dir, 'forecast')
+
+    print(f"완료: {time.perf_counter() - started:.1f}초")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
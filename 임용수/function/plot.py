@@ -0,0 +1,251 @@
+"""Pre-aggregated, downsampled plots of long multi-station water quality series."""
+from pathlib import Path
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from function.aggregate import grouped_stats, stat_column
+
+
+DEFAULT_COLUMNS = ('클로로필-a', '수온', '유량')
+FREQ_TABLES = {'D': 'daily', 'M': 'monthly', 'Y': 'yearly'}
+UNITS = {'클로로필-a': '㎎/㎥', '수온': '℃', '유량': '㎥/s'}
+
+
+def lttb(x, y, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last points and, from each of ``n_out - 2`` equal
+    buckets, the point forming the largest triangle with the previously kept
+    point and the mean of the next bucket, so peaks and troughs survive.
+
+    Args:
+        x: Increasing numeric x values (e.g. datetime64 as int64).
+        y: Values without NaN.
+        n_out: Number of points to keep.
+
+    Returns:
+        np.ndarray: Sorted indices of the kept points.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    kept = np.empty(n_out, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # 다음 구간의 평균점 (마지막 구간은 마지막 점)
+        nlo, nhi = hi, edges[i + 2] if i + 2 < len(edges) else n
+        cx, cy = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(np.argmax(area))
+        kept[i + 1] = a
+    return kept
+
+
+class PlotTables:
+    """
+    Daily / monthly / yearly per-station aggregates used by every chart.
+
+    The raw rows are reduced once (function.aggregate.grouped_stats) and then
+    dropped, so chart cost depends on the number of stations and periods,
+    not on the raw row count. Tables can be saved as Parquet and reloaded.
+
+        tables = PlotTables.from_frame(water_df)
+        tables.save('data/plot_tables')
+        fig = comparison_figure(PlotTables.load('data/plot_tables'))
+
+    Tables (long format, '일자' = period start):
+        daily    station, 일자, <col>
+        monthly  station, 일자, <col>, <col>_min, <col>_max
+        yearly   station, 일자, <col>
+    """
+
+    def __init__(self, daily: pd.DataFrame, monthly: pd.DataFrame, yearly: pd.DataFrame,
+                 station_col: str = '총량지점명') -> None:
+        self.daily = daily
+        self.monthly = monthly
+        self.yearly = yearly
+        self.station_col = station_col
+        self._climatology = None
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, columns: Sequence[str] = DEFAULT_COLUMNS,
+                   station_col: str = '총량지점명', date_col: str = '일자') -> 'PlotTables':
+        """Build the tables from long-format rows (Water.api_data / total_water output)."""
+        columns = [col for col in columns if col in df.columns]
+        if not columns:
+            raise ValueError(f"집계할 컬럼이 없습니다: {list(DEFAULT_COLUMNS)}")
+        dates = pd.to_datetime(df[date_col])
+        values = df[columns]
+        stations = df[station_col]
+
+        def table(periods, stats) -> pd.DataFrame:
+            result = grouped_stats(values, periods, stations, stats=stats, period_name=date_col,
+                                   station_name=station_col)
+            result[date_col] = result[date_col].dt.to_timestamp()
+            return result
+
+        index = pd.DatetimeIndex(dates)
+        return cls(
+            table(index.to_period('D'), ('mean',)),
+            table(index.to_period('M'), ('mean', 'min', 'max')),
+            table(index.to_period('Y'), ('mean',)),
+            station_col=station_col,
+        )
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+    def table(self, freq: str) -> pd.DataFrame:
+        if freq not in FREQ_TABLES:
+            raise ValueError(f"지원하지 않는 집계 단위입니다: {freq} (가능: {list(FREQ_TABLES)})")
+        return getattr(self, FREQ_TABLES[freq])
+
+    @property
+    def stations(self) -> list:
+        return list(pd.unique(self.monthly[self.station_col]))
+
+    @property
+    def climatology(self) -> pd.DataFrame:
+        """Mean of the monthly means per (station, calendar month), the notebooks' groupby(['총량지점명','월'])."""
+        if self._climatology is None:
+            monthly = self.monthly
+            columns = [col for col in monthly.columns
+                       if col not in (self.station_col, '일자') and not col.endswith(('_min', '_max'))]
+            self._climatology = (monthly.groupby([self.station_col, monthly['일자'].dt.month.rename('월')],
+                                                 observed=True)[columns]
+                                 .mean().reset_index())
+        return self._climatology
+
+    def series(self, column: str, station, freq: str = 'D',
+               max_points: Optional[int] = 1000) -> tuple:
+        """
+        (dates, values) of one station, LTTB-downsampled to ``max_points``.
+        """
+        table = self.table(freq)
+        rows = table[(table[self.station_col] == station) & table[column].notna()]
+        x = rows['일자'].to_numpy()
+        y = rows[column].to_numpy(dtype=np.float64)
+        if max_points is not None and len(x) > max_points:
+            kept = lttb(x.astype('datetime64[ns]').astype(np.int64), y, max_points)
+            x, y = x[kept], y[kept]
+        return x, y
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def save(self, path: str) -> None:
+        root = Path(path)
+        root.mkdir(parents=True, exist_ok=True)
+        for name in FREQ_TABLES.values():
+            getattr(self, name).to_parquet(root / f'{name}.parquet', index=False)
+
+    @classmethod
+    def load(cls, path: str, station_col: str = '총량지점명') -> 'PlotTables':
+        root = Path(path)
+        tables = {name: pd.read_parquet(root / f'{name}.parquet') for name in FREQ_TABLES.values()}
+        return cls(station_col=station_col, **tables)
+
+
+# ----------------------------------------------------------------------
+# Figures (matplotlib is imported only when drawing)
+# ----------------------------------------------------------------------
+def _label(column: str) -> str:
+    return f'{column} ({UNITS[column]})' if column in UNITS else column
+
+
+def _axes(ax, figsize=(12, 4)):
+    if ax is not None:
+        return ax.figure, ax
+    import matplotlib.pyplot as plt
+
+    return plt.subplots(figsize=figsize)
+
+
+def plot_series(tables: PlotTables, column: str, freq: str = 'D',
+                stations: Optional[Sequence[str]] = None, max_points: Optional[int] = 1000,
+                band: bool = False, ax=None):
+    """
+    One line per station over time.
+
+    Args:
+        freq: 'D', 'M' or 'Y' table.
+        max_points: LTTB points per line (None keeps every period).
+        band: Shade the monthly min~max range (freq='M' only).
+    """
+    fig, ax = _axes(ax)
+    for station in stations or tables.stations:
+        x, y = tables.series(column, station, freq, max_points)
+        line, = ax.plot(x, y, linewidth=1, label=station)
+        if band and freq == 'M':
+            table = tables.monthly
+            rows = table[table[tables.station_col] == station]
+            ax.fill_between(rows['일자'], rows[stat_column(column, 'min')], rows[stat_column(column, 'max')],
+                            color=line.get_color(), alpha=0.15, linewidth=0)
+    ax.set_title(f'지점별 {column} 추이')
+    ax.set_ylabel(_label(column))
+    ax.legend()
+    return fig
+
+
+def plot_climatology(tables: PlotTables, column: str, stations: Optional[Sequence[str]] = None, ax=None):
+    """Monthly profile (calendar month 1~12) per station."""
+    fig, ax = _axes(ax, figsize=(8, 4))
+    climatology = tables.climatology
+    for station in stations or tables.stations:
+        rows = climatology[climatology[tables.station_col] == station]
+        ax.plot(rows['월'], rows[column], marker='o', label=station)
+    ax.set_xticks(range(1, 13))
+    ax.set_xlabel('월')
+    ax.set_title(f'월별 평균 {column}')
+    ax.set_ylabel(_label(column))
+    ax.legend()
+    return fig
+
+
+def plot_yearly(tables: PlotTables, column: str, stations: Optional[Sequence[str]] = None, ax=None):
+    """Yearly mean per station as grouped bars."""
+    fig, ax = _axes(ax, figsize=(8, 4))
+    stations = list(stations or tables.stations)
+    yearly = tables.yearly
+    years = np.sort(yearly['일자'].dt.year.unique())
+    width = 0.8 / max(len(stations), 1)
+    for i, station in enumerate(stations):
+        rows = yearly[yearly[tables.station_col] == station]
+        values = rows.set_index(rows['일자'].dt.year)[column].reindex(years)
+        ax.bar(years + (i - (len(stations) - 1) / 2) * width, values.to_numpy(), width=width, label=station)
+    ax.set_xticks(years)
+    ax.set_title(f'연도별 평균 {column}')
+    ax.set_ylabel(_label(column))
+    ax.legend()
+    return fig
+
+
+def comparison_figure(tables: PlotTables, columns: Sequence[str] = DEFAULT_COLUMNS,
+                      stations: Optional[Sequence[str]] = None, freq: str = 'D',
+                      max_points: Optional[int] = 1000, figsize: Optional[tuple] = None):
+    """
+    The standard chl-a / 수온 / 유량 comparison: one row per column with the
+    time series, the monthly profile and the yearly means of every station.
+
+    Korean labels need a Korean font, e.g. plt.rcParams['font.family'] = 'Malgun Gothic'.
+    """
+    import matplotlib.pyplot as plt
+
+    columns = [col for col in columns if col in tables.monthly.columns]
+    fig, axes = plt.subplots(len(columns), 3, figsize=figsize or (18, 4 * len(columns)),
+                             gridspec_kw={'width_ratios': [3, 1.5, 1.5]}, squeeze=False)
+    for row, column in zip(axes, columns):
+        plot_series(tables, column, freq, stations, max_points, ax=row[0])
+        plot_climatology(tables, column, stations, ax=row[1])
+        plot_yearly(tables, column, stations, ax=row[2])
+    fig.tight_layout()
+    return fig
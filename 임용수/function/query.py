@@ -0,0 +1,198 @@
+"""Lazy water quality queries with station / date / column pushdown."""
+from typing import Iterable, Iterator, Optional, Sequence, Union
+
+import pandas as pd
+import requests
+
+from function.schema import WATER_SCHEMA, frame_to_typed, items_to_frame
+
+
+class WaterQuery:
+    """
+    Lazy query over Water.api_data.
+
+    Nothing is fetched or read until collect() / iter_stations(). Stations,
+    years and months are pushed down to the cache slices or to the API
+    parameters (ptNoList / wmyrList / wmodList), and selected columns to the
+    Parquet column projection and the typed conversion.
+
+        query = water.scan().where(station='물금', years=range(2019, 2025)).select(['일자', '클로로필-a'])
+        query.explain()
+        df = query.collect()
+
+    Queries are immutable: where() and select() return new queries.
+    """
+
+    NAME_TO_KEY = {name: key for key, (name, _) in WATER_SCHEMA.items()}
+
+    def __init__(self, water, stations: Optional[tuple] = None, years: Optional[tuple] = None,
+                 months: Optional[tuple] = None, start: Optional[pd.Timestamp] = None,
+                 end: Optional[pd.Timestamp] = None, columns: Optional[tuple] = None,
+                 split_by=None) -> None:
+        self.water = water
+        self.stations = stations
+        self.years = years
+        self.months = months
+        self.start = start
+        self.end = end
+        self.columns = columns
+        self.split_by = split_by
+
+    def _replace(self, **changes) -> 'WaterQuery':
+        state = {key: getattr(self, key) for key in
+                 ('stations', 'years', 'months', 'start', 'end', 'columns', 'split_by')}
+        state.update(changes)
+        return WaterQuery(self.water, **state)
+
+    # ------------------------------------------------------------------
+    # Builders
+    # ------------------------------------------------------------------
+    def _station_codes(self, station: Union[str, Iterable[str]]) -> tuple:
+        """Station names (Water.STATIONS) or codes -> codes."""
+        names = [station] if isinstance(station, str) else list(station)
+        return tuple(self.water.STATIONS.get(name, name) for name in names)
+
+    def where(self, station: Union[str, Iterable[str], None] = None,
+              years: Union[int, Iterable[int], None] = None,
+              months: Union[int, Iterable[int], None] = None,
+              start=None, end=None) -> 'WaterQuery':
+        """
+        Restrict the query. Repeated calls replace the given filters.
+
+        Args:
+            station: Station name(s) from Water.STATIONS (e.g. '물금') or code(s).
+            years: Year or iterable of years, e.g. range(2019, 2025).
+            months: Month or iterable of months (1~12).
+            start: Inclusive lower bound on '일자'.
+            end: Inclusive upper bound on '일자'.
+        """
+        changes = {}
+        if station is not None:
+            changes['stations'] = self._station_codes(station)
+        if years is not None:
+            changes['years'] = tuple(sorted({int(y) for y in ([years] if isinstance(years, int) else years)}))
+        if months is not None:
+            months = tuple(sorted({int(m) for m in ([months] if isinstance(months, int) else months)}))
+            invalid = [m for m in months if not 1 <= m <= 12]
+            if invalid:
+                raise ValueError(f"월은 1~12 사이여야 합니다: {invalid}")
+            changes['months'] = months
+        if start is not None:
+            changes['start'] = pd.Timestamp(start)
+        if end is not None:
+            changes['end'] = pd.Timestamp(end)
+        return self._replace(**changes)
+
+    def select(self, columns: Sequence[str]) -> 'WaterQuery':
+        """Keep only these (renamed) columns, e.g. ['총량지점명', '일자', '클로로필-a']."""
+        unknown = [col for col in columns if col not in self.NAME_TO_KEY]
+        if unknown:
+            raise ValueError(f"알 수 없는 컬럼입니다: {unknown} (가능: {list(self.NAME_TO_KEY)})")
+        return self._replace(columns=tuple(columns))
+
+    def split(self, split_by) -> 'WaterQuery':
+        """Parallel request split passed to the fetch ('station', 'year', 'month')."""
+        return self._replace(split_by=split_by)
+
+    # ------------------------------------------------------------------
+    # Planning
+    # ------------------------------------------------------------------
+    def _resolved_stations(self) -> tuple:
+        return self.stations or tuple(self.water._split_list(self.water.DEFAULT_PT_NO_LIST))
+
+    def _month_groups(self) -> dict:
+        """Requested months grouped by identical month lists: {months: [years]}."""
+        default_years = tuple(int(y) for y in self.water._split_list(self.water.DEFAULT_WMYR_LIST))
+        if self.years is not None:
+            years = self.years
+        elif self.start is not None or self.end is not None:
+            # start가 없으면 기본 조회 기간의 첫 해부터
+            first = self.start.year if self.start is not None else min(default_years)
+            last = (self.end or pd.Timestamp.now()).year
+            years = tuple(range(first, last + 1))
+            if not years:
+                raise ValueError(f"조회 기간이 비어 있습니다: {first}년 ~ {last}년 "
+                                 f"(start 또는 years를 지정하세요)")
+        else:
+            years = default_years
+
+        groups = {}
+        for year in years:
+            months = set(self.months or range(1, 13))
+            if self.start is not None:
+                months = {m for m in months if (year, m) >= (self.start.year, self.start.month)}
+            if self.end is not None:
+                months = {m for m in months if (year, m) <= (self.end.year, self.end.month)}
+            if months:
+                groups.setdefault(tuple(sorted(months)), []).append(year)
+        return groups
+
+    def _schema(self) -> dict:
+        """WATER_SCHEMA restricted to the selected columns (plus 일자 for date filters)."""
+        if self.columns is None:
+            return dict(WATER_SCHEMA)
+        names = set(self.columns)
+        if self.start is not None or self.end is not None:
+            names.add('일자')
+        return {key: spec for key, spec in WATER_SCHEMA.items() if spec[0] in names}
+
+    def explain(self) -> pd.DataFrame:
+        """The slices that collect() would request or read, one row per (stations, months) group."""
+        source = 'cache' if self.water.cache is not None else 'api'
+        return pd.DataFrame([
+            {'source': source, 'ptNoList': ','.join(self._resolved_stations()),
+             'wmyrList': ','.join(map(str, years)), 'wmodList': ','.join(f'{m:02d}' for m in months),
+             'columns': list(self._schema())}
+            for months, years in self._month_groups().items()
+        ])
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+    def _fetch(self, stations: Sequence[str]) -> pd.DataFrame:
+        water = self.water
+        schema = self._schema()
+        pt_no_list = ','.join(stations)
+
+        raw = []
+        for months, years in self._month_groups().items():
+            year_list = ','.join(map(str, years))
+            month_list = ','.join(f'{m:02d}' for m in months)
+            if water.cache is not None:
+                try:
+                    water._update_water_cache(year_list, pt_no_list, self.split_by, month_list=month_list)
+                except requests.exceptions.RequestException as e:
+                    print(f"API 요청 실패, 캐시된 데이터를 사용합니다: {e}")
+                frame = water.cache.read_water(stations, years, months, columns=list(schema))
+                if not frame.empty:
+                    raw.append(frame_to_typed(frame, schema))
+            else:
+                slices = water._build_water_slices(year_list, pt_no_list, self.split_by, month_list=month_list)
+                items = water._fetch_water_items(slices)
+                if items:
+                    raw.append(items_to_frame(items, schema))
+
+        if not raw:
+            return pd.DataFrame(columns=[name for name, _ in schema.values()])
+        df = pd.concat(raw, ignore_index=True) if len(raw) > 1 else raw[0]
+
+        if self.start is not None:
+            df = df[df['일자'] >= self.start]
+        if self.end is not None:
+            df = df[df['일자'] <= self.end]
+        if self.columns is not None:
+            df = df[list(self.columns)]
+        return df.reset_index(drop=True)
+
+    def collect(self) -> pd.DataFrame:
+        """Materialize the query for every selected station at once."""
+        return self._fetch(self._resolved_stations())
+
+    def iter_stations(self) -> Iterator[tuple]:
+        """Materialize one station at a time: yields (station code, DataFrame)."""
+        for pt_no in self._resolved_stations():
+            yield pt_no, self._fetch([pt_no])
+
+    def __repr__(self) -> str:
+        return (f"WaterQuery(stations={self._resolved_stations()}, years={self.years}, "
+                f"months={self.months}, start={self.start}, end={self.end}, columns={self.columns})")
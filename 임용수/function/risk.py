@@ -0,0 +1,136 @@
+"""Vectorized chlorophyll-a risk labelling and class weights."""
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+# 위험도 기준
+# - project     : water_project_final.ipynb 기준 (pd.cut, 오른쪽 경계 포함)
+#                 12 이하 저위험 / 30 이하 중위험 / 30 초과 고위험
+# - algae_alert : 조류경보제 기준 (유서하 get_risk_level, 왼쪽 경계 포함)
+#                 15 미만 정상 / 25 미만 관심 / 25 이상 경계 이상
+RISK_SCHEMES = {
+    'project': {'thresholds': (12, 30), 'labels': ('저위험', '중위험', '고위험'), 'right': True},
+    'algae_alert': {'thresholds': (15, 25), 'labels': ('정상', '관심', '경계 이상'), 'right': False},
+}
+
+
+def resolve_scheme(scheme: str, thresholds=None, labels=None, right=None) -> tuple:
+    """
+    (thresholds, labels, right) of a RISK_SCHEMES entry, with the given overrides.
+
+    Raises:
+        ValueError: Unknown scheme, non-ascending thresholds or a label count
+                    that does not match the thresholds.
+    """
+    if scheme not in RISK_SCHEMES:
+        raise ValueError(f"지원하지 않는 위험도 기준입니다: {scheme} (가능: {list(RISK_SCHEMES)})")
+    base = RISK_SCHEMES[scheme]
+    thresholds = np.asarray(base['thresholds'] if thresholds is None else thresholds, dtype=float)
+    labels = tuple(base['labels'] if labels is None else labels)
+    right = base['right'] if right is None else right
+
+    if np.any(np.diff(thresholds) <= 0):
+        raise ValueError(f"임계값은 오름차순이어야 합니다: {thresholds}")
+    if len(labels) != len(thresholds) + 1:
+        raise ValueError(f"라벨 수({len(labels)})는 임계값 수 + 1({len(thresholds) + 1})이어야 합니다")
+    return thresholds, labels, right
+
+
+def risk_codes(values, scheme: str = 'project', thresholds: Optional[Sequence[float]] = None,
+               right: Optional[bool] = None) -> np.ndarray:
+    """
+    Risk class codes (0 = lowest) for every value with one np.searchsorted call.
+
+    Args:
+        values: Chlorophyll-a values (array-like).
+        scheme: Key of RISK_SCHEMES supplying the defaults.
+        thresholds: Ascending cut points, overriding the scheme.
+        right: True for right-closed bins (pd.cut default, x == threshold stays
+              in the lower class), False for left-closed bins.
+
+    Returns:
+        np.ndarray: int8 codes, -1 where the value is NaN.
+    """
+    thresholds, _, right = resolve_scheme(scheme, thresholds, None, right)
+    values = np.asarray(values, dtype=float)
+
+    codes = np.searchsorted(thresholds, values, side='left' if right else 'right').astype(np.int8)
+    codes[np.isnan(values)] = -1
+    return codes
+
+
+def label_risk(values, scheme: str = 'project', thresholds: Optional[Sequence[float]] = None,
+               labels: Optional[Sequence[str]] = None, right: Optional[bool] = None):
+    """
+    Label chlorophyll-a values with risk classes.
+
+    Equivalent to pd.cut(values, [-inf, *thresholds, inf], labels=labels) for
+    right-closed schemes, and to the row-wise get_risk_level for left-closed ones.
+
+    Returns:
+        pd.Series (if values is a Series, same index) or pd.Categorical of
+        ordered categories; NaN values stay missing.
+    """
+    thresholds, labels, right = resolve_scheme(scheme, thresholds, labels, right)
+    codes = risk_codes(values, scheme, thresholds, right)
+    categorical = pd.Categorical.from_codes(codes, categories=list(labels), ordered=True)
+
+    if isinstance(values, pd.Series):
+        return pd.Series(categorical, index=values.index, name='위험도')
+    return categorical
+
+
+def class_weights(codes, n_classes: Optional[int] = None) -> np.ndarray:
+    """
+    'balanced' class weights (sklearn compute_class_weight formula) from codes.
+
+    weight[c] = n_samples / (n_present_classes * count[c]); absent classes and
+    missing codes (-1) get weight 0.
+    """
+    codes = np.asarray(codes)
+    valid = codes[codes >= 0]
+    counts = np.bincount(valid, minlength=n_classes or 0)
+
+    weights = np.zeros(len(counts), dtype=float)
+    present = counts > 0
+    if present.any():
+        weights[present] = len(valid) / (present.sum() * counts[present])
+    return weights
+
+
+def sample_weights(codes, n_classes: Optional[int] = None) -> np.ndarray:
+    """Per-row 'balanced' weights (replaces np.vectorize(cw_map.get)). Missing codes get 0."""
+    codes = np.asarray(codes)
+    weights = class_weights(codes, n_classes)
+    return np.where(codes >= 0, weights[np.clip(codes, 0, None)], 0.0)
+
+
+def sweep_thresholds(values, threshold_sets: Sequence[Sequence[float]],
+                     right: bool = True) -> pd.DataFrame:
+    """
+    Class counts and balanced weights for many candidate threshold sets.
+
+    Each set is labelled with one searchsorted pass over the values (no
+    per-row Python), which keeps threshold sweeps over long histories cheap.
+
+    Returns:
+        pd.DataFrame: One row per threshold set with count_<k> and weight_<k> columns.
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+
+    rows = []
+    for thresholds in threshold_sets:
+        thresholds = np.asarray(thresholds, dtype=float)
+        codes = np.searchsorted(thresholds, values, side='left' if right else 'right')
+        n_classes = len(thresholds) + 1
+        counts = np.bincount(codes, minlength=n_classes)
+        weights = class_weights(codes, n_classes)
+
+        row = {'thresholds': tuple(thresholds.tolist())}
+        row.update({f'count_{k}': int(c) for k, c in enumerate(counts)})
+        row.update({f'weight_{k}': w for k, w in enumerate(weights)})
+        rows.append(row)
+    return pd.DataFrame(rows)
@@ -0,0 +1,274 @@
+"""Parallel hyperparameter search for the XGBoost / RandomForest risk classifiers."""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from function.risk import sample_weights
+from function.risk_service import RiskScorer
+
+
+# water_project_final.ipynb의 XGBClassifier 설정 (탐색 파라미터로 덮어씀)
+XGB_DEFAULTS = {
+    'n_estimators': 800, 'learning_rate': 0.05, 'max_depth': 4, 'subsample': 0.9,
+    'colsample_bytree': 0.9, 'reg_lambda': 1.0, 'random_state': 42, 'tree_method': 'hist',
+}
+RF_DEFAULTS = {'n_estimators': 300, 'random_state': 42}
+
+
+def make_preprocess(num_cols: Sequence[str], cat_cols: Sequence[str], scale: bool = False):
+    """
+    The notebook's ColumnTransformer: median imputation (+ scaling if ``scale``)
+    for numeric columns and one-hot encoding for categorical columns.
+    """
+    from sklearn.compose import ColumnTransformer
+    from sklearn.impute import SimpleImputer
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+    numeric = SimpleImputer(strategy='median')
+    if scale:
+        numeric = Pipeline([('imputer', numeric), ('scaler', StandardScaler())])
+    transformers = [('num', numeric, list(num_cols))]
+    if cat_cols:
+        transformers.append(('cat', OneHotEncoder(handle_unknown='ignore'), list(cat_cols)))
+    return ColumnTransformer(transformers, sparse_threshold=0)
+
+
+def make_model(kind: str, params: Optional[dict] = None, n_classes: int = 3):
+    """
+    Build a classifier from the notebook defaults overridden by ``params``.
+
+    Args:
+        kind: 'xgb' (needs xgboost) or 'rf'.
+    """
+    params = params or {}
+    if kind == 'xgb':
+        from xgboost import XGBClassifier
+
+        return XGBClassifier(**{**XGB_DEFAULTS, 'objective': 'multi:softprob', 'num_class': n_classes,
+                                'eval_metric': 'mlogloss', 'n_jobs': 1, **params})
+    if kind == 'rf':
+        from sklearn.ensemble import RandomForestClassifier
+
+        return RandomForestClassifier(**{**RF_DEFAULTS, 'n_jobs': 1, **params})
+    raise ValueError(f"지원하지 않는 모델입니다: {kind} (가능: 'xgb', 'rf')")
+
+
+def param_grid(grid: dict) -> list:
+    """Every combination of a {param: [values]} grid."""
+    from sklearn.model_selection import ParameterGrid
+
+    return list(ParameterGrid(grid))
+
+
+def param_samples(distributions: dict, n_iter: int = 100, seed: int = 0) -> list:
+    """
+    ``n_iter`` random configs from {param: list or scipy.stats distribution}.
+    """
+    from sklearn.model_selection import ParameterSampler
+
+    return list(ParameterSampler(distributions, n_iter=n_iter, random_state=seed))
+
+
+def _high_scores(y_true: np.ndarray, y_pred: np.ndarray, high: int) -> tuple:
+    """(precision, recall, f1) of the 고위험 class."""
+    tp = np.sum((y_true == high) & (y_pred == high))
+    fp = np.sum((y_true != high) & (y_pred == high))
+    fn = np.sum((y_true == high) & (y_pred != high))
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return precision, recall, f1
+
+
+def _macro_f1(y_true: np.ndarray, y_pred: np.ndarray, n_classes: int) -> float:
+    scores = [_high_scores(y_true, y_pred, c)[2] for c in range(n_classes) if np.any(y_true == c)]
+    return float(np.mean(scores)) if scores else np.nan
+
+
+# 워커 프로세스마다 한 번만 전달되는 전처리된 fold 데이터
+_FOLDS = None
+
+
+def _init_worker(folds: list) -> None:
+    global _FOLDS
+    _FOLDS = folds
+
+
+def _evaluate_config(task: dict) -> dict:
+    """
+    Fit one config on every cached fold and score the test windows.
+
+    Runs in a worker process; fold arrays come from _init_worker.
+    """
+    start = time.perf_counter()
+    n_classes, high = task['n_classes'], task['high']
+    row = {
+        'model': task['kind'], 'config': task['config'], 'params': task['params'],
+        'high_precision': np.nan, 'high_recall': np.nan, 'high_f1': np.nan,
+        'macro_f1': np.nan, 'accuracy': np.nan, 'high_recall_min': np.nan,
+        'error': None,
+    }
+    scores = []
+    try:
+        for fold in _FOLDS:
+            model = make_model(task['kind'], task['params'], n_classes)
+            model.fit(fold['xtrain'], fold['ytrain'], sample_weight=fold['wtrain'])
+
+            proba = np.zeros((len(fold['ytest']), n_classes))
+            proba[:, model.classes_] = model.predict_proba(fold['xtest'])
+            pred = proba.argmax(axis=1)
+            if task['high_threshold'] is not None:
+                pred = np.where(proba[:, high] >= task['high_threshold'], high, pred)
+
+            precision, recall, f1 = _high_scores(fold['ytest'], pred, high)
+            scores.append({
+                'high_precision': precision, 'high_recall': recall, 'high_f1': f1,
+                'macro_f1': _macro_f1(fold['ytest'], pred, n_classes),
+                'accuracy': float(np.mean(pred == fold['ytest'])),
+            })
+        row.update(pd.DataFrame(scores).mean().to_dict())
+        row['high_recall_min'] = min(s['high_recall'] for s in scores)
+    except Exception as e:
+        row['error'] = f'{type(e).__name__}: {e}'
+
+    row['fit_seconds'] = time.perf_counter() - start
+    return row
+
+
+class RiskSearch:
+    """
+    Evaluate many XGBoost / RandomForest configs for the 위험도 classifier.
+
+    The data is sorted by ``time_col`` and split with TimeSeriesSplit. The
+    ColumnTransformer is fitted once per fold and its output (with the
+    balanced sample weights) is cached as arrays, which every worker process
+    receives once; each config then only fits the model on every fold.
+
+        search = RiskSearch(modelDF)
+        search.run('xgb', param_grid({'max_depth': [3, 4, 6], 'learning_rate': [0.03, 0.1]}))
+        search.best('high_recall')
+        scorer = search.fit_best()
+    """
+
+    def __init__(self, df: pd.DataFrame, feature_cols: Optional[Sequence[str]] = None,
+                 target: str = '위험도', time_col: str = '일자', n_splits: int = 3,
+                 test_size: Optional[int] = None, labels: Sequence[str] = tuple(RiskScorer.RISK_LABELS),
+                 scale: bool = False, max_workers: Optional[int] = None) -> None:
+        """
+        Args:
+            df: Model frame with feature, target and time columns (the notebook's modelDF).
+            feature_cols: Defaults to RiskScorer.FEATURE_COLS. Non-numeric columns
+                         are one-hot encoded, the rest imputed.
+            target: Label column (values from ``labels``).
+            time_col: Column that defines the time order of the splits.
+            n_splits, test_size: TimeSeriesSplit settings.
+            labels: Class labels, lowest risk first; the last is 고위험.
+            scale: Also standard-scale numeric columns (LogisticRegression-style).
+            max_workers: Process pool size. Defaults to os.cpu_count().
+        """
+        from sklearn.model_selection import TimeSeriesSplit
+
+        self.feature_cols = list(feature_cols) if feature_cols is not None else list(RiskScorer.FEATURE_COLS)
+        self.labels = list(labels)
+        self.high = len(self.labels) - 1
+        self.max_workers = max_workers or os.cpu_count()
+
+        df = df.dropna(subset=[target]).sort_values(time_col, kind='stable')
+        unknown = set(df[target].astype(str)) - set(self.labels)
+        if unknown:
+            raise ValueError(f"알 수 없는 위험도 라벨입니다: {sorted(unknown)}")
+
+        X = df[self.feature_cols]
+        self.cat_cols = [col for col in self.feature_cols if not pd.api.types.is_numeric_dtype(X[col])]
+        self.num_cols = [col for col in self.feature_cols if col not in self.cat_cols]
+        self.scale = scale
+        self.X = X
+        self.y = pd.Categorical(df[target].astype(str), categories=self.labels).codes.astype(np.int64)
+
+        # fold마다 전처리를 한 번만 학습하고 결과 배열을 캐시
+        self.folds = []
+        splitter = TimeSeriesSplit(n_splits=n_splits, test_size=test_size)
+        for train, test in splitter.split(X):
+            preprocess = make_preprocess(self.num_cols, self.cat_cols, scale)
+            self.folds.append({
+                'xtrain': np.asarray(preprocess.fit_transform(X.iloc[train]), dtype=np.float32),
+                'xtest': np.asarray(preprocess.transform(X.iloc[test]), dtype=np.float32),
+                'ytrain': self.y[train],
+                'ytest': self.y[test],
+                'wtrain': sample_weights(self.y[train], len(self.labels)),
+                'test_start': df[time_col].iloc[test[0]],
+                'test_end': df[time_col].iloc[test[-1]],
+            })
+        self.results_ = None
+
+    def run(self, kind: str, configs: Sequence[dict], high_threshold: Optional[float] = None,
+            chunksize: int = 1) -> pd.DataFrame:
+        """
+        Evaluate every config on every fold in parallel.
+
+        Args:
+            kind: 'xgb' or 'rf'.
+            configs: Parameter dicts, e.g. from param_grid() or param_samples().
+            high_threshold: If set, rows with 고위험 probability >= threshold are
+                           predicted 고위험 (the notebook's final_threshold).
+            chunksize: Configs per task sent to a worker.
+
+        Returns:
+            pd.DataFrame: One row per config with fold-averaged high_precision,
+                          high_recall, high_f1, macro_f1 and accuracy, sorted by
+                          high_recall then high_f1. Appended to ``results_``.
+        """
+        tasks = [
+            {'kind': kind, 'config': i, 'params': dict(params), 'n_classes': len(self.labels),
+             'high': self.high, 'high_threshold': high_threshold}
+            for i, params in enumerate(configs)
+        ]
+        if not tasks:
+            raise ValueError("평가할 설정이 없습니다.")
+
+        with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker,
+                                 initargs=(self.folds,)) as pool:
+            rows = list(pool.map(_evaluate_config, tasks, chunksize=chunksize))
+
+        results = pd.DataFrame(rows)
+        results['high_threshold'] = high_threshold
+        self.results_ = pd.concat([self.results_, results], ignore_index=True) \
+            if self.results_ is not None else results
+        return results.sort_values(['high_recall', 'high_f1'], ascending=False,
+                                   na_position='last').reset_index(drop=True)
+
+    def best(self, metric: str = 'high_f1', kind: Optional[str] = None) -> pd.Series:
+        """Best config by the given metric ('high_recall', 'high_f1', 'macro_f1', ...)."""
+        if self.results_ is None:
+            raise ValueError("run()을 먼저 실행하세요.")
+        results = self.results_[self.results_['error'].isna()]
+        if kind is not None:
+            results = results[results['model'] == kind]
+        if results.empty:
+            raise ValueError("성공한 설정이 없습니다.")
+        return results.loc[results[metric].idxmax()]
+
+    def fit_best(self, metric: str = 'high_f1', kind: Optional[str] = None) -> RiskScorer:
+        """
+        Refit the best config on all rows as a preprocess + model Pipeline.
+
+        Returns:
+            RiskScorer: Ready for function.risk_service (class labels set for
+                        the encoded target).
+        """
+        from sklearn.pipeline import Pipeline
+
+        best = self.best(metric, kind)
+        pipeline = Pipeline([
+            ('preprocess', make_preprocess(self.num_cols, self.cat_cols, self.scale)),
+            ('model', make_model(best['model'], best['params'], len(self.labels))),
+        ])
+        pipeline.fit(self.X, self.y, model__sample_weight=sample_weights(self.y, len(self.labels)))
+        threshold = best['high_threshold']
+        return RiskScorer(pipeline, self.feature_cols, class_labels=self.labels,
+                          high_threshold=None if pd.isna(threshold) else threshold)
@@ -0,0 +1,211 @@
+"""Batch chlorophyll-a risk scoring around a persisted classifier pipeline.
+
+Usage:
+    python -m function.risk_service model.joblib --input rows.csv
+    python -m function.risk_service model.joblib --serve --port 8000
+"""
+import argparse
+import json
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from function.risk import RISK_SCHEMES
+
+
+class RiskScorer:
+    """
+    Vectorized scorer for the xgb_pipe / logi_pipe models of water_project_final.ipynb.
+
+    The pipeline is loaded once; score() accepts a DataFrame, a NumPy array
+    (columns in ``feature_cols`` order), a list of dicts / lists or a JSON
+    string, and returns the risk class and the 고위험 probability for every
+    row with a single predict_proba call.
+    """
+
+    FEATURE_COLS = ['총량지점명', '월', '수온', '유량', '총질소(T-N)', '총인(T-P)',
+                    'BOD', 'COD', '총유기탄소(TOC)']
+    RISK_LABELS = list(RISK_SCHEMES['project']['labels'])
+    HIGH_LABEL = RISK_LABELS[-1]
+
+    def __init__(self, pipeline, feature_cols: Optional[Sequence[str]] = None,
+                 class_labels: Optional[Sequence[str]] = None,
+                 high_threshold: Optional[float] = None) -> None:
+        """
+        Args:
+            pipeline: Fitted sklearn Pipeline with predict_proba.
+            feature_cols: Input columns of the pipeline. Defaults to FEATURE_COLS.
+            class_labels: Label names for encoded classes (LabelEncoder.classes_),
+                         needed when the model was trained on encoded y (xgb_pipe).
+            high_threshold: If set, rows with 고위험 probability >= threshold are
+                           labelled 고위험 regardless of argmax (notebook's final_threshold).
+        """
+        self.pipeline = pipeline
+        self.feature_cols = list(feature_cols) if feature_cols is not None else list(self.FEATURE_COLS)
+        self.class_labels = list(class_labels) if class_labels is not None else None
+        self.high_threshold = high_threshold
+
+        classes = np.asarray(pipeline.classes_)
+        if self.class_labels is not None:
+            classes = np.asarray(self.class_labels, dtype=object)[classes.astype(int)]
+        self.classes = classes.astype(object)
+
+        high = np.flatnonzero(self.classes == self.HIGH_LABEL)
+        if high.size == 0:
+            raise ValueError(f"모델 클래스에 '{self.HIGH_LABEL}'이 없습니다: {list(self.classes)}")
+        self.high_idx = int(high[0])
+
+    @classmethod
+    def load(cls, path: str) -> 'RiskScorer':
+        """Load a scorer saved with save() (or a bare pipeline saved with joblib)."""
+        import joblib
+
+        bundle = joblib.load(path)
+        if not isinstance(bundle, dict):
+            return cls(bundle)
+        return cls(bundle['pipeline'], feature_cols=bundle.get('feature_cols'),
+                   class_labels=bundle.get('class_labels'),
+                   high_threshold=bundle.get('high_threshold'))
+
+    def save(self, path: str) -> None:
+        """Persist the pipeline together with its feature / label metadata."""
+        import joblib
+
+        joblib.dump({
+            'pipeline': self.pipeline,
+            'feature_cols': self.feature_cols,
+            'class_labels': self.class_labels,
+            'high_threshold': self.high_threshold,
+        }, path)
+
+    def _to_frame(self, rows) -> pd.DataFrame:
+        """Normalize any supported batch format into a feature DataFrame."""
+        if isinstance(rows, (str, bytes)):
+            rows = json.loads(rows)
+        if isinstance(rows, dict):
+            rows = rows.get('records', rows)
+
+        if isinstance(rows, pd.DataFrame):
+            df = rows
+        elif isinstance(rows, np.ndarray):
+            df = pd.DataFrame(rows, columns=self.feature_cols)
+        elif isinstance(rows, dict):
+            df = pd.DataFrame(rows)
+        elif len(rows) and not isinstance(rows[0], dict):
+            df = pd.DataFrame(list(rows), columns=self.feature_cols)
+        else:
+            df = pd.DataFrame.from_records(rows)
+
+        if '월' in self.feature_cols and '월' not in df.columns and '일자' in df.columns:
+            df = df.assign(월=pd.to_datetime(df['일자']).dt.month)
+
+        missing = [col for col in self.feature_cols if col not in df.columns]
+        if missing:
+            raise ValueError(f"필수 컬럼이 없습니다: {missing}")
+
+        df = df[self.feature_cols]
+        # 숫자가 문자열로 들어온 컬럼(JSON / CSV, pandas 3의 str dtype 포함)만 변환
+        to_convert = [col for col in self.feature_cols
+                      if col != '총량지점명' and not pd.api.types.is_numeric_dtype(df[col])]
+        if to_convert:
+            df = df.assign(**{col: pd.to_numeric(df[col], errors='coerce') for col in to_convert})
+        return df
+
+    def score(self, rows) -> pd.DataFrame:
+        """
+        Score a batch of measurement rows.
+
+        Returns:
+            pd.DataFrame: Columns '위험도' (risk class) and '고위험_확률'
+                          (probability of 고위험), aligned with the input rows.
+        """
+        X = self._to_frame(rows)
+        if X.empty:
+            return pd.DataFrame({'위험도': [], '고위험_확률': []})
+
+        proba = self.pipeline.predict_proba(X)
+        labels = self.classes[proba.argmax(axis=1)]
+        p_high = proba[:, self.high_idx]
+        if self.high_threshold is not None:
+            labels = np.where(p_high >= self.high_threshold, self.HIGH_LABEL, labels)
+
+        return pd.DataFrame({'위험도': labels, '고위험_확률': p_high}, index=X.index)
+
+
+def serve(scorer: RiskScorer, host: str = '127.0.0.1', port: int = 8000) -> None:
+    """
+    Serve POST /score on a local HTTP server.
+
+    Request body: a JSON list of records (or {"records": [...]}).
+    Response body: a JSON list of {"위험도": ..., "고위험_확률": ...}.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, status: int, payload) -> None:
+            body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self) -> None:
+            if self.path != '/score':
+                self._reply(404, {'error': 'not found'})
+                return
+            # 입력 오류(JSON 형식 / 컬럼 / 값)는 400, 모델 예측 중 오류는 500
+            try:
+                length = int(self.headers.get('Content-Length', 0))
+                rows = scorer._to_frame(self.rfile.read(length))
+            except (ValueError, KeyError, TypeError, IndexError) as e:
+                self._reply(400, {'error': f'{type(e).__name__}: {e}'})
+                return
+            try:
+                result = scorer.score(rows)
+                self._reply(200, result.to_dict(orient='records'))
+            except Exception as e:
+                self._reply(500, {'error': f'{type(e).__name__}: {e}'})
+
+        def log_message(self, format, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    print(f"위험도 예측 서버 시작: http://{host}:{port}/score")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='클로로필-a 위험도 배치 예측')
+    parser.add_argument('model', help='RiskScorer.save()로 저장한 모델 파일')
+    parser.add_argument('--input', help='입력 파일 (.csv / .json). 생략하면 stdin의 JSON')
+    parser.add_argument('--serve', action='store_true', help='로컬 HTTP 서버로 실행')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    args = parser.parse_args(argv)
+
+    scorer = RiskScorer.load(args.model)
+    if args.serve:
+        serve(scorer, args.host, args.port)
+        return
+
+    if args.input is None:
+        rows = sys.stdin.read()
+    elif args.input.endswith('.csv'):
+        rows = pd.read_csv(args.input)
+    else:
+        with open(args.input, encoding='utf-8') as f:
+            rows = f.read()
+
+    scorer.score(rows).to_csv(sys.stdout, index=False)
+
+
+if __name__ == '__main__':
+    main()
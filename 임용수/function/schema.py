@@ -0,0 +1,81 @@
+"""Schema-driven conversion of raw API items into compact typed DataFrames."""
+from typing import Iterable, Mapping, Optional
+
+import pandas as pd
+
+
+# 원본 API 키 -> (컬럼명, dtype)
+WATER_SCHEMA = {
+    'PT_NM': ('총량지점명', 'category'),
+    'WMCYMD': ('일자', 'datetime'),
+    'ITEM_TEMP': ('수온', 'float32'),  # 단위: ℃
+    'ITEM_PH': ('수소이온농도(ph)', 'float32'),
+    'ITEM_EC': ('전기전도도(EC)', 'float32'),  # 단위: μS/㎝
+    'ITEM_DOC': ('용존산소(DO)', 'float32'),  # 단위: ㎎/L
+    'ITEM_BOD': ('BOD', 'float32'),  # 단위: ㎎/L
+    'ITEM_COD': ('COD', 'float32'),  # 단위: ㎎/L
+    'ITEM_SS': ('부유물질', 'float32'),  # 단위: ㎎/L
+    'ITEM_TN': ('총질소(T-N)', 'float32'),  # 단위: ㎎/L
+    'ITEM_TP': ('총인(T-P)', 'float32'),  # 단위: ㎎/L
+    'ITEM_TOC': ('총유기탄소(TOC)', 'float32'),  # 단위: ㎎/L
+    'ITEM_AMNT': ('유량', 'float32'),  # 단위: ㎥/s
+    'ITEM_CLOA': ('클로로필-a', 'float32'),
+}
+
+WATER_DATE_FORMAT = '%Y.%m.%d'
+
+
+def _convert(values, dtype: str, date_format: Optional[str]):
+    """Convert one raw column (sequence of strings / numbers / None) to dtype."""
+    if dtype == 'category':
+        return pd.Categorical(values)
+    if dtype == 'datetime':
+        raw = pd.Series(values, dtype=object)
+        dates = pd.to_datetime(raw, format=date_format, errors='coerce') if date_format else \
+            pd.to_datetime(raw, errors='coerce')
+        if date_format and dates.isna().sum() > raw.isna().sum():
+            # 형식이 다른 값이 섞여 있으면 추론 파싱으로 재시도
+            dates = pd.to_datetime(raw, errors='coerce', format='mixed')
+        return dates.to_numpy()
+    return pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').to_numpy(dtype=dtype)
+
+
+def columns_to_frame(columns: Mapping[str, Iterable], schema: Mapping = WATER_SCHEMA,
+                     date_format: Optional[str] = WATER_DATE_FORMAT) -> pd.DataFrame:
+    """
+    Build a typed DataFrame from raw columns keyed by API name.
+
+    Every column is converted straight to its schema dtype and the frame is
+    assembled once, so no intermediate all-string DataFrame or extra copies
+    are created.
+
+    Raises:
+        KeyError: If a schema column is missing from ``columns``.
+    """
+    data = {}
+    for key, (name, dtype) in schema.items():
+        if key not in columns:
+            raise KeyError(f"필수 컬럼이 없습니다: {key}")
+        data[name] = _convert(columns[key], dtype, date_format)
+    return pd.DataFrame(data, copy=False)
+
+
+def items_to_frame(items: list, schema: Mapping = WATER_SCHEMA,
+                   date_format: Optional[str] = WATER_DATE_FORMAT) -> pd.DataFrame:
+    """
+    Build a typed DataFrame directly from parsed JSON items (list of dicts).
+
+    Returns:
+        pd.DataFrame: Station names as category, dates as datetime64 and
+                      measures as float32.
+    """
+    columns = {key: [item.get(key) for item in items] for key in schema}
+    return columns_to_frame(columns, schema, date_format)
+
+
+def frame_to_typed(df: pd.DataFrame, schema: Mapping = WATER_SCHEMA,
+                   date_format: Optional[str] = WATER_DATE_FORMAT) -> pd.DataFrame:
+    """Same as items_to_frame for a raw (string column) DataFrame, e.g. cached slices."""
+    return columns_to_frame({key: df[key].to_numpy() for key in schema if key in df.columns},
+                            schema, date_format)
+
@@ -0,0 +1,162 @@
+"""Persistent, append-only local store for water quality and dam data."""
+import importlib.util
+import json
+import time
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+
+class WaterStore:
+    """
+    Append-only store of processed water quality and dam rows.
+
+    New rows are written as additional Parquet part files and a small JSON
+    manifest keeps the latest '일자' per station, so an incremental sync never
+    has to read back the rows it already holds:
+
+        <store_dir>/manifest.json
+        <store_dir>/water/part-<timestamp>.parquet
+        <store_dir>/dam/part-<timestamp>.parquet
+    """
+
+    DEFAULT_STORE_DIR = 'data/store'
+    MANIFEST_NAME = 'manifest.json'
+
+    def __init__(self, store_dir: str = DEFAULT_STORE_DIR) -> None:
+        """
+        Args:
+            store_dir: Root directory of the store.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        if importlib.util.find_spec('pyarrow') is None:
+            raise ImportError("저장소를 사용하려면 pyarrow가 필요합니다: pip install pyarrow")
+
+        self.root = Path(store_dir)
+        self.manifest = self._read_manifest()
+
+    # ------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------
+    def _manifest_path(self) -> Path:
+        return self.root / self.MANIFEST_NAME
+
+    def _read_manifest(self) -> dict:
+        path = self._manifest_path()
+        if not path.exists():
+            return {'water': {}, 'dam': {}}
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_manifest(self) -> None:
+        path = self._manifest_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+        tmp_path.replace(path)
+
+    def latest_date(self, pt_no: str) -> Optional[pd.Timestamp]:
+        """Latest '일자' held for a station code, or None if the station is new."""
+        entry = self.manifest['water'].get(pt_no)
+        return pd.Timestamp(entry['last_date']) if entry else None
+
+    def latest_dates(self) -> dict:
+        """Latest '일자' held for every station, keyed by 총량지점명."""
+        return {
+            entry['name']: pd.Timestamp(entry['last_date'])
+            for entry in self.manifest['water'].values()
+        }
+
+    def latest_dam_date(self) -> Optional[pd.Timestamp]:
+        last_date = self.manifest['dam'].get('last_date')
+        return pd.Timestamp(last_date) if last_date else None
+
+    # ------------------------------------------------------------------
+    # Append / load
+    # ------------------------------------------------------------------
+    def _write_part(self, kind: str, df: pd.DataFrame) -> None:
+        part_dir = self.root / kind
+        part_dir.mkdir(parents=True, exist_ok=True)
+        path = part_dir / f'part-{time.time_ns()}.parquet'
+        tmp_path = path.with_suffix('.tmp')
+        df.reset_index(drop=True).to_parquet(tmp_path, index=False)
+        tmp_path.replace(path)
+
+    def append_water(self, df: pd.DataFrame, station_codes: dict) -> int:
+        """
+        Append processed water quality rows newer than what the store holds.
+
+        Rows are deduplicated on (총량지점명, 일자) and anything at or before the
+        station's latest stored date is dropped, so overlapping fetches are safe.
+
+        Args:
+            df: Processed rows (RENAME_MAP schema).
+            station_codes: Mapping of 총량지점명 -> station code (PT_NO).
+
+        Returns:
+            int: Number of rows appended.
+        """
+        if df.empty:
+            return 0
+
+        df = df.dropna(subset=['일자']).drop_duplicates(subset=['총량지점명', '일자'], keep='last')
+
+        last_dates = df['총량지점명'].map(
+            {name: self.latest_date(pt_no) for name, pt_no in station_codes.items()}
+        )
+        df = df[last_dates.isna() | (df['일자'] > last_dates)].sort_values(['총량지점명', '일자'])
+        if df.empty:
+            return 0
+
+        self._write_part('water', df)
+        for name, last_date in df.groupby('총량지점명')['일자'].max().items():
+            pt_no = station_codes.get(name, name)
+            self.manifest['water'][pt_no] = {'name': name, 'last_date': last_date.isoformat()}
+        self._write_manifest()
+        return len(df)
+
+    def append_dam(self, df: pd.DataFrame) -> int:
+        """Append processed dam rows newer than the latest stored dam date."""
+        if df.empty:
+            return 0
+
+        df = df.dropna(subset=['일자']).drop_duplicates(subset=['일자'], keep='last')
+        last_date = self.latest_dam_date()
+        if last_date is not None:
+            df = df[df['일자'] > last_date]
+        if df.empty:
+            return 0
+
+        self._write_part('dam', df.sort_values('일자'))
+        self.manifest['dam'] = {'last_date': df['일자'].max().isoformat()}
+        self._write_manifest()
+        return len(df)
+
+    def _load(self, kind: str) -> pd.DataFrame:
+        paths = sorted((self.root / kind).glob('part-*.parquet'))
+        if not paths:
+            return pd.DataFrame()
+        return pd.concat([pd.read_parquet(path) for path in paths], ignore_index=True)
+
+    def load(self) -> pd.DataFrame:
+        """Return every stored water quality row."""
+        return self._load('water')
+
+    def load_dam(self) -> pd.DataFrame:
+        """Return every stored dam row."""
+        return self._load('dam')
+
+    def compact(self) -> None:
+        """Merge all part files into a single file per kind."""
+        for kind in ('water', 'dam'):
+            paths = sorted((self.root / kind).glob('part-*.parquet'))
+            if len(paths) < 2:
+                continue
+            df = pd.concat([pd.read_parquet(path) for path in paths], ignore_index=True)
+            self._write_part(kind, df)
+            for path in paths:
+                path.unlink()
@@ -0,0 +1,146 @@
+"""Typed, memory-mapped loader for the total water quantity measurement CSV."""
+import hashlib
+import importlib.util
+import json
+import os
+from pathlib import Path
+from typing import Optional, Sequence
+
+import pandas as pd
+
+
+class TotalWaterLoader:
+    """
+    Load total_water_quantity_measurement.csv through a typed binary cache.
+
+    The EUC-KR CSV is parsed once into an uncompressed Arrow/Feather file with
+    categorical station names, float32 measures and datetime64 dates parsed
+    with an explicit format. Later loads memory-map that file and read only the
+    requested columns / date range. The cache is rebuilt when the CSV changes
+    (by mtime+size, or by content hash with ``validate='hash'``).
+
+    Without pyarrow the CSV is parsed directly (same dtypes, no cache).
+    """
+
+    DEFAULT_CSV_PATH = 'data/total_water_quantity_measurement.csv'
+    CSV_ENCODING = 'euc-kr'
+    DATE_FORMAT = '%Y.%m.%d'
+    STATION_COLUMN = '총량지점명'
+    DATE_COLUMN = '일자'
+    VALIDATE_MODES = ('mtime', 'hash')
+
+    def __init__(self, csv_path: str = DEFAULT_CSV_PATH, cache_path: Optional[str] = None,
+                 validate: str = 'mtime') -> None:
+        """
+        Args:
+            csv_path: Path of the source CSV.
+            cache_path: Path of the Feather cache. Defaults to
+                       <csv dir>/cache/<csv stem>.feather.
+            validate: 'mtime' (mtime and size) or 'hash' (SHA-256 of the CSV)
+                     to decide whether the cache is stale.
+        """
+        if validate not in self.VALIDATE_MODES:
+            raise ValueError(f"validate는 {self.VALIDATE_MODES} 중 하나여야 합니다: {validate}")
+
+        self.csv_path = Path(csv_path)
+        if cache_path is None:
+            cache_path = self.csv_path.parent / 'cache' / f'{self.csv_path.stem}.feather'
+        self.cache_path = Path(cache_path)
+        self.meta_path = self.cache_path.with_suffix('.meta.json')
+        self.validate = validate
+        self.has_pyarrow = importlib.util.find_spec('pyarrow') is not None
+
+    def _source_signature(self) -> dict:
+        stat = os.stat(self.csv_path)
+        signature = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+        if self.validate == 'hash':
+            digest = hashlib.sha256()
+            with open(self.csv_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+            signature = {'sha256': digest.hexdigest()}
+        return signature
+
+    def _read_csv(self) -> pd.DataFrame:
+        """Parse the CSV into the typed schema."""
+        df = pd.read_csv(self.csv_path, encoding=self.CSV_ENCODING,
+                         dtype={self.STATION_COLUMN: 'category', self.DATE_COLUMN: str})
+        df[self.DATE_COLUMN] = pd.to_datetime(df[self.DATE_COLUMN], format=self.DATE_FORMAT,
+                                              errors='coerce')
+
+        measure_cols = [col for col in df.columns if col not in (self.STATION_COLUMN, self.DATE_COLUMN)]
+        for col in measure_cols:
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype('float32')
+        return df
+
+    def is_valid(self) -> bool:
+        """Return True if the cache exists and matches the current CSV."""
+        if not (self.cache_path.exists() and self.meta_path.exists()):
+            return False
+        with open(self.meta_path, encoding='utf-8') as f:
+            meta = json.load(f)
+        return meta.get('source') == self._source_signature()
+
+    def build(self) -> None:
+        """Parse the CSV and (re)write the Feather cache."""
+        import pyarrow as pa
+        import pyarrow.feather as feather
+
+        df = self._read_csv()
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix('.tmp')
+        # 메모리 매핑이 가능하도록 압축하지 않음
+        feather.write_feather(pa.Table.from_pandas(df, preserve_index=False), tmp_path,
+                              compression='uncompressed')
+        tmp_path.replace(self.cache_path)
+
+        with open(self.meta_path, 'w', encoding='utf-8') as f:
+            json.dump({'source': self._source_signature()}, f)
+
+    def load(self, usecols: Optional[Sequence[str]] = None, start=None, end=None) -> pd.DataFrame:
+        """
+        Load the data, optionally restricted to columns and a date range.
+
+        Args:
+            usecols: Columns to return. Defaults to every column.
+            start: Inclusive lower bound on '일자' (anything pd.Timestamp accepts).
+            end: Inclusive upper bound on '일자'.
+
+        Returns:
+            pd.DataFrame: Typed DataFrame (category / float32 / datetime64).
+        """
+        columns = list(usecols) if usecols is not None else None
+        read_columns = columns
+        if columns is not None and (start is not None or end is not None) and self.DATE_COLUMN not in columns:
+            read_columns = columns + [self.DATE_COLUMN]
+
+        if not self.has_pyarrow:
+            df = self._filter_dates(self._read_csv(), start, end)
+            return df[columns] if columns is not None else df
+
+        import pyarrow.compute as pc
+        import pyarrow.feather as feather
+
+        if not self.is_valid():
+            self.build()
+
+        table = feather.read_table(self.cache_path, columns=read_columns, memory_map=True)
+        if start is not None or end is not None:
+            dates = table[self.DATE_COLUMN]
+            mask = None
+            if start is not None:
+                mask = pc.greater_equal(dates, pd.Timestamp(start).to_pydatetime())
+            if end is not None:
+                upper = pc.less_equal(dates, pd.Timestamp(end).to_pydatetime())
+                mask = upper if mask is None else pc.and_(mask, upper)
+            table = table.filter(mask)
+        if columns is not None:
+            table = table.select(columns)
+        return table.to_pandas()
+
+    def _filter_dates(self, df: pd.DataFrame, start, end) -> pd.DataFrame:
+        if start is not None:
+            df = df[df[self.DATE_COLUMN] >= pd.Timestamp(start)]
+        if end is not None:
+            df = df[df[self.DATE_COLUMN] <= pd.Timestamp(end)]
+        return df
@@ -1,8 +1,21 @@
 """Water data fetching and processing module."""
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+from typing import Optional, Sequence, Union
+
 import pandas as pd
 import requests
-from typing import Optional
-from secret.key import Key
+from requests.adapters import HTTPAdapter
+
+from function import instrument
+from function.cache import WaterCache
+from function.instrument import instrumented
+from function.query import WaterQuery
+from function.schema import frame_to_typed, items_to_frame
+from function.store import WaterStore
+from function.total_water_loader import TotalWaterLoader
 
 
 class Water:
@@ -17,9 +30,20 @@ class Water:
     DEFAULT_NUM_OF_ROWS = '3000'
     DEFAULT_RESULT_TYPE = 'json'
     DEFAULT_PT_NO_LIST = '2022A30,2022A10'
+    
+    # 총량지점명 -> 지점 코드 (PT_NO)
+    STATIONS = {'물금': '2022A30', '금곡': '2022A10'}
     DEFAULT_WMYR_LIST = '2021,2022,2023,2024,2025'
     DEFAULT_WMOD_LIST = '01,02,03,04,05,06,07,08,09,10,11,12'
     
+    # Concurrency / retry configuration for paginated fetches
+    DEFAULT_MAX_WORKERS = 8
+    DEFAULT_MAX_RETRIES = 3
+    DEFAULT_BACKOFF = 0.5  # 초 단위, 재시도마다 2배씩 증가
+    DEFAULT_TIMEOUT = 30
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+    SPLIT_KEYS = ('station', 'year', 'month')
+    
     # Column mapping for water quality data
     RENAME_MAP = {
         'PT_NM': '총량지점명',
@@ -38,7 +62,8 @@ class Water:
         'ITEM_CLOA': '클로로필-a'
     }
     
-    # Numeric columns (all except '총량지점명' and '일자')
+    # Numeric columns (all except '총량지점명' and '일자'), stored as float32
+    # (see function.schema.WATER_SCHEMA)
     NUMERIC_COLUMNS = [
         '수온', '수소이온농도(ph)', '전기전도도(EC)', '용존산소(DO)', 
         'BOD', 'COD', '부유물질', '총질소(T-N)', '총인(T-P)', 
@@ -52,75 +77,346 @@ class Water:
         '강수량(밀리미터)': '하굿둑강수량'
     }
     
-    def __init__(self) -> None:
-        """Initialize Water class with API keys."""
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS,
+                 max_retries: int = DEFAULT_MAX_RETRIES,
+                 backoff: float = DEFAULT_BACKOFF,
+                 cache_dir: Optional[str] = None,
+                 transport=None,
+                 api_key: Optional[str] = None,
+                 dam_api_key: Optional[str] = None,
+                 water_url: Optional[str] = None,
+                 dam_url: Optional[str] = None) -> None:
+        """
+        Initialize Water class with API keys and a pooled HTTP session.
+        
+        Args:
+            max_workers: Maximum number of concurrent page requests.
+            max_retries: Number of retries for transient HTTP failures.
+            backoff: Base delay in seconds for exponential backoff between retries.
+            cache_dir: If given, API pulls are cached on disk under this directory
+                      (see WaterCache) and only missing/stale slices are fetched.
+            transport: Object with the requests.Session ``get`` interface used for
+                      every request, e.g. function.mock_api.ReplayTransport for
+                      offline runs. Defaults to a pooled requests.Session.
+            api_key: Water quality API key. Defaults to secret.key.Key, imported
+                    on first use so cache-only runs need no key.
+            dam_api_key: Dam API key. Defaults to secret.key.Key (also lazy).
+            water_url: Override for WATER_API_URL (e.g. a local MockAPIServer).
+            dam_url: Override for DAM_API_URL.
+        """
+        self._key = api_key
+        self._dam_key = dam_api_key
+        self.water_url = water_url or self.WATER_API_URL
+        self.dam_url = dam_url or self.DAM_API_URL
+        
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        
+        if transport is None:
+            transport = requests.Session()
+            adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+            transport.mount('https://', adapter)
+            transport.mount('http://', adapter)
+        self._session = transport
+        
+        self.cache = WaterCache(cache_dir) if cache_dir is not None else None
+    
+    def _load_keys(self) -> None:
+        """Fill missing API keys from secret.key (only when a request is built)."""
+        from secret.key import Key
+        
         key = Key()
-        self.key = key.water_api_key
-        self.dam_key = key.dam_api_key
+        if self._key is None:
+            self._key = key.water_api_key
+        if self._dam_key is None:
+            self._dam_key = key.dam_api_key
+    
+    @property
+    def key(self) -> str:
+        if self._key is None:
+            self._load_keys()
+        return self._key
     
-    def total_water(self) -> pd.DataFrame:
+    @property
+    def dam_key(self) -> str:
+        if self._dam_key is None:
+            self._load_keys()
+        return self._dam_key
+    
+    @instrumented()
+    def total_water(self, usecols: Optional[Sequence[str]] = None, start=None, end=None) -> pd.DataFrame:
         """
         Load total water quantity measurement data from CSV file.
         
+        The CSV is converted once into a typed Feather cache (see TotalWaterLoader)
+        that is memory-mapped on later calls and rebuilt when the CSV changes.
+        
+        Args:
+            usecols: Columns to load. Defaults to every column.
+            start: Inclusive lower bound on '일자'.
+            end: Inclusive upper bound on '일자'.
+        
         Returns:
             pd.DataFrame: DataFrame with water quantity data, with '일자' column 
-                         converted to datetime format.
+                         converted to datetime format, '총량지점명' as category and
+                         measures as float32.
+        """
+        return TotalWaterLoader().load(usecols=usecols, start=start, end=end)
+    
+    def _get_json(self, url: str, params: dict) -> dict:
+        """
+        GET a URL on the pooled session and decode the JSON body.
+        
+        Connection errors, timeouts and RETRY_STATUS_CODES responses are retried
+        up to ``max_retries`` times with exponential backoff. When instrumentation
+        is enabled every attempt emits an 'http' event (duration, status, bytes).
+        
+        Raises:
+            requests.exceptions.RequestException: If every attempt fails.
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                start = time.perf_counter()
+                response = self._session.get(url, params=params, verify=True, timeout=self.DEFAULT_TIMEOUT)
+                if instrument.enabled():
+                    instrument.record('http', url=url, page=params.get('pageNo', params.get('page')),
+                                      status=response.status_code, attempt=attempt,
+                                      duration=time.perf_counter() - start, bytes=len(response.content))
+                if response.status_code not in self.RETRY_STATUS_CODES:
+                    response.raise_for_status()
+                    return response.json()
+                error = requests.exceptions.HTTPError(
+                    f"{response.status_code} 응답 (재시도 {attempt}/{self.max_retries})", response=response
+                )
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                error = e
+            
+            if attempt == self.max_retries:
+                raise error
+            time.sleep(self.backoff * (2 ** attempt))
+    
+    def _build_water_slices(self, year: str, pt_no_list: str,
+                            split_by: Optional[Union[str, Sequence[str]]],
+                            month_list: Optional[str] = None) -> list:
+        """
+        Build the request parameters for every slice of a water quality query.
+        
+        Args:
+            year: Comma-separated year list (wmyrList).
+            pt_no_list: Comma-separated station code list (ptNoList).
+            split_by: None, or any of 'station', 'year', 'month' (or a sequence of
+                     them). Each split dimension becomes its own set of requests.
+            month_list: Comma-separated month list (wmodList). Defaults to DEFAULT_WMOD_LIST.
+        
+        Returns:
+            list: One params dict per slice (without pageNo).
         """
-        df = pd.read_csv('data/total_water_quantity_measurement.csv', encoding='euc-kr')
-        df['일자'] = pd.to_datetime(df['일자'], errors='coerce')
+        if month_list is None:
+            month_list = self.DEFAULT_WMOD_LIST
+        if split_by is None:
+            split_by = ()
+        elif isinstance(split_by, str):
+            split_by = (split_by,)
+        
+        unknown = [key for key in split_by if key not in self.SPLIT_KEYS]
+        if unknown:
+            raise ValueError(f"지원하지 않는 split_by 값입니다: {unknown}")
+        
+        dimensions = {
+            'ptNoList': (pt_no_list, 'station'),
+            'wmyrList': (year, 'year'),
+            'wmodList': (month_list, 'month'),
+        }
+        choices = []
+        for param, (value, split_key) in dimensions.items():
+            if split_key in split_by:
+                choices.append([(param, v.strip()) for v in value.split(',') if v.strip()])
+            else:
+                choices.append([(param, value)])
+        
+        base = {
+            'serviceKey': self.key,
+            'numOfRows': self.DEFAULT_NUM_OF_ROWS,
+            'resultType': self.DEFAULT_RESULT_TYPE,
+        }
+        return [{**base, **dict(combo)} for combo in product(*choices)]
+    
+    def _fetch_water_page(self, params: dict) -> tuple:
+        """
+        Fetch a single page of water quality data.
+        
+        Returns:
+            tuple: (items, total_count) where total_count is the number of rows
+                   the API reports for the whole query.
+        """
+        data = self._get_json(self.water_url, params)
+        body = data.get('getWaterMeasuringList', {})
+        items = body.get('item', []) or []
+        if isinstance(items, dict):
+            # 결과가 1건이면 리스트가 아닌 단일 객체로 오는 경우가 있음
+            items = [items]
+        total_count = int(body.get('totalCount') or len(items))
+        return items, total_count
+    
+    @instrumented()
+    def _fetch_water_items(self, slices: list) -> list:
+        """
+        Fetch every page of every slice concurrently.
+        
+        The first page of each slice is requested in parallel to learn its
+        totalCount and the page size the server actually returns, then all
+        remaining pages are fanned out over the same pool.
+        Items are returned in slice order, then page order.
+        """
+        num_of_rows = int(self.DEFAULT_NUM_OF_ROWS)
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            first_pages = list(pool.map(
+                lambda params: self._fetch_water_page({**params, 'pageNo': '1'}), slices
+            ))
+            
+            rest = []
+            for params, (page_items, total_count) in zip(slices, first_pages):
+                # 서버가 numOfRows보다 적게 주는 경우 실제 첫 페이지 크기로 페이지 수 계산
+                page_rows = min(len(page_items), num_of_rows) or num_of_rows
+                rest.append([
+                    pool.submit(self._fetch_water_page, {**params, 'pageNo': str(page_no)})
+                    for page_no in range(2, math.ceil(total_count / page_rows) + 1)
+                ])
+            
+            # 구간별로 [1페이지, 2..n페이지] 순서로 모음
+            items = []
+            for (page_items, _), futures in zip(first_pages, rest):
+                items.extend(page_items)
+                for future in futures:
+                    items.extend(future.result()[0])
+        
+        return items
+    
+    @instrumented()
+    def _process_water_frame(self, data, rename_columns: bool) -> pd.DataFrame:
+        """
+        Rename columns and convert dtypes of raw water quality data.
+        
+        Args:
+            data: Parsed JSON items (list of dicts) or a raw DataFrame (cached slices).
+            rename_columns: If False, return the raw data as a DataFrame.
+        
+        Returns:
+            pd.DataFrame: With rename_columns, columns are built straight from
+                         WATER_SCHEMA: '총량지점명' as category, '일자' as
+                         datetime64 and NUMERIC_COLUMNS as float32.
+        """
+        if not rename_columns:
+            return data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+        
+        if isinstance(data, pd.DataFrame):
+            df = frame_to_typed(data)
+        else:
+            df = items_to_frame(data)
+        
+        print("--- 분석 준비 완료: 핵심 수질 지표 ---")
+        print(df.head())
         return df
     
-    def _fetch_water_api_data(self, rename_columns: bool = True,year='2021,2022,2023,2024,2025') -> pd.DataFrame:
+    @staticmethod
+    def _split_list(value: str) -> list:
+        return [v.strip() for v in str(value).split(',') if v.strip()]
+    
+    @staticmethod
+    def _item_year_month(item: dict) -> tuple:
+        """(year, month) of a raw item, from WMYR/WMOD or the WMCYMD date."""
+        date = str(item.get('WMCYMD', ''))
+        year = item.get('WMYR') or date[:4]
+        month = item.get('WMOD') or date[5:7]
+        return int(year), int(month)
+    
+    @instrumented()
+    def _update_water_cache(self, year: str, pt_no_list: str,
+                            split_by: Optional[Union[str, Sequence[str]]],
+                            month_list: Optional[str] = None) -> None:
+        """Fetch the missing/stale (station, year, month) slices and store them in the cache."""
+        years = [int(y) for y in self._split_list(year)]
+        months = [int(m) for m in self._split_list(month_list or self.DEFAULT_WMOD_LIST)]
+        missing = self.cache.missing_slices(self._split_list(pt_no_list), years, months)
+        if not missing:
+            return
+        
+        # (station, year) 단위로 묶어 누락된 월만 요청
+        grouped = {}
+        for pt_no, y, m in missing:
+            grouped.setdefault((pt_no, y), []).append(m)
+        
+        slices = []
+        for (pt_no, y), month_values in grouped.items():
+            slices.extend(self._build_water_slices(
+                str(y), pt_no, split_by,
+                month_list=','.join(f'{m:02d}' for m in month_values),
+            ))
+        items = self._fetch_water_items(slices)
+        
+        buckets = {key: [] for key in missing}
+        for item in items:
+            key = (item.get('PT_NO'), *self._item_year_month(item))
+            if key in buckets:
+                buckets[key].append(item)
+        
+        for (pt_no, y, m), bucket in buckets.items():
+            self.cache.write_water_slice(pt_no, y, m, pd.DataFrame(bucket))
+        print(f"캐시 갱신: {len(missing)}개 구간, {len(items)}건")
+    
+    @instrumented()
+    def _fetch_water_api_data(self, rename_columns: bool = True, year='2021,2022,2023,2024,2025',
+                              pt_no_list: Optional[str] = None,
+                              split_by: Optional[Union[str, Sequence[str]]] = None,
+                              use_cache: bool = True) -> pd.DataFrame:
         """
         Internal method to fetch water quality data from API.
         
+        Every page reported by totalCount is fetched, so results are no longer
+        truncated at numOfRows. Pages (and slices, when split_by is given) are
+        requested concurrently over a pooled session with retry/backoff.
+        
+        When a cache is configured, only the missing or stale (station, year,
+        month) slices are requested; if the network is unavailable the cached
+        slices are returned as-is.
+        
         Args:
             rename_columns: If True, rename columns using RENAME_MAP and process data.
                           If False, return raw data without renaming.
+            year: Comma-separated year list (wmyrList).
+            pt_no_list: Comma-separated station code list. Defaults to DEFAULT_PT_NO_LIST.
+            split_by: Optional split of the query into parallel slices by
+                     'station', 'year' and/or 'month'.
+            use_cache: If False, bypass the cache even when one is configured.
         
         Returns:
             pd.DataFrame: DataFrame containing water quality data.
         """
-        params = {
-            'serviceKey': self.key,
-            'pageNo': self.DEFAULT_PAGE_NO,
-            'numOfRows': self.DEFAULT_NUM_OF_ROWS,
-            'resultType': self.DEFAULT_RESULT_TYPE,
-            'ptNoList': self.DEFAULT_PT_NO_LIST,
-            'wmyrList': year,
-            'wmodList': self.DEFAULT_WMOD_LIST
-        }
+        if pt_no_list is None:
+            pt_no_list = self.DEFAULT_PT_NO_LIST
         
         try:
-            response = requests.get(self.WATER_API_URL, params=params, verify=True, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            items = data.get('getWaterMeasuringList', {}).get('item', [])
+            if self.cache is not None and use_cache:
+                try:
+                    self._update_water_cache(year, pt_no_list, split_by)
+                except requests.exceptions.RequestException as e:
+                    print(f"API 요청 실패, 캐시된 데이터를 사용합니다: {e}")
+                data = self.cache.read_water(
+                    self._split_list(pt_no_list),
+                    [int(y) for y in self._split_list(year)],
+                    [int(m) for m in self._split_list(self.DEFAULT_WMOD_LIST)],
+                )
+            else:
+                slices = self._build_water_slices(year, pt_no_list, split_by)
+                data = self._fetch_water_items(slices)
             
-            if not items:
+            if len(data) == 0:
                 print("응답은 성공했으나 데이터가 없습니다.")
                 return pd.DataFrame()
             
-            df = pd.DataFrame(items)
-            
-            if rename_columns:
-                # Extract and rename columns
-                df = df[list(self.RENAME_MAP.keys())].copy()
-                df.rename(columns=self.RENAME_MAP, inplace=True)
-                
-                # Convert numeric columns
-                df[self.NUMERIC_COLUMNS] = df[self.NUMERIC_COLUMNS].apply(
-                    pd.to_numeric, errors='coerce'
-                )
-                
-                # Convert date column
-                df['일자'] = pd.to_datetime(df['일자'], errors='coerce')
-                
-                print("--- 분석 준비 완료: 핵심 수질 지표 ---")
-                print(df.head())
-            
-            return df
+            return self._process_water_frame(data, rename_columns)
             
         except requests.exceptions.RequestException as e:
             print(f"API 요청 실패: {e}")
@@ -131,14 +427,44 @@ class Water:
         
         return pd.DataFrame()
     
-    def api_data(self,year='2021,2022,2023,2024,2025') -> pd.DataFrame:
+    @instrumented()
+    def api_data(self, year='2021,2022,2023,2024,2025', pt_no_list: Optional[str] = None,
+                 split_by: Optional[Union[str, Sequence[str]]] = None,
+                 refresh: bool = False) -> pd.DataFrame:
         """
         Fetch water quality data from API with column renaming and data processing.
         
+        Args:
+            year: Comma-separated year list, e.g. '2017,2018,2019,2020,2021,2022,2023,2024,2025'.
+                  All pages are fetched, so a multi-year range no longer needs
+                  separate calls and pd.concat.
+            pt_no_list: Comma-separated station code list. Defaults to DEFAULT_PT_NO_LIST.
+            split_by: Optional parallel split by 'station', 'year' and/or 'month',
+                     e.g. ('station', 'year').
+            refresh: If True, drop the cached slices for this query first and
+                    download them again.
+        
         Returns:
             pd.DataFrame: Processed DataFrame with renamed columns and converted data types.
         """
-        return self._fetch_water_api_data(rename_columns=True,year=year)
+        if refresh:
+            self.invalidate_cache(year=year, pt_no_list=pt_no_list)
+        return self._fetch_water_api_data(rename_columns=True, year=year,
+                                          pt_no_list=pt_no_list, split_by=split_by)
+    
+    @instrumented()
+    def scan(self) -> WaterQuery:
+        """
+        Start a lazy query, e.g.
+        ``water.scan().where(station='물금', years=range(2019, 2025)).select(['일자', '클로로필-a']).collect()``.
+        
+        Station, year / month / date-range and column filters are pushed down to
+        the cache slices or API parameters, so only the needed slices are read.
+        
+        Returns:
+            WaterQuery: Query over every default station and year until restricted.
+        """
+        return WaterQuery(self)
     
     def api_data_dept(self) -> pd.DataFrame:
         """
@@ -149,16 +475,123 @@ class Water:
         """
         return self._fetch_water_api_data(rename_columns=False)
     
-    def dam(self) -> pd.DataFrame:
+    def _months_since(self, start: pd.Timestamp) -> dict:
+        """Map year -> comma-separated month list, from start's month to the current month."""
+        now = pd.Timestamp.now()
+        months = pd.period_range(start.to_period('M'), now.to_period('M'), freq='M')
+        by_year = {}
+        for period in months:
+            by_year.setdefault(period.year, []).append(f'{period.month:02d}')
+        return {year: ','.join(values) for year, values in by_year.items()}
+    
+    @instrumented()
+    def sync(self, store_dir: str = WaterStore.DEFAULT_STORE_DIR, pt_no_list: Optional[str] = None,
+             start_year: int = 2017, include_dam: bool = True) -> dict:
+        """
+        Incrementally update a persistent local store with new measurements.
+        
+        For each station only the months from its latest stored '일자' up to the
+        current month are requested. The fetched rows are converted, deduplicated
+        on (총량지점명, 일자), filtered to dates newer than the store and appended,
+        so the work done is proportional to the new rows only.
+        
+        Args:
+            store_dir: Directory of the WaterStore.
+            pt_no_list: Comma-separated station code list. Defaults to DEFAULT_PT_NO_LIST.
+            start_year: First year to fetch for stations not yet in the store.
+            include_dam: If True, also append new dam rows.
+        
+        Returns:
+            dict: Number of rows appended, e.g. {'water': 12, 'dam': 1}.
+        """
+        if pt_no_list is None:
+            pt_no_list = self.DEFAULT_PT_NO_LIST
+        
+        store = WaterStore(store_dir)
+        appended = {'water': 0, 'dam': 0}
+        
+        try:
+            slices = []
+            for pt_no in self._split_list(pt_no_list):
+                start = store.latest_date(pt_no) or pd.Timestamp(year=start_year, month=1, day=1)
+                for year, month_list in self._months_since(start).items():
+                    slices.extend(self._build_water_slices(str(year), pt_no, None, month_list=month_list))
+            
+            items = self._fetch_water_items(slices)
+            if items:
+                station_codes = {item.get('PT_NM'): item.get('PT_NO') for item in items}
+                new_rows = self._process_water_frame(items, rename_columns=True)
+                appended['water'] = store.append_water(new_rows, station_codes)
+        except requests.exceptions.RequestException as e:
+            print(f"API 요청 실패: {e}")
+        
+        if include_dam:
+            appended['dam'] = store.append_dam(self.dam(refresh=True))
+        
+        print(f"동기화 완료: 수질 {appended['water']}건, 하굿둑 {appended['dam']}건 추가")
+        return appended
+    
+    def invalidate_cache(self, year: Optional[str] = None, pt_no_list: Optional[str] = None,
+                         dam: bool = False) -> int:
+        """
+        Remove cached slices so the next call downloads them again.
+        
+        Args:
+            year: Comma-separated year list, or None for every year.
+            pt_no_list: Comma-separated station code list, or None for every station.
+            dam: If True, also drop the cached dam table.
+        
+        Returns:
+            int: Number of cache files removed (0 if no cache is configured).
+        """
+        if self.cache is None:
+            return 0
+        
+        stations = self._split_list(pt_no_list) if pt_no_list is not None else [None]
+        years = [int(y) for y in self._split_list(year)] if year is not None else [None]
+        removed = sum(
+            self.cache.invalidate(pt_no=pt_no, year=y) for pt_no in stations for y in years
+        )
+        if dam:
+            removed += self.cache.invalidate_dam()
+        return removed
+    
+    @instrumented()
+    def _process_dam_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Rename columns and convert dtypes of raw dam items."""
+        df = df.rename(columns=self.DAM_RENAME_MAP)
+        
+        # Convert date column
+        df['일자'] = pd.to_datetime(df['일자'], errors='coerce').dt.normalize()
+        
+        # Convert numeric columns
+        df['하굿둑방류량'] = pd.to_numeric(df['하굿둑방류량'], errors='coerce')
+        df['하굿둑강수량'] = pd.to_numeric(df['하굿둑강수량'], errors='coerce')
+        return df
+    
+    @instrumented()
+    def dam(self, refresh: bool = False) -> pd.DataFrame:
         """
         Fetch dam discharge and rainfall data from API.
         
+        When a cache is configured the dam table is served from disk until it
+        is older than the cache TTL, and the stale copy is used if the API
+        cannot be reached.
+        
+        Args:
+            refresh: If True, ignore the cached table and download it again.
+        
         Returns:
             pd.DataFrame: DataFrame containing dam data with columns:
                          - 일자: Date
                          - 하굿둑방류량: Discharge amount (million tons)
                          - 하굿둑강수량: Rainfall (millimeters)
         """
+        if self.cache is not None and not refresh and self.cache.dam_is_fresh():
+            df = self._process_dam_frame(self.cache.read_dam())
+            print(f"하굿둑 데이터 캐시 사용: {len(df)}건")
+            return df
+        
         params = {
             'page': 1,
             'perPage': 2000,
@@ -167,11 +600,20 @@ class Water:
         }
         
         try:
-            response = requests.get(self.DAM_API_URL, params=params, verify=True, timeout=30)
-            response.raise_for_status()
+            res_json = self._get_json(self.dam_url, params)
+            items = list(res_json.get('data', []))
             
-            res_json = response.json()
-            items = res_json.get('data', [])
+            # matchCount가 한 페이지를 넘으면 나머지 페이지도 요청
+            match_count = int(res_json.get('matchCount') or len(items))
+            page_rows = len(items)
+            if page_rows and match_count > page_rows:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                    pages = pool.map(
+                        lambda page: self._get_json(self.dam_url, {**params, 'page': page}).get('data', []),
+                        range(2, math.ceil(match_count / page_rows) + 1),
+                    )
+                    for page_items in pages:
+                        items.extend(page_items)
             
             if not items:
                 match_count = res_json.get('matchCount', 0)
@@ -179,22 +621,19 @@ class Water:
                 return pd.DataFrame()
             
             df = pd.DataFrame(items)
+            if self.cache is not None:
+                self.cache.write_dam(df)
             
-            # Rename columns
-            df.rename(columns=self.DAM_RENAME_MAP, inplace=True)
-            
-            # Convert date column
-            df['일자'] = pd.to_datetime(df['일자'], errors='coerce').dt.normalize()
-            
-            # Convert numeric columns
-            df['하굿둑방류량'] = pd.to_numeric(df['하굿둑방류량'], errors='coerce')
-            df['하굿둑강수량'] = pd.to_numeric(df['하굿둑강수량'], errors='coerce')
+            df = self._process_dam_frame(df)
             
             print(f"하굿둑 데이터 확보 성공: {len(df)}건")
             return df
             
         except requests.exceptions.RequestException as e:
             print(f"하굿둑 API 요청 실패: {e}")
+            if self.cache is not None and self.cache.has_dam():
+                print("캐시된 하굿둑 데이터를 사용합니다.")
+                return self._process_dam_frame(self.cache.read_dam())
         except (KeyError, ValueError) as e:
             print(f"하굿둑 데이터 처리 오류: {e}")
         except Exception as e: